@@ -0,0 +1,15 @@
+"""Benchmarks for the start up of the ``numpydoc`` command line interface."""
+
+
+class TimeImport:
+    """Time importing the CLI in a fresh interpreter.
+
+    This is the fixed cost paid by every ``numpydoc lint`` run, e.g. in a
+    pre-commit hook, so it should not grow with e.g. the import of Sphinx.
+    """
+
+    def timeraw_import_cli(self):
+        return "import numpydoc.cli"
+
+    def timeraw_import_lint_hook(self):
+        return "import numpydoc.hooks.validate_docstrings"
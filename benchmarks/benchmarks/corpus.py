@@ -0,0 +1,252 @@
+"""A deterministic synthetic corpus of numpydoc docstrings.
+
+Each docstring is generated from its index and a seed only, so corpora of any
+size (10k to 1M docstrings) are reproducible offline and can be streamed
+without holding them in memory.
+"""
+
+import importlib
+import random
+import shutil
+import sys
+import tempfile
+import textwrap
+from pathlib import Path
+
+WORDS = (
+    "array",
+    "axis",
+    "value",
+    "input",
+    "output",
+    "element",
+    "shape",
+    "data",
+    "index",
+    "sample",
+    "weight",
+    "matrix",
+    "vector",
+    "result",
+    "window",
+    "order",
+    "mode",
+    "buffer",
+    "kernel",
+    "signal",
+    "point",
+    "compute",
+    "reduce",
+    "apply",
+    "given",
+    "default",
+    "each",
+    "along",
+    "over",
+    "first",
+    "last",
+    "number",
+)
+
+TYPES = (
+    "int",
+    "float",
+    "str",
+    "bool",
+    "array_like",
+    "ndarray",
+    "int, optional",
+    "float, default: 1.0",
+    "list of str",
+    "tuple of int",
+    "dict",
+    "callable",
+    "numpy.dtype",
+    "int or None, optional",
+    "{'linear', 'nearest', 'cubic'}, optional",
+    "array_like of float",
+)
+
+EXCEPTIONS = ("ValueError", "TypeError", "IndexError", "KeyError", "RuntimeError")
+
+
+def _words(rng, n_words):
+    return " ".join(rng.choice(WORDS) for _ in range(n_words))
+
+
+def _sentences(rng, n_sentences):
+    return " ".join(
+        f"{_words(rng, rng.randint(5, 12)).capitalize()}." for _ in range(n_sentences)
+    )
+
+
+def _paragraph(rng, n_sentences, width=75):
+    return textwrap.fill(_sentences(rng, n_sentences), width)
+
+
+def _section(title, lines):
+    return [title, "-" * len(title), *lines, ""]
+
+
+def function_name(index, seed=0):
+    """Generate the name of the function `index` of the corpus."""
+    rng = random.Random(f"{seed}-{index}-name")
+    return f"{rng.choice(WORDS)}_{rng.choice(WORDS)}_{index}"
+
+
+def make_function(index, seed=0):
+    """Generate the name, parameter names and docstring of a function.
+
+    About one in ten docstrings has a validation error, e.g. a summary
+    without a period or an undocumented parameter, as in real code bases.
+
+    Parameters
+    ----------
+    index : int
+        The index of the function in the corpus.
+    seed : int, optional
+        The seed of the corpus.
+
+    Returns
+    -------
+    name : str
+        The name of the function.
+    params : list of str
+        The names of the parameters of the function.
+    docstring : str
+        The docstring, without indentation.
+    """
+    rng = random.Random(f"{seed}-{index}")
+    name = function_name(index, seed)
+    params = list(dict.fromkeys(rng.choice(WORDS) for _ in range(rng.randint(1, 6))))
+    flawed = rng.random() < 0.1
+
+    summary = f"{_words(rng, rng.randint(3, 8)).capitalize()}."
+    if flawed:
+        summary = summary[:-1]
+    lines = [summary, "", _paragraph(rng, rng.randint(1, 4)), ""]
+
+    documented = params[:-1] if flawed and len(params) > 1 else params
+    param_lines = []
+    for param in documented:
+        param_lines.append(f"{param} : {rng.choice(TYPES)}")
+        param_lines.extend(
+            "    " + line for line in _paragraph(rng, rng.randint(1, 2), 71).split("\n")
+        )
+    lines += _section("Parameters", param_lines)
+
+    n_returns = rng.randint(1, 2)
+    return_lines = []
+    for i in range(n_returns):
+        # A single return value is documented by its type only
+        name_prefix = f"out{i} : " if n_returns > 1 else ""
+        return_lines.append(f"{name_prefix}{rng.choice(TYPES)}")
+        return_lines.append(f"    {_sentences(rng, 1)}")
+    lines += _section("Returns", return_lines)
+
+    if rng.random() < 0.3:
+        lines += _section(
+            "Raises",
+            [rng.choice(EXCEPTIONS), f"    If the {rng.choice(WORDS)} is invalid."],
+        )
+    if index and rng.random() < 0.5:
+        lines += _section(
+            "See Also",
+            [f"{function_name(rng.randrange(index), seed)} : {_sentences(rng, 1)}"],
+        )
+    if rng.random() < 0.5:
+        lines += _section(
+            "Notes",
+            [
+                _paragraph(rng, rng.randint(2, 5)),
+                "",
+                ".. math:: y = \\sum_i w_i x_i",
+                "",
+                "See [1]_ for details.",
+            ],
+        )
+        lines += _section("References", [f".. [1] {_words(rng, 6).title()}, 2001."])
+    example_lines = []
+    for param in params[:3]:
+        example_lines.append(f">>> {param} = {rng.randint(0, 100)}")
+    example_lines.append(f">>> {name}({', '.join(params)})  # doctest: +SKIP")
+    lines += _section("Examples", example_lines)
+
+    return name, params, "\n".join(lines).rstrip()
+
+
+def make_docstring(index, seed=0):
+    """Generate the docstring of the function `index` of the corpus."""
+    return make_function(index, seed)[2]
+
+
+def iter_docstrings(n_docstrings, seed=0):
+    """Yield the first `n_docstrings` docstrings of the corpus."""
+    for index in range(n_docstrings):
+        yield make_docstring(index, seed)
+
+
+def write_package(root, n_functions, functions_per_module=100, seed=0):
+    """Write the functions of the corpus as a package named ``synthpkg``.
+
+    Parameters
+    ----------
+    root : os.PathLike
+        The directory in which to create the package.
+    n_functions : int
+        The number of functions in the package.
+    functions_per_module : int, optional
+        The number of functions per module.
+    seed : int, optional
+        The seed of the corpus.
+
+    Returns
+    -------
+    list of str
+        The import paths of the modules, in order.
+    """
+    package = Path(root) / "synthpkg"
+    package.mkdir(parents=True, exist_ok=True)
+    (package / "__init__.py").write_text('"""A synthetic package."""\n')
+    modules = []
+    for start in range(0, n_functions, functions_per_module):
+        module = f"mod{start // functions_per_module:05d}"
+        sources = [f'"""Functions {start} onwards of the corpus."""\n']
+        for index in range(start, min(start + functions_per_module, n_functions)):
+            name, params, docstring = make_function(index, seed)
+            body = textwrap.indent(f'r"""{docstring}\n"""\nreturn None', "    ")
+            sources.append(f"\ndef {name}({', '.join(params)}):\n{body}\n")
+        (package / f"{module}.py").write_text("\n".join(sources))
+        modules.append(f"synthpkg.{module}")
+    return modules
+
+
+class PackageBenchmark:
+    """Base of the benchmarks run over the corpus written as a package.
+
+    `setup_package` writes ``synthpkg`` to a temporary directory, which
+    `teardown` removes again.
+    """
+
+    def setup_package(self, n_functions, importable=False):
+        self.root = Path(tempfile.mkdtemp())
+        self.modules = write_package(self.root, n_functions)
+        self.files = [
+            str(self.root.joinpath(*module.split("."))) + ".py"
+            for module in self.modules
+        ]
+        if importable:
+            sys.path.insert(0, str(self.root))
+            self.names = [
+                f"{module}.{name}"
+                for module in self.modules
+                for name in vars(importlib.import_module(module))
+                if not name.startswith("_")
+            ]
+
+    def teardown(self, *params):
+        if str(self.root) in sys.path:
+            sys.path.remove(str(self.root))
+        for module in [m for m in sys.modules if m.partition(".")[0] == "synthpkg"]:
+            del sys.modules[module]
+        shutil.rmtree(self.root)
@@ -0,0 +1,162 @@
+"""Benchmarks for parsing docstrings with ``numpydoc.docscrape``."""
+
+import gc
+import tracemalloc
+
+from numpydoc.docscrape import ClassDoc, NumpyDocString, Reader
+from numpydoc.spans import parse_spans
+
+from .corpus import iter_docstrings
+
+
+def make_long_docstring(n_lines):
+    """Build a docstring whose Notes and Examples sections span `n_lines`."""
+    half = n_lines // 2
+    notes = [f"Line {i} of a long explanation." for i in range(half)]
+    # Blank lines split the Notes into paragraphs, exercising the reader's
+    # search for the next empty line.
+    notes[::10] = [""] * len(notes[::10])
+    examples = [f">>> x{i} = {i}" for i in range(n_lines - half)]
+    return "\n".join(
+        [
+            "Summarize the function.",
+            "",
+            "Notes",
+            "-----",
+            *notes,
+            "",
+            "Examples",
+            "--------",
+            *examples,
+        ]
+    )
+
+
+class TimeReader:
+    """Time reading a long docstring line by line.
+
+    The time per line should stay flat as the docstring grows.
+    """
+
+    params = [100, 1_000, 10_000, 100_000]
+    param_names = ["n_lines"]
+
+    def setup(self, n_lines):
+        self.lines = make_long_docstring(n_lines).split("\n")
+
+    def time_read_to_next_empty_line(self, n_lines):
+        reader = Reader(self.lines)
+        while not reader.eof():
+            reader.read_to_next_empty_line()
+            reader.read()
+
+    def time_read_to_next_unindented_line(self, n_lines):
+        reader = Reader(self.lines)
+        while not reader.eof():
+            reader.read_to_next_unindented_line()
+            reader.read()
+
+
+class TimeParseLongDocstring:
+    """Time parsing docstrings with very long sections."""
+
+    params = [100, 1_000, 10_000, 100_000]
+    param_names = ["n_lines"]
+
+    def setup(self, n_lines):
+        self.docstring = make_long_docstring(n_lines)
+
+    def time_parse(self, n_lines):
+        NumpyDocString(self.docstring)
+
+
+class TimeParseShortDocstring:
+    """Time parsing a one line docstring, dominated by fixed costs."""
+
+    def time_parse(self):
+        NumpyDocString("Summarize the function.")
+
+
+class TimeParseCorpus:
+    """Time parsing the docstrings of the synthetic corpus."""
+
+    params = [1_000, 10_000]
+    param_names = ["n_docstrings"]
+    timeout = 300
+
+    def setup_cache(self):
+        return list(iter_docstrings(max(self.params)))
+
+    def time_parse(self, docstrings, n_docstrings):
+        for docstring in docstrings[:n_docstrings]:
+            NumpyDocString(docstring)
+
+    def time_parse_spans(self, docstrings, n_docstrings):
+        for docstring in docstrings[:n_docstrings]:
+            parse_spans(docstring)
+
+
+def _parse_frozen(docstring):
+    return NumpyDocString(docstring).freeze()
+
+
+class TrackMemory:
+    """Track the memory used to keep parsed docstrings alive."""
+
+    params = ["parsed", "frozen"]
+    param_names = ["representation"]
+    unit = "bytes"
+
+    def setup(self, representation):
+        self.docstrings = list(iter_docstrings(1_000))
+
+    def track_bytes_per_docstring(self, representation):
+        make = {"parsed": NumpyDocString, "frozen": _parse_frozen}[representation]
+        gc.collect()
+        tracemalloc.start()
+        try:
+            docs = [make(docstring) for docstring in self.docstrings]
+            gc.collect()
+            size, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        del docs
+        return size / len(self.docstrings)
+
+
+def _member(self):
+    """Document a member."""
+
+
+def make_class_hierarchy(depth, members_per_class):
+    """Build a chain of `depth` classes, each defining methods and properties."""
+    bases = (object,)
+    for level in range(depth):
+        namespace = {"__doc__": f"Level {level} of the hierarchy."}
+        for i in range(members_per_class):
+            if i % 2:
+                namespace[f"method_{level}_{i}"] = _member
+            else:
+                namespace[f"prop_{level}_{i}"] = property(_member)
+        bases = (type(f"Level{level}", bases, namespace),)
+    return bases[0]
+
+
+class TimeClassDoc:
+    """Time documenting a class with many members and a deep MRO."""
+
+    params = [10, 50]
+    param_names = ["members_per_class"]
+
+    def setup(self, members_per_class):
+        self.cls = make_class_hierarchy(10, members_per_class)
+
+    def time_class_doc(self, members_per_class):
+        ClassDoc(self.cls)
+
+    def time_subclass_doc(self, members_per_class):
+        ClassDoc(type("Subclass", (self.cls,), {"__doc__": "A subclass."}))
+
+    def time_render_members(self, members_per_class):
+        doc = ClassDoc(self.cls)
+        doc["Methods"], doc["Attributes"]
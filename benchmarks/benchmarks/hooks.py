@@ -0,0 +1,24 @@
+"""Benchmarks for the ``numpydoc lint`` validation hook."""
+
+import contextlib
+import io
+
+from numpydoc.hooks.validate_docstrings import run_hook
+
+from .corpus import PackageBenchmark
+
+
+class TimeRunHook(PackageBenchmark):
+    """Time linting the files of the synthetic package."""
+
+    params = ([1_000, 10_000], [1, 2])
+    param_names = ["n_functions", "jobs"]
+    timeout = 300
+
+    def setup(self, n_functions, jobs):
+        self.setup_package(n_functions)
+
+    def time_run_hook(self, n_functions, jobs):
+        # The findings are printed to stderr
+        with contextlib.redirect_stderr(io.StringIO()):
+            run_hook(self.files, config=str(self.root), jobs=jobs)
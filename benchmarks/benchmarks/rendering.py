@@ -0,0 +1,32 @@
+"""Benchmarks for rendering docstrings with ``numpydoc.docscrape_sphinx``."""
+
+from numpydoc.docscrape_sphinx import SphinxDocString
+from numpydoc.xref import DEFAULT_LINKS, XrefResolver
+
+from .corpus import iter_docstrings
+
+
+class TimeRenderCorpus:
+    """Time rendering the parsed docstrings of the synthetic corpus to reST."""
+
+    params = ([1_000, 10_000], [False, True])
+    param_names = ["n_docstrings", "xref_param_type"]
+    timeout = 300
+
+    def setup(self, n_docstrings, xref_param_type):
+        config = {
+            "xref_param_type": xref_param_type,
+            "xref_resolver": XrefResolver(DEFAULT_LINKS, set()),
+        }
+        self.docs = [
+            SphinxDocString(docstring, config=config)
+            for docstring in iter_docstrings(n_docstrings)
+        ]
+
+    def time_render(self, n_docstrings, xref_param_type):
+        for doc in self.docs:
+            str(doc)
+
+    def time_render_source_map(self, n_docstrings, xref_param_type):
+        for doc in self.docs:
+            doc.source_map()
@@ -0,0 +1,54 @@
+"""Benchmarks for a full Sphinx build using the numpydoc extension."""
+
+from sphinx.application import Sphinx
+from sphinx.util.docutils import docutils_namespace
+
+from .corpus import PackageBenchmark
+
+CONF = """\
+extensions = ["sphinx.ext.autodoc", "numpydoc"]
+project = "synthpkg"
+exclude_patterns = ["_build"]
+numpydoc_xref_param_type = True
+numpydoc_validation_checks = {"all"}
+"""
+
+
+class TimeSphinxBuild(PackageBenchmark):
+    """Time building the HTML API documentation of the synthetic package.
+
+    This mirrors the ``tinybuild`` of the test suite, at a larger scale.
+    """
+
+    params = [100, 1_000]
+    param_names = ["n_functions"]
+    number = 1
+    repeat = 3
+    timeout = 600
+
+    def setup(self, n_functions):
+        self.setup_package(n_functions, importable=True)
+        (self.root / "conf.py").write_text(CONF)
+        (self.root / "index.rst").write_text(
+            "API\n===\n\n"
+            + "".join(
+                f".. automodule:: {module}\n   :members:\n\n" for module in self.modules
+            )
+        )
+
+    def time_build(self, n_functions):
+        out_dir = self.root / "_build"
+        # Avoid warnings about re-registration, see:
+        # https://github.com/sphinx-doc/sphinx/issues/5038
+        with docutils_namespace():
+            app = Sphinx(
+                self.root,
+                self.root,
+                out_dir / "html",
+                out_dir / "doctrees",
+                buildername="html",
+                status=None,
+                warning=None,
+                freshenv=True,
+            )
+            app.build(force_all=True)
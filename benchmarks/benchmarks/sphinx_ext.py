@@ -0,0 +1,96 @@
+"""Benchmarks for the doctree hooks of the numpydoc Sphinx extension."""
+
+from docutils import nodes
+from docutils.utils import new_document
+from sphinx.addnodes import desc, desc_content, pending_xref
+
+from numpydoc.numpydoc import (
+    DEDUPLICATION_TAG,
+    HASH_LEN,
+    clean_backrefs,
+    relabel_references,
+)
+
+
+class MockApp:
+    pass
+
+
+def make_cited_page(n_docstrings, container=desc_content):
+    """Build the doctree of an API page whose docstrings each cite a reference.
+
+    Each docstring mirrors what Sphinx reads from numpydoc output: a
+    paragraph citing ``[1]_``, a citation and the deduplication comment.
+    Docstrings are in `container` nodes, either the ``desc_content`` of an
+    object description or sibling sections. With sections, only the last one
+    is tagged, as for a long module docstring with headings.
+    """
+    doc = new_document("api")
+    for i in range(n_docstrings):
+        label = f"R{i:0{HASH_LEN}d}-1"
+        content = container()
+        par = nodes.paragraph()
+        par += nodes.Text("See ")
+        cite_ref = nodes.citation_reference(label, label, refname=label)
+        doc.set_id(cite_ref, par)
+        par += cite_ref
+        # Sphinx replaces citation references with pending_xref nodes
+        xref = pending_xref(refdomain="citation", ids=cite_ref["ids"])
+        xref += nodes.inline("", f"[{label}]")
+        cite_ref.replace_self(xref)
+        content += par
+        rubric = nodes.rubric("", "References")
+        content += rubric
+        cit = nodes.citation(backrefs=cite_ref["ids"])
+        doc.set_id(cit, content)
+        cit += nodes.label("", label)
+        cit += nodes.paragraph("", "Author, Title.")
+        content += cit
+        if container is desc_content or i == n_docstrings - 1:
+            content += nodes.comment(DEDUPLICATION_TAG, DEDUPLICATION_TAG)
+        if container is desc_content:
+            entry = desc()
+            entry += content
+            doc += entry
+        else:
+            doc += content
+    return doc
+
+
+class TimeRelabelReferences:
+    """Time relabelling the citations of a page of cited docstrings.
+
+    The time per docstring should stay flat as the page grows.
+    """
+
+    params = ([10, 100, 1_000], ["desc_content", "section"])
+    param_names = ["n_docstrings", "container"]
+    number = 1
+    repeat = 5
+
+    def setup(self, n_docstrings, container):
+        containers = {"desc_content": desc_content, "section": nodes.section}
+        self.doc = make_cited_page(n_docstrings, containers[container])
+
+    def time_relabel_references(self, n_docstrings, container):
+        relabel_references(MockApp(), self.doc)
+
+
+class TimeCleanBackrefs:
+    """Time cleaning the citation backrefs of resolved pages."""
+
+    params = ([10, 100, 1_000], [True, False])
+    param_names = ["n_docstrings", "cited"]
+    number = 1
+    repeat = 5
+
+    def setup(self, n_docstrings, cited):
+        self.doc = make_cited_page(n_docstrings)
+        if not cited:
+            for node in list(self.doc.findall(nodes.citation)):
+                for id_ in node["ids"]:
+                    del self.doc.ids[id_]
+                node.parent.remove(node)
+
+    def time_clean_backrefs(self, n_docstrings, cited):
+        clean_backrefs(MockApp(), self.doc, "api")
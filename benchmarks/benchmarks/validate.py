@@ -0,0 +1,25 @@
+"""Benchmarks for validating docstrings with ``numpydoc.validate``."""
+
+import collections
+
+from numpydoc.validate import validate, validate_many
+
+from .corpus import PackageBenchmark
+
+
+class TimeValidate(PackageBenchmark):
+    """Time validating the functions of the synthetic package."""
+
+    params = [100, 1_000]
+    param_names = ["n_functions"]
+    timeout = 300
+
+    def setup(self, n_functions):
+        self.setup_package(n_functions, importable=True)
+
+    def time_validate(self, n_functions):
+        for name in self.names:
+            validate(name)
+
+    def time_validate_many(self, n_functions):
+        collections.deque(validate_many(self.names), maxlen=0)
@@ -0,0 +1,32 @@
+"""Benchmarks for cross-referencing parameter types with ``numpydoc.xref``."""
+
+from numpydoc.docscrape import NumpyDocString
+from numpydoc.xref import DEFAULT_LINKS, XrefResolver, make_xref
+
+from .corpus import iter_docstrings
+
+
+class TimeXref:
+    """Time cross-referencing the parameter types of the synthetic corpus.
+
+    The types of real code bases repeat a lot, which the resolver exploits.
+    """
+
+    params = [1_000, 10_000]
+    param_names = ["n_docstrings"]
+
+    def setup(self, n_docstrings):
+        self.param_types = [
+            param.type
+            for docstring in iter_docstrings(n_docstrings)
+            for param in NumpyDocString(docstring)["Parameters"]
+        ]
+
+    def time_make_xref(self, n_docstrings):
+        for param_type in self.param_types:
+            make_xref(param_type, DEFAULT_LINKS, set())
+
+    def time_resolver(self, n_docstrings):
+        resolver = XrefResolver(DEFAULT_LINKS, set())
+        for param_type in self.param_types:
+            resolver(param_type)
@@ -0,0 +1,174 @@
+"""On-disk caches shared by the Sphinx extension and the validation hook.
+
+Entries are JSON files sharded by the first two characters of their key.
+Writes go through a temporary file that is atomically moved into place, so
+concurrent readers and writers (parallel Sphinx reads, several hook runs)
+never see a partially written entry.
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+from pathlib import Path
+
+from . import __version__
+
+
+def _json_default(value):
+    if isinstance(value, re.Pattern):
+        return value.pattern
+    if isinstance(value, set | frozenset):
+        return sorted(value, key=repr)
+    raise TypeError(f"Cannot serialize {value!r}")
+
+
+def fingerprint(*parts) -> str:
+    """
+    Hash JSON-serializable values, along with the numpydoc version.
+
+    Parameters
+    ----------
+    *parts : object
+        Values to hash. Sets are hashed irrespective of their order and
+        compiled regular expressions by their pattern.
+
+    Returns
+    -------
+    str
+        A hex digest that changes whenever any of the values does.
+    """
+    serialized = json.dumps(
+        [__version__, *parts], default=_json_default, sort_keys=True
+    )
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def ensure_cache_dir(cache_dir: Path) -> None:
+    """
+    Create the cache directory, keeping it out of version control.
+
+    Parameters
+    ----------
+    cache_dir : pathlib.Path
+        The cache directory.
+    """
+    if cache_dir.is_dir():
+        return
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    # Keep the cache out of version control, like other linters do.
+    (cache_dir / ".gitignore").write_text("*\n")
+
+
+def entry_path(cache_dir: Path, key: str) -> Path:
+    """
+    Get the path of the entry stored under a hex `key`.
+
+    Parameters
+    ----------
+    cache_dir : pathlib.Path
+        The cache directory.
+    key : str
+        A hex digest, such as returned by :func:`fingerprint`.
+
+    Returns
+    -------
+    pathlib.Path
+        The path of the entry, sharded by the first two characters of the key.
+    """
+    return cache_dir / key[:2] / f"{key[2:]}.json"
+
+
+def read_entry(path: Path):
+    """
+    Load a cache entry.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        The path of the entry.
+
+    Returns
+    -------
+    object or None
+        The stored value, or None if the entry is missing or unreadable.
+    """
+    try:
+        with open(path, encoding="utf-8") as entry_file:
+            return json.load(entry_file)
+    except (OSError, ValueError):
+        return None
+
+
+def write_entry(cache_dir: Path, path: Path, value) -> None:
+    """
+    Atomically store a cache entry, ignoring file system errors.
+
+    Parameters
+    ----------
+    cache_dir : pathlib.Path
+        The cache directory, created if needed.
+    path : pathlib.Path
+        The path of the entry.
+    value : object
+        A JSON-serializable value.
+    """
+    try:
+        ensure_cache_dir(cache_dir)
+        path.parent.mkdir(exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+            json.dump(value, tmp_file)
+        Path(tmp_path).replace(path)
+    except OSError:
+        pass  # a read-only or full disk should not fail the build
+
+
+class DocstringCache:
+    """
+    Persist rendered docstrings and their validation reports across builds.
+
+    Parameters
+    ----------
+    cache_dir : os.PathLike
+        The directory holding the cache entries. It is created on first write.
+    """
+
+    def __init__(self, cache_dir: os.PathLike) -> None:
+        self.cache_dir: Path = Path(cache_dir)
+
+    def __repr__(self) -> str:
+        # Sphinx compares config values across builds by their str(), which
+        # must only depend on the directory, not on the entries stored in it.
+        return f"{type(self).__name__}({str(self.cache_dir)!r})"
+
+    def get(self, key: str) -> dict | None:
+        """
+        Look up a cache entry.
+
+        Parameters
+        ----------
+        key : str
+            The key of the entry, as returned by :func:`fingerprint`.
+
+        Returns
+        -------
+        dict or None
+            The stored entry, or None if there is none.
+        """
+        entry = read_entry(entry_path(self.cache_dir, key))
+        return entry if isinstance(entry, dict) else None
+
+    def set(self, key: str, entry: dict) -> None:
+        """
+        Store a cache entry.
+
+        Parameters
+        ----------
+        key : str
+            The key of the entry, as returned by :func:`fingerprint`.
+        entry : dict
+            A JSON-serializable entry.
+        """
+        write_entry(self.cache_dir, entry_path(self.cache_dir, key), entry)
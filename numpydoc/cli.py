@@ -2,33 +2,178 @@
 
 import argparse
 import ast
+import importlib
+import inspect
+import itertools
+import pkgutil
 import re
-from collections.abc import Sequence
+import sys
+from collections.abc import Iterator, Sequence
 from pathlib import Path
 from typing import List
 
-from .docscrape_sphinx import get_doc_object
-from .hooks import utils, validate_docstrings
-from .validate import ERROR_MSGS, Validator, validate
+# The subcommands import what they need themselves, so that e.g. ``lint``
+# starts without importing Sphinx.
 
 
 def render_object(import_path: str, config: List[str] | None = None) -> int:
     """Test numpydoc docstring generation for a given object."""
+    from .docscrape_sphinx import get_doc_object
+    from .validate import Validator
+
     # TODO: Move Validator._load_obj to a better place than validate
     print(get_doc_object(Validator._load_obj(import_path), config=dict(config or [])))
     return 0
 
 
-def validate_object(import_path: str) -> int:
+def _iter_public_names(import_path: str) -> Iterator[str]:
+    """
+    Yield the import paths of an object and of its public members, recursively.
+
+    Modules list the names in their ``__all__``, or else the public classes and
+    functions they define, followed by their public submodules, except for
+    ``test`` and ``tests`` packages. Classes list the public methods and
+    properties they define. Submodules that fail to import are yielded, but not
+    walked.
+
+    Parameters
+    ----------
+    import_path : str
+        The import path of a module or class, e.g. numpy.linalg.
+
+    Yields
+    ------
+    str
+        The import paths, starting with `import_path` itself.
+    """
+    from .validate import Validator
+
+    seen = set()
+
+    def walk(path, obj):
+        if path in seen:
+            return
+        seen.add(path)
+        yield path
+        if inspect.ismodule(obj):
+            if hasattr(obj, "__all__"):
+                names = list(obj.__all__)
+            else:
+                names = [
+                    name
+                    for name, member in vars(obj).items()
+                    if not name.startswith("_")
+                    and getattr(member, "__module__", None) == obj.__name__
+                ]
+            for name in names:
+                member = getattr(obj, name, None)
+                if inspect.isclass(member) or inspect.isroutine(member):
+                    yield from walk(f"{path}.{name}", member)
+            for module_info in pkgutil.iter_modules(getattr(obj, "__path__", [])):
+                if module_info.name.startswith("_") or module_info.name in (
+                    "test",
+                    "tests",
+                ):
+                    continue
+                submodule_path = f"{path}.{module_info.name}"
+                try:
+                    submodule = importlib.import_module(submodule_path)
+                except (ImportError, SyntaxError):
+                    # Still yielded, so that the failure is reported when it is
+                    # validated
+                    seen.add(submodule_path)
+                    yield submodule_path
+                else:
+                    yield from walk(submodule_path, submodule)
+        elif inspect.isclass(obj):
+            for name, member in vars(obj).items():
+                if not name.startswith("_") and (
+                    inspect.isroutine(member)
+                    or isinstance(member, classmethod | staticmethod | property)
+                ):
+                    yield from walk(f"{path}.{name}", getattr(obj, name))
+
+    yield from walk(import_path, Validator._load_obj(import_path))
+
+
+def _read_import_paths(from_file: str) -> list[str]:
+    """Read import paths, one per line, from a file or from stdin if "-"."""
+    if from_file == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        lines = Path(from_file).read_text(encoding="utf-8").splitlines()
+    import_paths = (line.strip() for line in lines)
+    return [path for path in import_paths if path and not path.startswith("#")]
+
+
+def validate_object(
+    import_path: str | None,
+    recursive: bool = False,
+    from_file: str | None = None,
+    jobs: int | str | None = 1,
+) -> int:
     """Run numpydoc docstring validation for a given object."""
+    from .hooks.utils import resolve_jobs
+    from .validate import validate_many
+
+    import_paths = [import_path] if import_path else []
+    if from_file is not None:
+        import_paths += _read_import_paths(from_file)
+    if recursive:
+        import_paths = itertools.chain.from_iterable(
+            _iter_public_names(path) for path in import_paths
+        )
+
     exit_status = 0
-    results = validate(import_path)
-    for err_code, err_desc in results["errors"]:
-        exit_status += 1
-        print(":".join([import_path, err_code, err_desc]))
+    for name, results in validate_many(import_paths, jobs=resolve_jobs(jobs)):
+        for err_code, err_desc in results["errors"]:
+            exit_status += 1
+            print(":".join([name, err_code, err_desc]), flush=True)
     return exit_status
 
 
+def lint_files(files: List[str], **kwargs) -> int:
+    """Run numpydoc validation on files, see ``validate_docstrings.run_hook``."""
+    from .hooks.validate_docstrings import run_hook
+
+    return run_hook(files, **kwargs)
+
+
+def _ignored_checks_help() -> str:
+    """Describe the checks ignored by the config of the current project."""
+    from .hooks.utils import find_project_root
+    from .hooks.validate_docstrings import parse_config
+    from .validate import ERROR_MSGS
+
+    project_root_from_cwd, config_file = find_project_root(["."])
+    config_options = parse_config(project_root_from_cwd)
+    ignored_checks = [
+        f"- {check}: {ERROR_MSGS[check]}"
+        for check in set(ERROR_MSGS.keys()) - config_options["checks"]
+    ]
+    if not ignored_checks:
+        return ""
+    ignored_checks_text = "\n  " + "\n  ".join(ignored_checks) + "\n"
+    return (
+        " Currently ignoring the following from "
+        f"{Path(project_root_from_cwd) / config_file}: {ignored_checks_text}"
+        "Values provided here will be in addition to the above, unless an alternate config is provided."
+    )
+
+
+class _LintHelpFormatter(argparse.RawTextHelpFormatter):
+    """Append the checks ignored by the project config to the ``--ignore`` help.
+
+    The config is only read when the help is actually formatted.
+    """
+
+    def _get_help_string(self, action):
+        help_string = super()._get_help_string(action)
+        if action.dest == "ignore":
+            help_string += _ignored_checks_help()
+        return help_string
+
+
 def get_parser() -> argparse.ArgumentParser:
     """
     Build an argument parser.
@@ -46,6 +191,19 @@ def get_parser() -> argparse.ArgumentParser:
         value = ast.literal_eval(value)
         return key, value
 
+    def _parse_jobs(s):
+        if s.lower() == "auto":
+            return s.lower()
+        try:
+            jobs = int(s)
+        except ValueError:
+            jobs = 0
+        if jobs < 1:
+            raise argparse.ArgumentTypeError(
+                f"expected a positive number of jobs or 'auto', got {s!r}"
+            )
+        return jobs
+
     render = subparsers.add_parser(
         "render",
         description="Generate an expanded RST-version of the docstring.",
@@ -67,22 +225,35 @@ def get_parser() -> argparse.ArgumentParser:
         description="Validate an object's docstring against the numpydoc standard.",
         help="validate the object's docstring and report errors",
     )
-    validate.add_argument("import_path", help="e.g. numpy.ndarray")
+    validate.add_argument("import_path", nargs="?", help="e.g. numpy.ndarray")
+    validate.add_argument(
+        "-r",
+        "--recursive",
+        action="store_true",
+        help="also validate the public members of modules and classes, "
+        "recursively (honoring __all__)",
+    )
+    validate.add_argument(
+        "--from-file",
+        metavar="FILE",
+        help="read import paths to validate from FILE, one per line, "
+        "or from stdin if FILE is -",
+    )
+    validate.add_argument(
+        "-j",
+        "--jobs",
+        type=_parse_jobs,
+        default=1,
+        help="number of worker processes to validate modules in parallel; "
+        "use 'auto' to start one process per CPU (default: 1)",
+    )
     validate.set_defaults(func=validate_object)
 
-    project_root_from_cwd, config_file = utils.find_project_root(["."])
-    config_options = validate_docstrings.parse_config(project_root_from_cwd)
-    ignored_checks = [
-        f"- {check}: {ERROR_MSGS[check]}"
-        for check in set(ERROR_MSGS.keys()) - config_options["checks"]
-    ]
-    ignored_checks_text = "\n  " + "\n  ".join(ignored_checks) + "\n"
-
     lint_parser = subparsers.add_parser(
         "lint",
         description="Run numpydoc validation on files with option to ignore individual checks.",
         help="validate all docstrings in file(s) using the abstract syntax tree",
-        formatter_class=argparse.RawTextHelpFormatter,
+        formatter_class=_LintHelpFormatter,
     )
     lint_parser.add_argument(
         "files", type=str, nargs="+", help="File(s) to run numpydoc validation on."
@@ -105,17 +276,33 @@ def get_parser() -> argparse.ArgumentParser:
             "Check codes to ignore. Can be specified multiple times; each value\n"
             "may contain multiple comma or space separated codes\n"
             "(e.g., --ignore ES01,SA01 or --ignore ES01 --ignore 'SA01 EX01')."
-            f"""{
-                " Currently ignoring the following from "
-                f"{Path(project_root_from_cwd) / config_file}: {ignored_checks_text}"
-                "Values provided here will be in addition to the above, unless an alternate config is provided."
-                if ignored_checks
-                else ""
-            }"""
         ),
         action="append",
     )
-    lint_parser.set_defaults(func=validate_docstrings.run_hook)
+    lint_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=_parse_jobs,
+        default=1,
+        help=(
+            "Number of worker processes to validate files in parallel.\n"
+            "Use 'auto' to start one process per CPU (default: 1)."
+        ),
+    )
+    lint_parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Cache the findings, to skip files unchanged since the last run.",
+    )
+    lint_parser.add_argument(
+        "--cache-dir",
+        type=str,
+        help=(
+            "Directory to store cached results in with --cache\n"
+            "(default: .numpydoc_cache in the project root)."
+        ),
+    )
+    lint_parser.set_defaults(func=lint_files)
 
     return ap
 
@@ -133,6 +320,13 @@ def main(argv: Sequence[str] | None = None) -> int:
             ignored_checks += re.split("\\W+", checks)
         args["ignore"] = ignored_checks
 
+    if (
+        args.get("func") is validate_object
+        and args["import_path"] is None
+        and args["from_file"] is None
+    ):
+        ap.error("validate: an import path or --from-file is required")
+
     try:
         func = args.pop("func")
         return func(**args)
@@ -1,11 +1,15 @@
 """Extract reference documentation from the NumPy source tree."""
 
 import copy
+import functools
 import inspect
+import itertools
 import pydoc
 import re
 import sys
 import textwrap
+import types
+import weakref
 from collections import namedtuple
 from collections.abc import Callable, Mapping
 from functools import cached_property
@@ -54,24 +58,38 @@ class Reader:
             return ""
 
     def seek_next_non_empty_line(self):
-        for l in self[self._l :]:
-            if l.strip():
-                break
-            else:
-                self._l += 1
+        lines, n = self._str, len(self._str)
+        l = self._l
+        while l < n and not lines[l].strip():
+            l += 1
+        self._l = l
 
     def eof(self):
         return self._l >= len(self._str)
 
+    def span_to_condition(self, condition_func):
+        """Advance to the first line satisfying `condition_func`.
+
+        Lines are scanned by index, so reading a whole docstring with
+        repeated calls takes time linear in its number of lines.
+
+        Returns
+        -------
+        start, stop : int
+            The range of lines read, or ``(start, start)`` if at the end.
+        """
+        lines, n = self._str, len(self._str)
+        start = l = self._l
+        while l < n:
+            if condition_func(lines[l]):
+                break
+            l += 1
+        self._l = l
+        return start, l
+
     def read_to_condition(self, condition_func):
-        start = self._l
-        for line in self[start:]:
-            if condition_func(line):
-                return self[start : self._l]
-            self._l += 1
-            if self.eof():
-                return self[start : self._l + 1]
-        return []
+        start, stop = self.span_to_condition(condition_func)
+        return self._str[start:stop]
 
     def read_to_next_empty_line(self):
         self.seek_next_non_empty_line()
@@ -107,12 +125,60 @@ class ParseError(Exception):
 
 Parameter = namedtuple("Parameter", ["name", "type", "desc"])
 
+# A summary line giving the signature of the function, e.g. "f(x, y=1)"
+SIGNATURE_RE = re.compile(r"^([\w., ]+=)?\s*[\w\.]+\(.*\)$")
+
+# Sections listing parameters, whose items have a type but no name if there is
+# no " : " in the first line of the item for the latter
+_TYPE_SECTIONS = frozenset(["Returns", "Yields", "Receives", "Raises", "Warns"])
+_PARAM_SECTIONS = _TYPE_SECTIONS | {
+    "Parameters",
+    "Other Parameters",
+    "Attributes",
+    "Methods",
+}
+
+
+def _is_section_header(title, underline):
+    """
+    Whether two lines of a docstring start a section.
+
+    Parameters
+    ----------
+    title, underline : str
+        The stripped lines, the second one being empty at the end of the
+        docstring.
+
+    Returns
+    -------
+    bool
+        True for a title underlined by at least as many dashes or equal signs,
+        or an index directive.
+    """
+    if title.startswith(".. index::"):
+        return True
+    return underline.startswith("-" * len(title)) or underline.startswith(
+        "=" * len(title)
+    )
+
+
+def _section_key(title):
+    """Return the key of a section in a :class:`NumpyDocString` from its title."""
+    return " ".join(word.capitalize() for word in title.split(" "))
+
 
 class NumpyDocString(Mapping):
     """Parses a numpydoc string to an abstract representation
 
     Instances define a mapping from section title to structured data.
 
+    If ``config`` has a true ``"lazy"`` entry, the docstring is only split
+    into sections on creation. Sections such as Parameters or See Also are
+    then parsed the first time they are read.
+
+    ``docstring`` can also be a :class:`FrozenDocString`, as returned by
+    :meth:`freeze`, whose sections are then used without parsing again.
+
     """
 
     sections = {
@@ -137,11 +203,26 @@ class NumpyDocString(Mapping):
     }
 
     def __init__(self, docstring, config=None):
-        orig_docstring = docstring
+        frozen = None
+        if isinstance(docstring, FrozenDocString):
+            frozen, docstring = docstring, docstring.docstring
+        self._docstring = orig_docstring = docstring
         docstring = textwrap.dedent(docstring).split("\n")
 
         self._doc = Reader(docstring)
-        self._parsed_data = copy.deepcopy(self.sections)
+        # Sections set or read so far, the others have their default value
+        self._parsed_data = {}
+        self._lazy = bool(config and config.get("lazy", False))
+        # Parsers of the sections whose raw content has not been parsed yet
+        self._unparsed = {}
+
+        if frozen is not None:
+            for key, value in frozen._sections:
+                self[key] = value
+                self._unparsed[key] = functools.partial(
+                    _thaw_section, frozen.docstring, key
+                )
+            return
 
         try:
             self._parse()
@@ -150,19 +231,45 @@ class NumpyDocString(Mapping):
             raise
 
     def __getitem__(self, key):
+        if key in self._unparsed:
+            try:
+                self._parsed_data[key] = self._unparsed[key](self._parsed_data[key])
+            except ParseError as e:
+                e.docstring = self._docstring
+                raise
+            del self._unparsed[key]
+        elif key not in self._parsed_data:
+            # Copy the shared default on first access, as it may be modified
+            self._parsed_data[key] = copy.deepcopy(self.sections[key])
         return self._parsed_data[key]
 
     def __setitem__(self, key, val):
-        if key not in self._parsed_data:
+        if key not in self.sections:
             self._error_location(f"Unknown section {key}", error=False)
         else:
+            self._unparsed.pop(key, None)
             self._parsed_data[key] = val
 
+    def __contains__(self, key):
+        return key in self.sections
+
     def __iter__(self):
-        return iter(self._parsed_data)
+        return iter(self.sections)
 
     def __len__(self):
-        return len(self._parsed_data)
+        return len(self.sections)
+
+    def freeze(self):
+        """
+        Get a compact, read-only copy of the parsed docstring.
+
+        Returns
+        -------
+        FrozenDocString
+            The copy, which can be passed instead of a docstring to create a
+            ``NumpyDocString`` (or subclass) without parsing again.
+        """
+        return FrozenDocString(self)
 
     def _is_at_section(self):
         self._doc.seek_next_non_empty_line()
@@ -171,18 +278,19 @@ class NumpyDocString(Mapping):
             return False
 
         l1 = self._doc.peek().strip()  # e.g. Parameters
-
-        if l1.startswith(".. index::"):
-            return True
-
         l2 = self._doc.peek(1).strip()  # ---------- or ==========
-        if len(l2) >= 3 and (set(l2) in ({"-"}, {"="})) and len(l2) != len(l1):
+        if (
+            not l1.startswith(".. index::")
+            and len(l2) >= 3
+            and (set(l2) in ({"-"}, {"="}))
+            and len(l2) != len(l1)
+        ):
             snip = "\n".join(self._doc._str[:2]) + "..."
             self._error_location(
                 f"potentially wrong underline length... \n{l1} \n{l2} in \n{snip}",
                 error=False,
             )
-        return l2.startswith("-" * len(l1)) or l2.startswith("=" * len(l1))
+        return _is_section_header(l1, l2)
 
     def _strip(self, doc):
         i = 0
@@ -376,8 +484,7 @@ class NumpyDocString(Mapping):
         while True:
             summary = self._doc.read_to_next_empty_line()
             summary_str = " ".join([s.strip() for s in summary]).strip()
-            compiled = re.compile(r"^([\w., ]+=)?\s*[\w\.]+\(.*\)$")
-            if compiled.match(summary_str):
+            if SIGNATURE_RE.match(summary_str):
                 self["Signature"] = summary_str
                 if not self._is_at_section():
                     continue
@@ -404,26 +511,35 @@ class NumpyDocString(Mapping):
 
         for section, content in sections:
             if not section.startswith(".."):
-                section = (s.capitalize() for s in section.split(" "))
-                section = " ".join(section)
+                section = _section_key(section)
                 if self.get(section):
                     self._error_location(
                         "The section %s appears twice in  %s"
                         % (section, "\n".join(self._doc._str))
                     )
 
-            if section in ("Parameters", "Other Parameters", "Attributes", "Methods"):
-                self[section] = self._parse_param_list(content)
-            elif section in ("Returns", "Yields", "Raises", "Warns", "Receives"):
-                self[section] = self._parse_param_list(
-                    content, single_element_is_type=True
+            if section in _TYPE_SECTIONS:
+                key = section
+                parse = functools.partial(
+                    self._parse_param_list, single_element_is_type=True
                 )
+            elif section in _PARAM_SECTIONS:
+                key, parse = section, self._parse_param_list
             elif section.startswith(".. index::"):
-                self["index"] = self._parse_index(section, content)
+                key, parse = "index", functools.partial(self._parse_index, section)
             elif section == "See Also":
-                self["See Also"] = self._parse_see_also(content)
+                key, parse = section, self._parse_see_also
+            else:
+                key, parse = section, None
+
+            if parse is None:
+                self[key] = content
+            elif self._lazy:
+                # Keep the raw content, to be parsed on first access
+                self[key] = content
+                self._unparsed[key] = parse
             else:
-                self[section] = content
+                self[key] = parse(content)
 
     @property
     def _obj(self):
@@ -581,6 +697,216 @@ def dedent_lines(lines):
     return textwrap.dedent("\n".join(lines)).split("\n")
 
 
+class _Span:
+    """Lines of a docstring, stored as character offsets into it.
+
+    The lines are those of ``docstring[start:stop]``, without their first
+    ``indent`` characters. Lines with only whitespace are empty.
+    """
+
+    __slots__ = ("indent", "start", "stop")
+
+    def __init__(self, start, stop, indent):
+        self.start = start
+        self.stop = stop
+        self.indent = indent
+
+    def lines(self, docstring):
+        return [
+            line[self.indent :] if line.strip() else ""
+            for line in docstring[self.start : self.stop].split("\n")
+        ]
+
+
+class _SpanFinder:
+    """Locate blocks of (dedented) lines in a docstring, see `find`."""
+
+    def __init__(self, docstring):
+        self.docstring = docstring
+        self.lines = docstring.split("\n")
+        self.offsets = list(
+            itertools.accumulate((len(line) + 1 for line in self.lines), initial=0)
+        )
+        self.hint = 0
+
+    def find(self, block):
+        """
+        Store a block of lines as a span of the docstring, if possible.
+
+        Parameters
+        ----------
+        block : list of str
+            Lines of the docstring, possibly dedented.
+
+        Returns
+        -------
+        _Span or tuple of str
+            The span, or the lines themselves if they are not found as is.
+        """
+        first = next((i for i, line in enumerate(block) if line), None)
+        n_lines = len(self.lines) - len(block) + 1
+        if first is not None:
+            # Blocks are mostly searched in order, so start after the last one
+            for start in itertools.chain(
+                range(self.hint, n_lines), range(min(self.hint, n_lines))
+            ):
+                line = self.lines[start + first]
+                if not line.endswith(block[first]):
+                    continue
+                stop = start + len(block)
+                span = _Span(
+                    self.offsets[start],
+                    self.offsets[stop] - 1,
+                    len(line) - len(block[first]),
+                )
+                if span.lines(self.docstring) == block:
+                    self.hint = stop
+                    return span
+        return tuple(block)
+
+
+def _thaw_lines(docstring, lines):
+    if isinstance(lines, _Span):
+        return lines.lines(docstring)
+    return list(lines)
+
+
+class FrozenParameter:
+    """A compact, read-only copy of a :class:`Parameter`."""
+
+    __slots__ = ("desc", "name", "type")
+
+    def __init__(self, name, type, desc):
+        self.name = sys.intern(name)
+        self.type = sys.intern(type)
+        self.desc = desc
+
+    def thaw(self, docstring):
+        return Parameter(self.name, self.type, _thaw_lines(docstring, self.desc))
+
+
+def _freeze_section(key, value, finder):
+    if key in _PARAM_SECTIONS:
+        return tuple(
+            FrozenParameter(param.name, param.type, finder.find(param.desc))
+            for param in value
+        )
+    if key == "See Also":
+        return tuple(
+            (
+                tuple((sys.intern(name), role) for name, role in funcs),
+                finder.find(desc),
+            )
+            for funcs, desc in value
+        )
+    if key == "index":
+        return tuple(
+            (name, tuple(entry) if isinstance(entry, list) else entry)
+            for name, entry in value.items()
+        )
+    if isinstance(value, str):
+        return value
+    if isinstance(value, list) and all(isinstance(line, str) for line in value):
+        return finder.find(value)
+    return copy.deepcopy(value)
+
+
+def _thaw_section(docstring, key, value):
+    if key in _PARAM_SECTIONS:
+        return [param.thaw(docstring) for param in value]
+    if key == "See Also":
+        return [
+            ([tuple(func) for func in funcs], _thaw_lines(docstring, desc))
+            for funcs, desc in value
+        ]
+    if key == "index":
+        return {
+            name: list(entry) if isinstance(entry, tuple) else entry
+            for name, entry in value
+        }
+    if isinstance(value, str):
+        return value
+    if isinstance(value, _Span | tuple):
+        return _thaw_lines(docstring, value)
+    return copy.deepcopy(value)
+
+
+class FrozenDocString(Mapping):
+    """
+    A compact, read-only copy of a parsed docstring.
+
+    Only the sections that differ from their default are stored. Names and
+    types are interned, and descriptions are stored as spans of the original
+    docstring where possible. The sections are copied back to the structures
+    of :class:`NumpyDocString` when read.
+
+    Parameters
+    ----------
+    doc : NumpyDocString
+        The parsed docstring.
+
+    See Also
+    --------
+    NumpyDocString.freeze
+    """
+
+    __slots__ = ("_defaults", "_sections", "docstring")
+
+    def __init__(self, doc):
+        finder = _SpanFinder(doc._docstring)
+        sections = []
+        for key in doc.sections:
+            if key not in doc._parsed_data:
+                continue  # never set, so it has its default value
+            value = doc[key]
+            if value != doc.sections[key]:
+                sections.append((sys.intern(key), _freeze_section(key, value, finder)))
+        self.docstring = doc._docstring
+        self._defaults = doc.sections
+        self._sections = tuple(sections)
+
+    def __getitem__(self, key):
+        for name, value in self._sections:
+            if name == key:
+                return _thaw_section(self.docstring, key, value)
+        return copy.deepcopy(self._defaults[key])
+
+    def __iter__(self):
+        return iter(self._defaults)
+
+    def __len__(self):
+        return len(self._defaults)
+
+
+class _SignatureDoc(NumpyDocString):
+    """Only parse the signature and summary of a docstring."""
+
+    def _parse(self):
+        self._doc.reset()
+        self._parse_summary()
+
+
+@functools.lru_cache(maxsize=2000)
+def extract_signature(docstring):
+    """Extract the signature given at the start of a docstring, if any.
+
+    This is equivalent to ``NumpyDocString(docstring)["Signature"]``, but only
+    the summary block is scanned. The other sections are not parsed, and no
+    class members are looked up. Results are memoized by docstring text.
+
+    Parameters
+    ----------
+    docstring : str
+        The docstring to scan.
+
+    Returns
+    -------
+    str
+        The signature, or an empty string if the docstring has none.
+    """
+    return _SignatureDoc(docstring)["Signature"]
+
+
 class FunctionDoc(NumpyDocString):
     def __init__(self, func, role="func", doc=None, config=None):
         self._f = func
@@ -626,6 +952,92 @@ class ObjDoc(NumpyDocString):
         NumpyDocString.__init__(self, doc, config=config)
 
 
+# Member kinds per class, see _class_member_kinds. Entries are dropped along
+# with their class; classes are assumed not to change once documented.
+_OWN_MEMBER_KINDS = weakref.WeakKeyDictionary()
+_MEMBER_KINDS = weakref.WeakKeyDictionary()
+
+
+def _cached_per_class(cache, klass, compute):
+    try:
+        return cache[klass]
+    except KeyError:
+        kinds = cache[klass] = compute(klass)
+        return kinds
+    except TypeError:  # e.g. a metaclass making classes unhashable
+        return compute(klass)
+
+
+def _member_kind(value):
+    """Tell whether a class attribute is listed as a method and/or a property."""
+    return (
+        isinstance(value, Callable),
+        value is None
+        or isinstance(value, property | cached_property)
+        or inspect.isdatadescriptor(value),
+    )
+
+
+def _own_member_kinds(klass):
+    kinds = {}
+    for name, raw_value in vars(klass).items():
+        try:
+            value = getattr(klass, name)
+        except AttributeError:
+            value = raw_value
+        kind = _member_kind(value)
+        if any(kind):
+            kinds[name] = kind
+    return kinds
+
+
+def _member_kinds(cls):
+    # Reuse the entries of the bases, each classified once
+    inherited = {}
+    for klass in reversed(inspect.getmro(cls)):
+        inherited.update(_cached_per_class(_OWN_MEMBER_KINDS, klass, _own_member_kinds))
+
+    names = set(dir(cls))
+    # Like inspect.getmembers, also list e.g. the name and value of enums
+    names.update(
+        name
+        for base in cls.__bases__
+        for name, value in vars(base).items()
+        if isinstance(value, types.DynamicClassAttribute)
+    )
+    kinds = {}
+    for name in sorted(names):
+        if name in inherited:
+            kinds[name] = inherited[name]
+            continue
+        # Not defined by the class or its bases, e.g. listed by a metaclass
+        try:
+            kind = _member_kind(getattr(cls, name))
+        except AttributeError:
+            continue
+        if any(kind):
+            kinds[name] = kind
+    return kinds
+
+
+def _class_member_kinds(cls):
+    """
+    Classify the members of a class in a single pass.
+
+    Parameters
+    ----------
+    cls : type
+        The class.
+
+    Returns
+    -------
+    dict
+        Maps the names of the members, sorted, to a pair of booleans telling
+        whether the member is listed as a method and as a property.
+    """
+    return _cached_per_class(_MEMBER_KINDS, cls, _member_kinds)
+
+
 class ClassDoc(NumpyDocString):
     extra_public_methods = ["__call__"]
 
@@ -673,28 +1085,35 @@ class ClassDoc(NumpyDocString):
             _exclude = ALL
 
         if config.get("show_class_members", True) and _exclude is not ALL:
-
-            def splitlines_x(s):
-                if not s:
-                    return []
-                else:
-                    return s.splitlines()
-
             for field, items in [
                 ("Methods", self.methods),
                 ("Attributes", self.properties),
             ]:
                 if not self[field]:
-                    doc_list = []
-                    for name in sorted(items):
-                        if name in _exclude or (_members and name not in _members):
-                            continue
-                        try:
-                            doc_item = pydoc.getdoc(getattr(self._cls, name))
-                            doc_list.append(Parameter(name, "", splitlines_x(doc_item)))
-                        except AttributeError:
-                            pass  # method doesn't exist
-                    self[field] = doc_list
+                    self[field] = [
+                        name
+                        for name in items
+                        if not (name in _exclude or (_members and name not in _members))
+                    ]
+                    # The docstrings of the members are only looked up when
+                    # the section is used, e.g. rendered.
+                    self._unparsed[field] = self._member_params
+
+    def _member_params(self, names):
+        def splitlines_x(s):
+            if not s:
+                return []
+            else:
+                return s.splitlines()
+
+        doc_list = []
+        for name in names:
+            try:
+                doc_item = pydoc.getdoc(getattr(self._cls, name))
+                doc_list.append(Parameter(name, "", splitlines_x(doc_item)))
+            except AttributeError:
+                pass  # method doesn't exist
+        return doc_list
 
     @property
     def methods(self):
@@ -702,10 +1121,10 @@ class ClassDoc(NumpyDocString):
             return []
         return [
             name
-            for name, func in inspect.getmembers(self._cls)
+            for name, (is_method, _) in _class_member_kinds(self._cls).items()
             if (
-                (not name.startswith("_") or name in self.extra_public_methods)
-                and isinstance(func, Callable)
+                is_method
+                and (not name.startswith("_") or name in self.extra_public_methods)
                 and self._is_show_member(name)
             )
         ]
@@ -716,15 +1135,11 @@ class ClassDoc(NumpyDocString):
             return []
         return [
             name
-            for name, func in inspect.getmembers(self._cls)
+            for name, (_, is_property) in _class_member_kinds(self._cls).items()
             if (
-                not name.startswith("_")
+                is_property
+                and not name.startswith("_")
                 and not self._should_skip_member(name, self._cls)
-                and (
-                    func is None
-                    or isinstance(func, property | cached_property)
-                    or inspect.isdatadescriptor(func)
-                )
                 and self._is_show_member(name)
             )
         ]
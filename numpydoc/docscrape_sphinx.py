@@ -1,8 +1,10 @@
+import functools
 import inspect
 import os
 import pydoc
 import re
 import textwrap
+import weakref
 
 from jinja2 import FileSystemLoader
 from jinja2.sandbox import SandboxedEnvironment
@@ -10,10 +12,139 @@ from sphinx.jinja2glue import BuiltinTemplateLoader
 
 from .docscrape import ClassDoc, FunctionDoc, NumpyDocString, ObjDoc
 from .docscrape import get_doc_object as get_doc_object_orig
+from .spans import parse_spans
 from .xref import make_xref
 
 IMPORT_MATPLOTLIB_RE = r"\b(import +matplotlib|from +matplotlib +import)\b"
 
+TEMPLATE_DIRS = [os.path.join(os.path.dirname(__file__), "templates")]
+
+# Compiled templates, per Sphinx builder. With parallel reads, each worker
+# process gets its own copy.
+_builder_templates = weakref.WeakKeyDictionary()
+
+
+@functools.cache
+def _get_default_template():
+    template_loader = FileSystemLoader(TEMPLATE_DIRS)
+    template_env = SandboxedEnvironment(loader=template_loader)
+    return template_env.get_template("numpydoc_docstring.rst")
+
+
+def _get_template(builder=None):
+    """Get the compiled docstring template, creating it once per builder.
+
+    Parameters
+    ----------
+    builder : sphinx.builders.Builder, optional
+        The builder whose template search path (``templates_path`` and the
+        theme) is used. If None, only the templates shipped with numpydoc
+        are used.
+
+    Returns
+    -------
+    jinja2.Template
+        The ``numpydoc_docstring.rst`` template.
+    """
+    if builder is None:
+        return _get_default_template()
+    try:
+        return _builder_templates[builder]
+    except KeyError:
+        pass
+    template_loader = BuiltinTemplateLoader()
+    template_loader.init(builder, dirs=TEMPLATE_DIRS)
+    template_env = SandboxedEnvironment(loader=template_loader)
+    template = template_env.get_template("numpydoc_docstring.rst")
+    _builder_templates[builder] = template
+    return template
+
+
+# The section of the docstring rendered in each variable of the template
+_TEMPLATE_SECTIONS = {
+    "signature": "Signature",
+    "index": "index",
+    "summary": "Summary",
+    "extended_summary": "Extended Summary",
+    "parameters": "Parameters",
+    "attributes": "Attributes",
+    "methods": "Methods",
+    "returns": "Returns",
+    "yields": "Yields",
+    "receives": "Receives",
+    "other_parameters": "Other Parameters",
+    "raises": "Raises",
+    "warns": "Warns",
+    "warnings": "Warnings",
+    "see_also": "See Also",
+    "notes": "Notes",
+    "references": "References",
+    "examples": "Examples",
+}
+
+# The variables rendered as a field list, by _str_param_list or _str_returns
+_FIELD_LIST_VARIABLES = frozenset(
+    [
+        "parameters",
+        "attributes",
+        "returns",
+        "yields",
+        "receives",
+        "other_parameters",
+        "raises",
+        "warns",
+    ]
+)
+
+
+def _match_lines(lines, texts, first, stop):
+    """
+    Find the lines of a docstring that rendered lines were copied from.
+
+    Each nonblank line is matched to the next line of the docstring with the
+    same stripped text, so that the matches are in order.
+
+    Parameters
+    ----------
+    lines : list of str
+        The rendered lines.
+    texts : list of str
+        The stripped lines of the docstring.
+    first, stop : int
+        The range of lines of the docstring to search.
+
+    Returns
+    -------
+    list of int or None
+        The line of the docstring of each rendered line, or None if it was
+        not copied from the docstring.
+    """
+    origins = []
+    for line in lines:
+        origin = None
+        text = line.strip()
+        if text:
+            try:
+                origin = texts.index(text, first, stop)
+            except ValueError:
+                pass
+            else:
+                first = origin + 1
+        origins.append(origin)
+    return origins
+
+
+def _fill_origins(origins):
+    """Give the lines added by the renderer the origin of the line before."""
+    last = next((origin for origin in origins if origin is not None), 0)
+    filled = []
+    for origin in origins:
+        if origin is None:
+            origin = last
+        filled.append(origin)
+        last = origin
+    return filled
+
 
 class SphinxDocString(NumpyDocString):
     def __init__(self, docstring, config=None):
@@ -29,14 +160,18 @@ class SphinxDocString(NumpyDocString):
         self.xref_param_type = config.get("xref_param_type", False)
         self.xref_aliases = config.get("xref_aliases", dict())
         self.xref_ignore = config.get("xref_ignore", set())
+        self.xref_resolver = config.get("xref_resolver", None)
         self.template = config.get("template", None)
         if self.template is None:
-            template_dirs = [os.path.join(os.path.dirname(__file__), "templates")]
-            template_loader = FileSystemLoader(template_dirs)
-            template_env = SandboxedEnvironment(loader=template_loader)
-            self.template = template_env.get_template("numpydoc_docstring.rst")
+            self.template = _get_template()
 
     # string conversion routines
+
+    def _make_xref(self, param_type):
+        if self.xref_resolver is not None:
+            return self.xref_resolver(param_type)
+        return make_xref(param_type, self.xref_aliases, self.xref_ignore)
+
     def _str_header(self, name):
         return [".. rubric:: " + name, ""]
 
@@ -69,9 +204,7 @@ class SphinxDocString(NumpyDocString):
             for param in self[name]:
                 param_type = param.type
                 if param_type and self.xref_param_type:
-                    param_type = make_xref(
-                        param_type, self.xref_aliases, self.xref_ignore
-                    )
+                    param_type = self._make_xref(param_type)
                 if param.name:
                     out += self._str_indent(
                         [named_fmt % (param.name.strip(), param_type)]
@@ -205,9 +338,7 @@ class SphinxDocString(NumpyDocString):
                 if param_type:
                     param_type = param.type
                     if self.xref_param_type:
-                        param_type = make_xref(
-                            param_type, self.xref_aliases, self.xref_ignore
-                        )
+                        param_type = self._make_xref(param_type)
                     parts.append(param_type)
                 out += self._str_indent([" : ".join(parts)])
 
@@ -352,8 +483,8 @@ class SphinxDocString(NumpyDocString):
         else:
             return self._str_section("Examples")
 
-    def __str__(self, indent=0, func_role="obj"):
-        ns = {
+    def _str_namespace(self, func_role):
+        return {
             "signature": self._str_signature(),
             "index": self._str_index(),
             "summary": self._str_summary(),
@@ -377,11 +508,106 @@ class SphinxDocString(NumpyDocString):
             "references": self._str_references(),
             "examples": self._str_examples(),
         }
-        ns = {k: "\n".join(v) for k, v in ns.items()}
+
+    def __str__(self, indent=0, func_role="obj"):
+        ns = {k: "\n".join(v) for k, v in self._str_namespace(func_role).items()}
 
         rendered = self.template.render(**ns)
         return "\n".join(self._str_indent(rendered.split("\n"), indent))
 
+    def source_map(self, indent=0, func_role="obj"):
+        """
+        Render the docstring along with the line each rendered line comes from.
+
+        Parameters
+        ----------
+        indent : int, optional
+            The number of spaces to indent the rendered lines with.
+        func_role : str, optional
+            The role of the links of the See Also section.
+
+        Returns
+        -------
+        lines : list of str
+            The rendered lines, as split from ``self.__str__(indent, func_role)``.
+        origins : list of int
+            For each rendered line, the line of the docstring it comes from,
+            counting from 0. Section headers and item headers come from their
+            title and name lines. Lines added by the renderer, e.g. blank lines
+            or directives, come from the same line as the line before them.
+        """
+        ns = {
+            key: "\n".join(value).split("\n")
+            for key, value in self._str_namespace(func_role).items()
+        }
+        rendered = self.template.render(
+            **{key: "\n".join(value) for key, value in ns.items()}
+        ).split("\n")
+        texts = [line.strip() for line in self._docstring.split("\n")]
+        spans = parse_spans(self._docstring)
+
+        # Render the template with a placeholder line for each variable to
+        # find out where the lines of each section end up.
+        placeholders = {key: f"\x00{key}\x00" for key in ns}
+        variables = {placeholder: key for key, placeholder in placeholders.items()}
+        lines = []
+        origins = []
+        for line in self.template.render(**placeholders).split("\n"):
+            key = variables.get(line)
+            if key is None:
+                lines.append(line)
+                origins.append(None)
+            else:
+                lines += ns[key]
+                origins += self._section_origins(key, ns[key], spans, texts)
+        if lines != rendered:
+            # The template does more than putting each variable on its own
+            # lines, so only match the lines copied from the docstring.
+            lines = rendered
+            origins = _match_lines(rendered, texts, 0, len(texts))
+        return self._str_indent(lines, indent), _fill_origins(origins)
+
+    def _section_origins(self, key, lines, spans, texts):
+        """Find the lines of the docstring a template variable was rendered from."""
+        section = spans.get(_TEMPLATE_SECTIONS.get(key))
+        if section is None or section.body is None:
+            return [None] * len(lines)
+        body = section.body
+        origins = _match_lines(lines, texts, body.lineno, body.end_lineno + 1)
+        if section.title is not None:
+            origins[0] = section.title.lineno
+
+        if (
+            section.items
+            and key in _FIELD_LIST_VARIABLES
+            and (key != "attributes" or self.attributes_as_param_list)
+        ):
+            # Each item is a line indented by 4 spaces, followed by its
+            # description indented by 8 spaces. Match the description lines
+            # within the item only, as they may repeat in other items.
+            headers = [
+                i
+                for i, line in enumerate(lines)
+                if line.startswith("    ") and line[4:5].strip()
+            ]
+            if len(headers) == len(section.items):
+                stops = [*headers[1:], len(lines)]
+                for item, start, stop in zip(
+                    section.items, headers, stops, strict=True
+                ):
+                    origins[start] = (item.name or item.type).lineno
+                    desc = item.desc
+                    if desc is None:
+                        origins[start + 1 : stop] = [None] * (stop - start - 1)
+                    else:
+                        origins[start + 1 : stop] = _match_lines(
+                            lines[start + 1 : stop],
+                            texts,
+                            desc.lineno,
+                            desc.end_lineno + 1,
+                        )
+        return origins
+
 
 class SphinxFunctionDoc(SphinxDocString, FunctionDoc):
     def __init__(self, obj, doc=None, config=None):
@@ -411,14 +637,7 @@ def get_doc_object(obj, what=None, doc=None, config=None, builder=None):
     if config is None:
         config = {}
 
-    template_dirs = [os.path.join(os.path.dirname(__file__), "templates")]
-    if builder is not None:
-        template_loader = BuiltinTemplateLoader()
-        template_loader.init(builder, dirs=template_dirs)
-    else:
-        template_loader = FileSystemLoader(template_dirs)
-    template_env = SandboxedEnvironment(loader=template_loader)
-    config["template"] = template_env.get_template("numpydoc_docstring.rst")
+    config["template"] = _get_template(builder)
 
     return get_doc_object_orig(
         obj,
@@ -0,0 +1,104 @@
+"""On-disk cache for the results of the numpydoc validation hook."""
+
+import hashlib
+import os
+from pathlib import Path
+
+from ..cache import entry_path, fingerprint, read_entry, write_entry
+
+CACHE_DIR_NAME = ".numpydoc_cache"
+
+
+def _config_fingerprint(config: dict) -> str:
+    """
+    Hash the parsed hook configuration.
+
+    Parameters
+    ----------
+    config : dict
+        Configuration options, as returned by ``parse_config``.
+
+    Returns
+    -------
+    str
+        A hex digest that changes whenever an option affecting the findings does.
+    """
+    return fingerprint(config)
+
+
+class LintCache:
+    """
+    Persist the findings of each file, keyed by the hash of its contents.
+
+    An entry is only reused when the file contents, the numpydoc version and
+    the effective configuration all match those used to produce it.
+
+    Parameters
+    ----------
+    cache_dir : os.PathLike
+        The directory holding the cache entries. It is created on first write.
+    config : dict
+        Configuration options for reviewing flagged issues, as returned
+        by ``parse_config``.
+    """
+
+    def __init__(self, cache_dir: os.PathLike, config: dict) -> None:
+        self.cache_dir: Path = Path(cache_dir)
+        self._config_key: str = _config_fingerprint(config)
+        self._digests: dict[str, str] = {}
+
+    def _entry_path(self, filepath: str) -> Path:
+        return entry_path(self.cache_dir, fingerprint(self._config_key, str(filepath)))
+
+    def _digest(self, filepath: str) -> str | None:
+        if filepath not in self._digests:
+            try:
+                with open(filepath, "rb") as file:
+                    contents = file.read()
+            except OSError:
+                return None
+            self._digests[filepath] = hashlib.sha256(contents).hexdigest()
+        return self._digests[filepath]
+
+    def get(self, filepath: str) -> "list[list[str]] | None":
+        """
+        Look up the findings stored for a file.
+
+        Parameters
+        ----------
+        filepath : str
+            The path of the file, as passed to the hook.
+
+        Returns
+        -------
+        list[list[str]] or None
+            The stored findings, or None if there is no entry for the current
+            contents of the file.
+        """
+        digest = self._digest(filepath)
+        if digest is None:
+            return None
+        entry = read_entry(self._entry_path(filepath))
+        if not isinstance(entry, dict) or entry.get("digest") != digest:
+            return None
+        return entry.get("findings")
+
+    def set(self, filepath: str, findings: "list[list[str]]") -> None:
+        """
+        Store the findings for a file.
+
+        Parameters
+        ----------
+        filepath : str
+            The path of the file, as passed to the hook.
+        findings : list[list[str]]
+            The findings reported for the file.
+        """
+        digest = self._digest(filepath)
+        if digest is None:
+            return
+        write_entry(
+            self.cache_dir,
+            self._entry_path(filepath),
+            {"digest": digest, "findings": findings},
+        )
@@ -46,3 +46,31 @@ def find_project_root(srcs: Sequence[str]):
             return dir, "version control"
 
     return dir, "file system root"
+
+
+def resolve_jobs(jobs: int | str | None) -> int:
+    """
+    Return the number of worker processes to use.
+
+    Parameters
+    ----------
+    jobs : int, str or None
+        The requested number of jobs. ``None`` or ``1`` means run serially,
+        while ``"auto"`` or ``0`` means use one job per available CPU.
+
+    Returns
+    -------
+    int
+        The number of worker processes, always at least 1.
+    """
+    if jobs is None:
+        return 1
+    if isinstance(jobs, str):
+        if jobs.lower() != "auto":
+            raise ValueError(f"jobs must be a positive integer or 'auto', got {jobs!r}")
+        jobs = 0
+    if jobs < 0:
+        raise ValueError(f"jobs must be a positive integer or 'auto', got {jobs!r}")
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    return jobs
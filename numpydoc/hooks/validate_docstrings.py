@@ -2,20 +2,104 @@
 
 import ast
 import configparser
+import functools
 import os
 import re
 import sys
+import tokenize
 
 try:
     import tomllib
 except ImportError:
     import tomli as tomllib
 
+from functools import cached_property
 from pathlib import Path
 from typing import Any, Dict, List, Tuple, Union
 
 from .. import docscrape, validate
-from .utils import find_project_root
+from .cache import CACHE_DIR_NAME, LintCache
+from .utils import find_project_root, resolve_jobs
+
+
+class SourceContext:
+    """
+    The contents of a file under inspection, read and parsed once.
+
+    The text, its lines, the AST and the inline ignore comments are shared by
+    the :class:`DocstringVisitor` and every :class:`AstValidator` for the file,
+    so that it is read and tokenized only once.
+
+    Parameters
+    ----------
+    filepath : os.PathLike
+        The absolute or relative path to the file.
+    source : str, optional
+        The contents of the file. If not given, they are read from ``filepath``.
+    """
+
+    def __init__(self, filepath: os.PathLike, source: str | None = None) -> None:
+        self.path: Path = Path(filepath).resolve()
+        if source is None:
+            # Honor encoding declarations, as the Python interpreter does.
+            with tokenize.open(filepath) as file:
+                source = file.read()
+        self.text: str = source
+        self.lines: list[str] = source.split("\n")
+        self.tree: ast.Module = ast.parse(source, str(filepath))
+
+    @cached_property
+    def function_facts(self) -> Dict[ast.AST, validate.FunctionFacts]:
+        """
+        Mapping of every function node in :attr:`tree` to its facts.
+
+        See Also
+        --------
+        numpydoc.validate.analyze_functions : Collects the facts in one pass.
+        """
+        return validate.analyze_functions(self.tree)
+
+    @cached_property
+    def ignore_comments(self) -> Dict[int, List[str]]:
+        """
+        Mapping of line number to the checks to ignore via inline comments.
+        """
+        return validate.extract_ignore_validation_comments_from_source(self.text)
+
+    def get_source_segment(self, node: ast.AST) -> str | None:
+        """
+        Get the source code of a node.
+
+        This is equivalent to :func:`ast.get_source_segment`, without splitting
+        the whole file into lines for every node.
+
+        Parameters
+        ----------
+        node : ast.AST
+            A node of :attr:`tree`.
+
+        Returns
+        -------
+        str or None
+            The source code of the node, or None if its location is unknown.
+        """
+        try:
+            if node.end_lineno is None or node.end_col_offset is None:
+                return None
+            lineno = node.lineno - 1
+            end_lineno = node.end_lineno - 1
+            col_offset = node.col_offset
+            end_col_offset = node.end_col_offset
+        except AttributeError:
+            return None
+
+        # Column offsets are in bytes of the UTF-8 encoded line
+        if lineno == end_lineno:
+            line = self.lines[lineno].encode()
+            return line[col_offset:end_col_offset].decode()
+        first = self.lines[lineno].encode()[col_offset:].decode()
+        last = self.lines[end_lineno].encode()[:end_col_offset].decode()
+        return "\n".join([first, *self.lines[lineno + 1 : end_lineno], last])
 
 
 class AstValidator(validate.Validator):
@@ -30,6 +114,11 @@ class AstValidator(validate.Validator):
         The file where the node is defined.
     obj_name : str
         A name for the node to use in the listing of issues for the file as a whole.
+    ancestry : list[ast.AST]
+        The nodes enclosing the node under inspection, starting with the module.
+    source : SourceContext, optional
+        The already parsed contents of ``filename``. If not given, the file is
+        read again.
     """
 
     def __init__(
@@ -39,13 +128,17 @@ class AstValidator(validate.Validator):
         filename: os.PathLike,
         obj_name: str,
         ancestry: list[ast.AST],
+        source: SourceContext | None = None,
     ) -> None:
         self.node: ast.AST = ast_node
         self.raw_doc: str = ast.get_docstring(self.node, clean=False) or ""
         self.clean_doc: str = ast.get_docstring(self.node, clean=True)
-        self.doc: docscrape.NumpyDocString = docscrape.NumpyDocString(self.raw_doc)
+        self.doc: docscrape.NumpyDocString = docscrape.NumpyDocString(
+            self.raw_doc, config={"lazy": True}
+        )
 
-        self._source_file: os.PathLike = Path(filename).resolve()
+        self.source: SourceContext = source or SourceContext(filename)
+        self._source_file: os.PathLike = self.source.path
         self._name: str = obj_name
 
         self.is_class: bool = isinstance(ast_node, ast.ClassDef)
@@ -73,10 +166,7 @@ class AstValidator(validate.Validator):
     def is_generator_function(self) -> bool:
         if not self.is_function_or_method:
             return False
-        for child in ast.iter_child_nodes(self.node):
-            if isinstance(child, ast.Expr) and isinstance(child.value, ast.Yield):
-                return True
-        return False
+        return self.source.function_facts[self.node].yields
 
     @property
     def type(self) -> str:
@@ -98,41 +188,28 @@ class AstValidator(validate.Validator):
 
     @property
     def signature_parameters(self) -> Tuple[str]:
-        def extract_signature(node, parent):
-            args_node = node.args
-            params = []
-            for arg_type in ["posonlyargs", "args", "vararg", "kwonlyargs", "kwarg"]:
-                entries = getattr(args_node, arg_type)
-                if arg_type in ["vararg", "kwarg"]:
-                    if entries and arg_type == "vararg":
-                        params.append(f"*{entries.arg}")
-                    if entries and arg_type == "kwarg":
-                        params.append(f"**{entries.arg}")
-                else:
-                    params.extend([arg.arg for arg in entries])
-            params = tuple(params)
-            if (
-                params
-                and params[0] in {"self", "cls"}
-                and isinstance(parent, ast.ClassDef)
-            ):
-                return params[1:]
-            return params
-
         params = tuple()
         if self.is_function_or_method:
-            params = extract_signature(self.node, self.ancestry[-1])
+            params = self.source.function_facts[self.node].parameters
         elif self.is_class:
             for child in self.node.body:
                 if isinstance(child, ast.FunctionDef) and child.name == "__init__":
-                    params = extract_signature(child, self.node)
+                    params = self.source.function_facts[child].parameters
         return params
 
+    @property
+    def method_returns_something(self) -> bool:
+        if not self.is_function_or_method:
+            return False
+        return self.source.function_facts[self.node].returns_value
+
+    @property
+    def ignore_validation_comments(self) -> Dict[int, List[str]]:
+        return self.source.ignore_comments
+
     @property
     def method_source(self) -> str:
-        with open(self.source_file_name) as file:
-            source = ast.get_source_segment(file.read(), self.node)
-        return source
+        return self.source.get_source_segment(self.node)
 
 
 class DocstringVisitor(ast.NodeVisitor):
@@ -145,15 +222,20 @@ class DocstringVisitor(ast.NodeVisitor):
         The absolute or relative path to the file to inspect.
     config : dict
         Configuration options for reviewing flagged issues.
+    source : SourceContext, optional
+        The already parsed contents of ``filepath``. If not given, the file is
+        read and parsed on creation.
     """
 
     def __init__(
         self,
         filepath: str,
         config: dict,
+        source: SourceContext | None = None,
     ) -> None:
         self.config: dict = config
         self.filepath: str = filepath
+        self.source: SourceContext = source or SourceContext(filepath)
         self.module_name: str = Path(self.filepath).stem
         self.stack: list[ast.AST] = []
         self.findings: list = []
@@ -214,9 +296,11 @@ class DocstringVisitor(ast.NodeVisitor):
         report = validate.validate(
             name,
             AstValidator,
+            checks=self.config["checks"],
             ast_node=node,
             filename=self.filepath,
             ancestry=self.stack[:-1],
+            source=self.source,
         )
         self.findings.extend(
             [
@@ -383,11 +467,11 @@ def process_file(filepath: os.PathLike, config: dict) -> "list[list[str]]":
     list[list[str]]
         A list of [name, check, description] lists for flagged issues.
     """
-    with open(filepath) as file:
-        module_node = ast.parse(file.read(), filepath)
-
-    docstring_visitor = DocstringVisitor(filepath=str(filepath), config=config)
-    docstring_visitor.visit(module_node)
+    source = SourceContext(filepath)
+    docstring_visitor = DocstringVisitor(
+        filepath=str(filepath), config=config, source=source
+    )
+    docstring_visitor.visit(source.tree)
 
     return docstring_visitor.findings
 
@@ -397,6 +481,9 @@ def run_hook(
     *,
     config: Dict[str, Any] | None = None,
     ignore: List[str] | None = None,
+    jobs: int | str | None = None,
+    cache: bool = False,
+    cache_dir: os.PathLike | None = None,
 ) -> int:
     """
     Run the numpydoc validation hook.
@@ -409,25 +496,88 @@ def run_hook(
         Configuration options for reviewing flagged issues.
     ignore : Union[list[str], None], optional
         Checks to ignore in the results.
+    jobs : Union[int, str, None], optional
+        Number of worker processes to spread the files over. ``"auto"`` uses
+        one process per CPU. By default, files are processed serially.
+    cache : bool, optional
+        Whether to reuse the findings of files whose contents have not changed
+        since a previous run with the same configuration. Off by default.
+    cache_dir : Union[os.PathLike, None], optional
+        Directory for the cache. By default, a ``.numpydoc_cache`` directory
+        in the project root is used. Caching is skipped if no project root
+        can be found and no directory is given.
 
     Returns
     -------
     int
         The return status: 1 if issues were found, 0 otherwise.
     """
-    project_root, _ = find_project_root(files)
+    project_root, root_reason = find_project_root(files)
     config_options = parse_config(config or project_root)
     config_options["checks"] -= set(ignore or [])
     exclude_re = config_options["exclude_files"]
 
+    files = [file for file in files if not (exclude_re and exclude_re.match(file))]
+
+    lint_cache = None
+    if cache and (cache_dir or root_reason != "file system root"):
+        lint_cache = LintCache(
+            cache_dir or Path(project_root) / CACHE_DIR_NAME, config_options
+        )
+    cached = [lint_cache.get(file) if lint_cache else None for file in files]
+    uncached = [file for file, hit in zip(files, cached, strict=True) if hit is None]
+    jobs = min(resolve_jobs(jobs), len(uncached))
+    processed = _process_files(uncached, config_options, jobs)
+
     findings = False
-    for file in files:
-        if exclude_re and exclude_re.match(file):
-            continue
-        if file_issues := process_file(file, config_options):
+    for file, file_issues in zip(files, cached, strict=True):
+        if file_issues is None:
+            file_issues = next(processed)
+            if lint_cache:
+                lint_cache.set(file, file_issues)
+        if file_issues:
             findings = True
 
             for line, obj, check, description in file_issues:
                 print(f"\n{line}: {check} {description}", file=sys.stderr)
+    processed.close()
 
     return int(findings)
+
+
+def _process_files(files: List[str], config: dict, jobs: int):
+    """
+    Yield the issues of each file in ``files``, in order.
+
+    Parameters
+    ----------
+    files : list[str]
+        The paths to the files to inspect.
+    config : dict
+        Configuration options for reviewing flagged issues, as returned
+        by :func:`parse_config`.
+    jobs : int
+        Number of worker processes to use. With a single job, the files are
+        processed in the current process.
+
+    Yields
+    ------
+    list[list[str]]
+        The issues found in each file, in the order of ``files``.
+    """
+    if jobs <= 1:
+        for file in files:
+            yield process_file(file, config)
+        return
+
+    # Only imported when needed, to keep the start up of the CLI fast
+    from concurrent.futures import ProcessPoolExecutor
+
+    # The parsed config is handed to the workers as is, so that they don't
+    # have to look up and read the config file again.
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        yield from executor.map(
+            functools.partial(process_file, config=config),
+            files,
+            chunksize=max(1, len(files) // (jobs * 4)),
+        )
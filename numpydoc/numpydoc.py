@@ -17,26 +17,38 @@ It will:
 
 """
 
+import functools
 import hashlib
 import importlib
 import inspect
-import itertools
+import os
 import pydoc
 import re
 import sys
+from collections import defaultdict
 from collections.abc import Callable
 from copy import deepcopy
 from pathlib import Path
 
-from docutils.nodes import Text, citation, comment, inline, reference, section
+from docutils.nodes import (
+    Element,
+    Text,
+    citation,
+    comment,
+    inline,
+    reference,
+    section,
+)
 from sphinx.addnodes import desc_content, pending_xref
 from sphinx.application import Sphinx as SphinxApp
 from sphinx.util import logging
 
 from . import __version__
-from .docscrape_sphinx import get_doc_object
+from .cache import DocstringCache, fingerprint
+from .docscrape import extract_signature
+from .docscrape_sphinx import _get_template, get_doc_object
 from .validate import get_validation_checks, validate
-from .xref import DEFAULT_LINKS
+from .xref import DEFAULT_LINKS, XrefResolver
 
 logger = logging.getLogger(__name__)
 
@@ -56,15 +68,19 @@ def _traverse_or_findall(node, condition, **kwargs):
     )
 
 
+@functools.lru_cache
+def _citation_definition_re(citation_re):
+    """Compile the regexp matching citation definitions like ``.. [1]``."""
+    return re.compile(r"^\s*\.\. +\[(%s)\]" % citation_re, re.IGNORECASE)
+
+
 def rename_references(app: SphinxApp, what, name, obj, options, lines):
     # decorate reference numbers so that there are no duplicates
     # these are later undecorated in the doctree, in relabel_references
+    definition_re = _citation_definition_re(app.config.numpydoc_citation_re)
     references = set()
     for line in lines:
-        line = line.strip()
-        m = re.match(
-            r"^\.\. +\[(%s)\]" % app.config.numpydoc_citation_re, line, re.IGNORECASE
-        )
+        m = definition_re.match(line)
         if m:
             references.add(m.group(1))
 
@@ -74,54 +90,95 @@ def rename_references(app: SphinxApp, what, name, obj, options, lines):
         sha.update(name.encode("utf8"))
         prefix = "R" + sha.hexdigest()[:HASH_LEN]
 
-        for r in references:
-            new_r = prefix + "-" + r
-            for i, line in enumerate(lines):
-                lines[i] = lines[i].replace(f"[{r}]_", f"[{new_r}]_")
-                lines[i] = lines[i].replace(f".. [{r}]", f".. [{new_r}]")
+        # Rename all references in one pass, e.g. "[1]_" and ".. [1]"
+        alternatives = "|".join(
+            re.escape(r) for r in sorted(references, key=len, reverse=True)
+        )
+        reference_re = re.compile(rf"\[({alternatives})\]_|\.\. \[({alternatives})\]")
 
+        def rename(m):
+            if m.group(1) is not None:
+                return f"[{prefix}-{m.group(1)}]_"
+            return f".. [{prefix}-{m.group(2)}]"
 
-def _is_cite_in_numpydoc_docstring(citation_node):
-    # Find DEDUPLICATION_TAG in comment as last node of sibling section
+        lines[:] = [
+            reference_re.sub(rename, line) if "[" in line else line for line in lines
+        ]
 
-    # XXX: I failed to use citation_node.traverse to do this:
-    section_node = citation_node.parent
 
-    def is_docstring_section(node):
-        return isinstance(node, section | desc_content)
+def _is_docstring_section(node):
+    return isinstance(node, section | desc_content)
 
-    while not is_docstring_section(section_node):
-        section_node = section_node.parent
-        if section_node is None:
-            return False
 
-    sibling_sections = itertools.chain(
-        _traverse_or_findall(
-            section_node,
-            is_docstring_section,
-            include_self=True,
-            descend=False,
-            siblings=True,
-        )
+def _has_deduplication_tag(node):
+    return any(
+        isinstance(child, comment)
+        and child.rawsource.strip() == DEDUPLICATION_TAG.strip()
+        for child in node.children
     )
-    for sibling_section in sibling_sections:
-        if not sibling_section.children:
-            continue
 
-        for child in sibling_section.children[::-1]:
-            if not isinstance(child, comment):
-                continue
-
-            if child.rawsource.strip() == DEDUPLICATION_TAG.strip():
-                return True
 
+def _index_doctree(doc):
+    """Index the doctree nodes needed to relabel references, in one pass.
+
+    Parameters
+    ----------
+    doc : docutils.nodes.document
+        The doctree.
+
+    Returns
+    -------
+    numpydoc_sections : set of int
+        The ids of the sections whose citations come from a numpydoc
+        docstring, i.e. the sections which, or any of whose following sibling
+        sections, end with the deduplication tag.
+    citations : list of docutils.nodes.citation
+        The citation nodes, in document order.
+    xrefs : dict
+        Maps the ``[label]`` text of pending_xref nodes to the nodes.
+    """
+    numpydoc_sections = set()
+    citations = []
+    xrefs = defaultdict(list)
+    for node in _traverse_or_findall(doc, Element):
+        if isinstance(node, citation):
+            citations.append(node)
+        elif isinstance(node, pending_xref) and node.children:
+            xrefs[node[0].astext()].append(node)
+        # Walk the children backwards to know if a following sibling section
+        # has the deduplication tag.
+        tagged = False
+        for child in reversed(node.children):
+            if isinstance(child, section | desc_content):
+                tagged = tagged or _has_deduplication_tag(child)
+                if tagged:
+                    numpydoc_sections.add(id(child))
+    return numpydoc_sections, citations, xrefs
+
+
+def _is_within(node, ancestor):
+    while node is not None:
+        if node is ancestor:
+            return True
+        node = node.parent
     return False
 
 
+def _is_cite_in_numpydoc_docstring(citation_node, numpydoc_sections):
+    # Find the enclosing section, marked by _index_doctree
+    section_node = citation_node.parent
+    while not _is_docstring_section(section_node):
+        section_node = section_node.parent
+        if section_node is None:
+            return False
+    return id(section_node) in numpydoc_sections
+
+
 def relabel_references(app: SphinxApp, doc):
+    numpydoc_sections, citations, xrefs = _index_doctree(doc)
     # Change 'hash-ref' to 'ref' in label text
-    for citation_node in _traverse_or_findall(doc, citation):
-        if not _is_cite_in_numpydoc_docstring(citation_node):
+    for citation_node in citations:
+        if not _is_cite_in_numpydoc_docstring(citation_node, numpydoc_sections):
             continue
         label_node = citation_node[0]
         prefix, _, new_label = label_node[0].astext().partition("-")
@@ -133,29 +190,27 @@ def relabel_references(app: SphinxApp, doc):
             ref = doc.ids[id_]
             ref_text = ref[0]
 
-            # Sphinx has created pending_xref nodes with [reftext] text.
-            def matching_pending_xref(node):
-                return (
-                    isinstance(node, pending_xref)
-                    and node[0].astext() == f"[{ref_text}]"
-                )
-
-            for xref_node in _traverse_or_findall(ref.parent, matching_pending_xref):
-                xref_node.replace(xref_node[0], Text(f"[{new_text}]"))
+            # Sphinx has created pending_xref nodes with [reftext] text, anywhere
+            # below the parent of the reference.
+            for xref_node in xrefs.get(f"[{ref_text}]", ()):
+                if _is_within(xref_node, ref.parent):
+                    xref_node.replace(xref_node[0], Text(f"[{new_text}]"))
             ref.replace(ref_text, new_text.copy())
 
 
 def clean_backrefs(app: SphinxApp, doc, docname):
     # only::latex directive has resulted in citation backrefs without reference
+    # The citations and the ids they may refer to are found in a single
+    # traversal of the doctree.
     known_ref_ids = set()
-    for ref in _traverse_or_findall(doc, reference, descend=True):
-        for id_ in ref["ids"]:
-            known_ref_ids.add(id_)
-    # some extensions produce backrefs to inline elements
-    for ref in _traverse_or_findall(doc, inline, descend=True):
-        for id_ in ref["ids"]:
-            known_ref_ids.add(id_)
-    for citation_node in _traverse_or_findall(doc, citation, descend=True):
+    citation_nodes = []
+    for node in _traverse_or_findall(doc, Element):
+        if isinstance(node, citation):
+            citation_nodes.append(node)
+        # some extensions produce backrefs to inline elements
+        elif isinstance(node, reference | inline):
+            known_ref_ids.update(node["ids"])
+    for citation_node in citation_nodes:
         # remove backrefs to non-existent refs
         citation_node["backrefs"] = [
             id_ for id_ in citation_node["backrefs"] if id_ in known_ref_ids
@@ -165,7 +220,38 @@ def clean_backrefs(app: SphinxApp, doc, docname):
 DEDUPLICATION_TAG = "    !! processed by numpydoc !!"
 
 
-def mangle_docstrings(app: SphinxApp, what, name, obj, options, lines):
+@functools.cache
+def _module_package_path(module):
+    """Get the path of `module` relative to its top-level package.
+
+    This is computed once per module, and shared by all of its members.
+
+    Parameters
+    ----------
+    module : module
+        The module defining a documented object.
+
+    Returns
+    -------
+    str or None
+        The path, e.g. ``"sub/module.py"``, or None if it cannot be determined.
+    """
+    try:
+        mod_path = Path(module.__file__)
+        package_rel_path = mod_path.parent.relative_to(
+            Path(importlib.import_module(module.__name__.split(".")[0]).__file__).parent
+        ).as_posix()
+    except AttributeError:
+        return None
+    module_file = mod_path.as_posix().replace(mod_path.parent.as_posix(), "")
+    return package_rel_path + module_file
+
+
+def mangle_docstrings(app: SphinxApp, what, name, obj, options, lines, origins=None):
+    # If given, origins is kept as the line of the docstring each line of
+    # lines comes from, for the mangling directives.
+    if origins is not None:
+        origins[:] = range(len(lines))
     if DEDUPLICATION_TAG in lines:
         return
     show_inherited_class_members = app.config.numpydoc_show_inherited_class_members
@@ -184,6 +270,7 @@ def mangle_docstrings(app: SphinxApp, what, name, obj, options, lines):
         "xref_param_type": app.config.numpydoc_xref_param_type,
         "xref_aliases": app.config.numpydoc_xref_aliases_complete,
         "xref_ignore": app.config.numpydoc_xref_ignore,
+        "xref_resolver": getattr(app.config, "numpydoc_xref_resolver", None),
     }
     # TODO: Find a cleaner way to take care of this change away from dict
     # https://github.com/sphinx-doc/sphinx/issues/13942
@@ -197,7 +284,10 @@ def mangle_docstrings(app: SphinxApp, what, name, obj, options, lines):
         # Strip top title
         pattern = "^\\s*[#*=]{4,}\\n[a-z0-9 -]+\\n[#*=]{4,}\\s*"
         title_re = re.compile(pattern, re.IGNORECASE | re.DOTALL)
+        n_lines = len(lines)
         lines[:] = title_re.sub("", u_NL.join(lines)).split(u_NL)
+        if origins is not None:
+            origins[:] = range(n_lines - len(lines), n_lines)
     else:
         # Test the obj to find the module path, and skip the check if it's path is matched by
         # numpydoc_validation_exclude_files
@@ -206,78 +296,159 @@ def mangle_docstrings(app: SphinxApp, what, name, obj, options, lines):
             and app.config.numpydoc_validation_checks
         ):
             excluder = app.config.numpydoc_validation_files_excluder
-            module = inspect.getmodule(obj)
-            try:
-                # Get the module relative path from the name
-                if module:
-                    mod_path = Path(module.__file__)
-                    package_rel_path = mod_path.parent.relative_to(
-                        Path(
-                            importlib.import_module(
-                                module.__name__.split(".")[0]
-                            ).__file__
-                        ).parent
-                    ).as_posix()
-                    module_file = mod_path.as_posix().replace(
-                        mod_path.parent.as_posix(), ""
-                    )
-                    path = package_rel_path + module_file
-                else:
-                    path = None
-            except AttributeError as e:
-                path = None
+            module = inspect.getmodule(obj) if obj is not None else None
+            path = _module_package_path(module) if module else None
 
             if path and excluder and excluder.search(path):
                 # Skip validation for this object.
                 return
 
-        try:
-            doc = get_doc_object(
-                obj, what, u_NL.join(lines), config=cfg, builder=app.builder
-            )
-            lines[:] = str(doc).split(u_NL)
-        except Exception:
-            logger.error("[numpydoc] While processing docstring for %r", name)
-            raise
-
+        report = None
+        validate_doc = False
         if app.config.numpydoc_validation_checks:
             # If the user has supplied patterns to ignore via the
             # numpydoc_validation_exclude config option, skip validation for
             # any objs whose name matches any of the patterns
             excluder = app.config.numpydoc_validation_excluder
-            exclude_from_validation = excluder.search(name) if excluder else False
-            if not exclude_from_validation:
-                # TODO: Currently, all validation checks are run and only those
-                # selected via config are reported. It would be more efficient to
-                # only run the selected checks.
-                report = validate(doc)
-                errors = [
-                    err
-                    for err in report["errors"]
-                    if not (
-                        (
-                            overrides := app.config.numpydoc_validation_overrides.get(
-                                err[0]
-                            )
-                        )
-                        and re.search(overrides, report["docstring"])
-                    )
-                ]
-                if {err[0] for err in errors} & app.config.numpydoc_validation_checks:
-                    msg = (
-                        f"[numpydoc] Validation warnings while processing "
-                        f"docstring for {name!r}:\n"
-                    )
-                    for err in errors:
-                        if err[0] in app.config.numpydoc_validation_checks:
-                            msg += f"  {err[0]}: {err[1]}\n"
-                    logger.warning(msg)
+            validate_doc = not (excluder.search(name) if excluder else False)
+
+        cache = getattr(app.config, "numpydoc_docstring_cache", None)
+        cache_key = entry = None
+        # The rendering of classes and modules depends on their members, and
+        # the validation of __init__ (GL08) on the docstring of the class, not
+        # only on their own docstring, so they are always processed again.
+        if (
+            cache is not None
+            and what not in ("module", "class", "exception")
+            and name.rpartition(".")[2] != "__init__"
+        ):
+            cache_key = _docstring_cache_key(
+                app, what, name, obj, cfg, lines, validate_doc
+            )
+            entry = cache.get(cache_key)
+            if entry is not None and validate_doc and entry.get("report") is None:
+                entry = None
+            if entry is not None and origins is not None and "origins" not in entry:
+                entry = None
+
+        if entry is not None:
+            lines[:] = entry["lines"]
+            report = entry.get("report")
+            if origins is not None:
+                origins[:] = entry["origins"]
+        else:
+            try:
+                doc = get_doc_object(
+                    obj, what, u_NL.join(lines), config=cfg, builder=app.builder
+                )
+                if origins is None:
+                    lines[:] = str(doc).split(u_NL)
+                else:
+                    lines[:], origins[:] = doc.source_map()
+            except Exception:
+                logger.error("[numpydoc] While processing docstring for %r", name)
+                raise
+
+            if validate_doc:
+                full_report = validate(
+                    doc, checks=app.config.numpydoc_validation_checks
+                )
+                report = {
+                    "docstring": full_report["docstring"],
+                    "errors": [list(err) for err in full_report["errors"]],
+                }
+            if cache_key is not None:
+                entry = {"lines": lines, "report": report}
+                if origins is not None:
+                    entry["origins"] = origins
+                cache.set(cache_key, entry)
+
+        if validate_doc:
+            errors = [
+                err
+                for err in report["errors"]
+                if not (
+                    (overrides := app.config.numpydoc_validation_overrides.get(err[0]))
+                    and re.search(overrides, report["docstring"])
+                )
+            ]
+            if {err[0] for err in errors} & app.config.numpydoc_validation_checks:
+                msg = (
+                    f"[numpydoc] Validation warnings while processing "
+                    f"docstring for {name!r}:\n"
+                )
+                for err in errors:
+                    if err[0] in app.config.numpydoc_validation_checks:
+                        msg += f"  {err[0]}: {err[1]}\n"
+                logger.warning(msg)
 
     # call function to replace reference numbers so that there are no
     # duplicates
     rename_references(app, what, name, obj, options, lines)
 
     lines += ["..", DEDUPLICATION_TAG]
+    if origins is not None:
+        origins += [origins[-1] if origins else 0] * 2
+
+
+def _cache_value(value):
+    """Convert a configuration value to a stable, JSON-serializable form."""
+    if isinstance(value, dict):
+        return {str(key): _cache_value(val) for key, val in value.items()}
+    if isinstance(value, set | frozenset):
+        return sorted(repr(val) for val in value)
+    if isinstance(value, list | tuple):
+        return [_cache_value(val) for val in value]
+    if value is None or isinstance(value, str | int | float | bool):
+        return value
+    # Sentinels such as autodoc's ALL; avoid reprs with memory addresses
+    return type(value).__qualname__
+
+
+@functools.lru_cache
+def _file_digest(filename, mtime_ns):
+    with open(filename, "rb") as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+
+def _object_source(obj):
+    """Get what validating `obj` depends on besides its docstring."""
+    try:
+        return inspect.getsource(obj)
+    except (OSError, TypeError):
+        pass
+    try:
+        return str(inspect.signature(obj))
+    except (ValueError, TypeError):
+        return None
+
+
+def _docstring_cache_key(app, what, name, obj, cfg, lines, validate_doc):
+    """Compute the `numpydoc_cache_dir` key of a docstring.
+
+    The key covers the docstring, the object kind, the effective
+    configuration, the template and the numpydoc version. When the docstring
+    is validated, it also covers the name and source of the object, as well
+    as the validation checks.
+    """
+    template = _get_template(app.builder)
+    template_key = None
+    if template.filename and (template_path := Path(template.filename)).is_file():
+        template_key = _file_digest(template_path, template_path.stat().st_mtime_ns)
+    parts = [
+        what,
+        "\n".join(lines),
+        _cache_value({k: v for k, v in cfg.items() if k != "xref_resolver"}),
+        app.config.numpydoc_citation_re,
+        template_key,
+    ]
+    if validate_doc:
+        parts += [
+            name,
+            _object_source(obj),
+            sorted(app.config.numpydoc_validation_checks),
+        ]
+    return fingerprint(*parts)
 
 
 def mangle_signature(app: SphinxApp, what, name, obj, options, sig, retann):
@@ -293,8 +464,14 @@ def mangle_signature(app: SphinxApp, what, name, obj, options, sig, retann):
 
     if not hasattr(obj, "__doc__"):
         return None
-    doc = get_doc_object(obj, config={"show_class_members": False})
-    sig = doc["Signature"] or _clean_text_signature(
+    # Only the summary is needed, so skip parsing the whole docstring (which
+    # mangle_docstrings does anyway) and listing the members of classes.
+    # This retrieves the same text get_doc_object would parse.
+    if inspect.isclass(obj) or not isinstance(obj, Callable):
+        docstring = pydoc.getdoc(obj)
+    else:
+        docstring = inspect.getdoc(obj) or ""
+    sig = extract_signature(docstring) or _clean_text_signature(
         getattr(obj, "__text_signature__", None)
     )
     if sig:
@@ -342,6 +519,7 @@ def setup(app: SphinxApp, get_doc_object_=get_doc_object):
     app.add_config_value("numpydoc_validation_exclude", set(), False)
     app.add_config_value("numpydoc_validation_exclude_files", set(), False)
     app.add_config_value("numpydoc_validation_overrides", dict(), False)
+    app.add_config_value("numpydoc_cache_dir", None, False, types=[str, type(None)])
 
     # Extra mangling domains
     app.add_domain(NumpyPythonDomain)
@@ -364,6 +542,16 @@ def update_config(app: SphinxApp, config=None):
         if key not in numpydoc_xref_aliases_complete:
             numpydoc_xref_aliases_complete[key] = value
     config.numpydoc_xref_aliases_complete = numpydoc_xref_aliases_complete
+    # Resolve each distinct parameter type only once per build
+    config.numpydoc_xref_resolver = XrefResolver(
+        numpydoc_xref_aliases_complete, config.numpydoc_xref_ignore
+    )
+
+    config.numpydoc_docstring_cache = None
+    if config.numpydoc_cache_dir:
+        config.numpydoc_docstring_cache = DocstringCache(
+            Path(app.confdir or os.curdir, config.numpydoc_cache_dir)
+        )
 
     # Processing to determine whether numpydoc_validation_checks is treated
     # as a blocklist or allowlist
@@ -409,9 +597,10 @@ def update_config(app: SphinxApp, config=None):
 # Docstring-mangling domains
 # ------------------------------------------------------------------------------
 
-from docutils.statemachine import ViewList
+from docutils.statemachine import StringList, ViewList
 from sphinx.domains.c import CDomain
 from sphinx.domains.python import PythonDomain
+from sphinx.util.docutils import switch_source_input
 
 
 class ManglingDomainBase:
@@ -468,9 +657,9 @@ def match_items(lines, content_old):
     ignored, so the generated line numbers will be off if ``mangle_docstrings``
     does anything non-trivial.
 
-    This is a best-effort function and the real fix would be to make
-    ``mangle_docstrings`` actually keep track of the ``items`` together with
-    the ``lines``.
+    This is a best-effort function. The mangling directives instead use the
+    origins of the lines, which ``mangle_docstrings`` keeps track of together
+    with the ``lines``.
 
     Examples
     --------
@@ -529,11 +718,18 @@ def wrap_mangling_directive(base_directive, objtype):
                 name = self.arguments[0]
 
             lines = list(self.content)
-            mangle_docstrings(env.app, objtype, name, None, None, lines)
-            if self.content:
-                items = match_items(lines, self.content)
-                self.content = ViewList(lines, items=items, parent=self.content.parent)
-
-            return base_directive.run(self)
+            origins = []
+            mangle_docstrings(env.app, objtype, name, None, None, lines, origins)
+            if not self.content:
+                return base_directive.run(self)
+            items = [self.content.items[origin] for origin in origins]
+            self.content = StringList(lines, items=items, parent=self.content.parent)
+
+            # The mangled lines are not lines of the document, like autodoc,
+            # parse them at offset 0 so that docutils locates them, including
+            # in its messages, through the items of the content.
+            self.content_offset = 0
+            with switch_source_input(self.state, self.content):
+                return base_directive.run(self)
 
     return directive
@@ -0,0 +1,388 @@
+"""Locate the parts of a numpydoc docstring without copying them.
+
+:func:`parse_spans` splits a docstring into sections, and the sections
+listing parameters into their items, like :class:`~numpydoc.docscrape.NumpyDocString`
+does. Each part is returned as a :class:`Span`, an offset and a length into the
+original docstring. Text is only copied out of the docstring when a span is
+read, and every part has an exact line and column.
+"""
+
+import bisect
+import re
+import textwrap
+from collections.abc import Mapping
+
+# The rules shared with NumpyDocString, so that both find the same sections
+from .docscrape import (
+    _PARAM_SECTIONS,
+    _TYPE_SECTIONS,
+    SIGNATURE_RE,
+    NumpyDocString,
+    _is_section_header,
+    _section_key,
+)
+
+_BLANK_RE = re.compile(r"\s*\Z")
+# The stripped text of a line, in group 1
+_TEXT_RE = re.compile(r"\s*(.*?)\s*\Z")
+
+
+def _line_starts(source):
+    """Return the offsets of the lines of `source`."""
+    return [0, *(match.end() for match in re.finditer("\n", source))]
+
+
+class Span:
+    """
+    A part of a docstring, given by its offset and length.
+
+    Parameters
+    ----------
+    source : str
+        The whole docstring.
+    offset : int
+        The index of the first character of the part in `source`.
+    length : int
+        The number of characters of the part.
+    line_starts : list of int, optional
+        The offsets of the lines of `source`, which are otherwise found the
+        first time a line or column is read. Spans of the same docstring
+        can share them.
+    margin : int, optional
+        The number of characters :meth:`lines` removes from the start of each
+        line. By default, the indentation common to the lines is removed.
+    """
+
+    __slots__ = ("_line_starts", "_margin", "length", "offset", "source")
+
+    def __init__(self, source, offset, length, line_starts=None, margin=None):
+        self.source = source
+        self.offset = offset
+        self.length = length
+        self._line_starts = line_starts
+        self._margin = margin
+
+    def __repr__(self):
+        return f"<Span {self.text!r} at {self.lineno}:{self.col}>"
+
+    def __str__(self):
+        return self.text
+
+    @property
+    def stop(self):
+        """int : The index after the last character of the part."""
+        return self.offset + self.length
+
+    @property
+    def text(self):
+        """str : The text of the part."""
+        return self.source[self.offset : self.stop]
+
+    def _line_of(self, offset):
+        if self._line_starts is None:
+            self._line_starts = _line_starts(self.source)
+        return bisect.bisect_right(self._line_starts, offset) - 1
+
+    @property
+    def lineno(self):
+        """int : The line of the docstring the part starts on, from 0."""
+        return self._line_of(self.offset)
+
+    @property
+    def end_lineno(self):
+        """int : The line of the docstring the part ends on, from 0."""
+        return self._line_of(self.stop)
+
+    @property
+    def col(self):
+        """int : The column of the docstring the part starts at, from 0."""
+        lineno = self.lineno
+        return self.offset - self._line_starts[lineno]
+
+    def lines(self):
+        """
+        Get the lines of the part, dedented.
+
+        Returns
+        -------
+        list of str
+            The lines, as a section or description would be parsed by
+            :class:`~numpydoc.docscrape.NumpyDocString`, except that
+            consecutive blank lines are kept as they are in the docstring.
+        """
+        if self._margin is None:
+            return textwrap.dedent(self.text).split("\n")
+        return [
+            line[self._margin :] if line.strip() else ""
+            for line in self.text.split("\n")
+        ]
+
+
+class ItemSpans:
+    """
+    The parts of an item of a section listing parameters.
+
+    Attributes
+    ----------
+    name, type, desc : Span or None
+        The name, type and description of the item, if any.
+    """
+
+    __slots__ = ("desc", "name", "type")
+
+    def __init__(self, name, type, desc):
+        self.name = name
+        self.type = type
+        self.desc = desc
+
+
+class SectionSpans:
+    """
+    The parts of a section.
+
+    Attributes
+    ----------
+    title : Span or None
+        The title of the section, or None for the signature and summaries.
+    body : Span or None
+        The content of the section, without leading and trailing blank lines.
+    items : list of ItemSpans or None
+        The items of sections listing parameters, such as Parameters.
+    """
+
+    __slots__ = ("body", "items", "title")
+
+    def __init__(self, title, body, items=None):
+        self.title = title
+        self.body = body
+        self.items = items
+
+
+class DocstringSpans(Mapping):
+    """
+    The sections of a docstring, by name, in the order they appear.
+
+    Sections are named like the keys of
+    :class:`~numpydoc.docscrape.NumpyDocString`. Unlike it, only the
+    sections found in the docstring are present.
+
+    Parameters
+    ----------
+    source : str
+        The docstring.
+    """
+
+    __slots__ = ("_sections", "source")
+
+    def __init__(self, source):
+        self.source = source
+        self._sections = _SpanParser(source).parse()
+
+    def __getitem__(self, key):
+        return self._sections[key]
+
+    def __iter__(self):
+        return iter(self._sections)
+
+    def __len__(self):
+        return len(self._sections)
+
+
+def parse_spans(docstring):
+    """
+    Locate the sections, and the items of sections, of a docstring.
+
+    Parameters
+    ----------
+    docstring : str
+        The docstring.
+
+    Returns
+    -------
+    DocstringSpans
+        The sections, whose parts are spans of `docstring`.
+
+    Examples
+    --------
+    >>> spans = parse_spans('''Add numbers.
+    ...
+    ... Parameters
+    ... ----------
+    ... x : int
+    ...     The first number.
+    ... ''')
+    >>> list(spans)
+    ['Summary', 'Parameters']
+    >>> item = spans["Parameters"].items[0]
+    >>> item.type
+    <Span 'int' at 4:4>
+    >>> item.desc.lines()
+    ['The first number.']
+    """
+    return DocstringSpans(docstring)
+
+
+class _SpanParser:
+    """Scan a docstring line by line, by the offsets of its lines."""
+
+    def __init__(self, source):
+        self.source = source
+        # Shared by all the spans
+        self.starts = _line_starts(source)
+        self.ends = [start - 1 for start in self.starts[1:]]
+        self.ends.append(len(source))
+        self.n_lines = len(self.starts)
+
+    # Lines
+
+    def is_blank(self, line):
+        return _BLANK_RE.match(self.source, self.starts[line], self.ends[line])
+
+    def stripped(self, line):
+        """The offsets of the stripped text of a line."""
+        match = _TEXT_RE.match(self.source, self.starts[line], self.ends[line])
+        return match.span(1)
+
+    def indent(self, line):
+        return self.stripped(line)[0] - self.starts[line]
+
+    def margin(self, first, stop):
+        """The indentation common to the lines, as removed by textwrap.dedent."""
+        lines = [
+            self.source[self.starts[line] : self.ends[line]]
+            for line in range(first, stop)
+            if not self.is_blank(line)
+        ]
+        if not lines:
+            return 0
+        return len(lines[0]) - len(textwrap.dedent("\n".join(lines)).split("\n")[0])
+
+    def lines_span(self, first, stop, margin=None):
+        """The span of whole lines, without leading and trailing blank lines."""
+        while first < stop and self.is_blank(first):
+            first += 1
+        while stop > first and self.is_blank(stop - 1):
+            stop -= 1
+        if first == stop:
+            return None
+        offset = self.starts[first]
+        return Span(
+            self.source, offset, self.ends[stop - 1] - offset, self.starts, margin
+        )
+
+    def text_span(self, start, stop):
+        return Span(self.source, start, stop - start, self.starts)
+
+    # Paragraphs, as read by NumpyDocString
+
+    def seek(self, line):
+        while line < self.n_lines and self.is_blank(line):
+            line += 1
+        return line
+
+    def read_paragraph(self, line):
+        first = stop = self.seek(line)
+        while stop < self.n_lines and not self.is_blank(stop):
+            stop += 1
+        return first, stop
+
+    def is_at_section(self, line):
+        line = self.seek(line)
+        if line >= self.n_lines:
+            return False
+        title = self.source[slice(*self.stripped(line))]
+        underline = ""
+        if line + 1 < self.n_lines:
+            underline = self.source[slice(*self.stripped(line + 1))]
+        return _is_section_header(title, underline)
+
+    def read_to_next_section(self, line):
+        first, stop = self.read_paragraph(line)
+        while not self.is_at_section(stop) and self.seek(stop) < self.n_lines:
+            stop = self.read_paragraph(stop)[1]
+        return first, stop
+
+    # Sections
+
+    def parse(self):
+        sections = {}
+        line = self.parse_summary(sections)
+        while self.seek(line) < self.n_lines:
+            first, line = self.read_to_next_section(line)
+            title_start, title_stop = self.stripped(first)
+            title = self.source[title_start:title_stop]
+            title_span = self.text_span(title_start, title_stop)
+            # NumpyDocString dedents a section along with its title
+            margin = self.margin(first, line)
+            if title.startswith(".."):
+                sections["index"] = SectionSpans(
+                    title_span, self.lines_span(first + 1, line, margin)
+                )
+                continue
+            if line - first < 2:
+                continue
+            key = _section_key(title)
+            if key not in NumpyDocString.sections:
+                # NumpyDocString warns about unknown sections and skips them
+                continue
+            items = None
+            if key in _PARAM_SECTIONS:
+                items = self.parse_items(first + 2, line, key in _TYPE_SECTIONS)
+            sections[key] = SectionSpans(
+                title_span, self.lines_span(first + 2, line, margin), items
+            )
+        return sections
+
+    def parse_summary(self, sections):
+        if self.is_at_section(0):
+            return 0
+        line = 0
+        while True:
+            first, line = self.read_paragraph(line)
+            if first == line:
+                return line
+            summary = " ".join(
+                self.source[slice(*self.stripped(i))] for i in range(first, line)
+            ).strip()
+            if SIGNATURE_RE.match(summary):
+                start = self.stripped(first)[0]
+                sections["Signature"] = SectionSpans(
+                    None, self.text_span(start, self.stripped(line - 1)[1])
+                )
+                if not self.is_at_section(line):
+                    continue
+            break
+        # Only the docstring as a whole is dedented for the summary
+        sections["Summary"] = SectionSpans(
+            None, self.lines_span(first, line, self.margin(0, self.n_lines))
+        )
+        if not self.is_at_section(line):
+            first, line = self.read_to_next_section(line)
+            sections["Extended Summary"] = SectionSpans(
+                None, self.lines_span(first, line)
+            )
+        return line
+
+    def parse_items(self, first, stop, single_element_is_type):
+        lines = [line for line in range(first, stop) if not self.is_blank(line)]
+        if not lines:
+            return []
+        margin = min(self.indent(line) for line in lines)
+        headers = [line for line in lines if self.indent(line) == margin]
+        items = []
+        for header, next_header in zip(headers, [*headers[1:], stop], strict=True):
+            start, end = self.stripped(header)
+            separator = self.source.find(" : ", start, end)
+            if separator != -1:
+                name = self.text_span(start, separator)
+                type_ = self.text_span(separator + 3, end)
+            else:
+                if self.source.endswith(" :", start, end):
+                    end -= 2
+                if single_element_is_type:
+                    name, type_ = None, self.text_span(start, end)
+                else:
+                    name, type_ = self.text_span(start, end), None
+            desc = self.lines_span(header + 1, next_header)
+            items.append(ItemSpans(name, type_, desc))
+        return items
@@ -1,5 +1,6 @@
 """Test the numpydoc validate pre-commit hook."""
 
+import ast
 import importlib.resources
 import inspect
 import re
@@ -8,6 +9,7 @@ from pathlib import Path
 import pytest
 
 import numpydoc
+from numpydoc.hooks import validate_docstrings
 from numpydoc.hooks.validate_docstrings import run_hook
 
 
@@ -334,3 +336,141 @@ def test_validate_hook_exclude_files_option_setup_cfg(
 
     return_code = run_hook([example_module], config=tmp_path)
     assert return_code == expected_code  # Should not-report/report findings.
+
+
+@pytest.mark.parametrize("jobs", [2, "auto"])
+def test_validate_hook_jobs(example_module, tmp_path, jobs, capsys):
+    """Test that running with a worker pool reports findings in file order."""
+    other_module = tmp_path / "other_module.py"
+    other_module.write_text('"""Summary without period"""\n')
+    files = [example_module, str(other_module), example_module]
+
+    serial_return_code = run_hook(files)
+    serial_output = capsys.readouterr().err
+
+    return_code = run_hook(files, jobs=jobs)
+    assert return_code == serial_return_code == 1
+    assert capsys.readouterr().err == serial_output
+
+
+def test_validate_hook_invalid_jobs(example_module):
+    with pytest.raises(ValueError, match="jobs must be a positive integer"):
+        run_hook([example_module], jobs="many")
+
+
+def test_validate_hook_cache(example_module, tmp_path, monkeypatch, capsys):
+    """Test that unchanged files are reported from the cache without parsing."""
+    module = tmp_path / "module.py"
+    module.write_text('"""Summary without period"""\n')
+    files = [example_module, str(module)]
+    cache_dir = tmp_path / "cache"
+
+    return_code = run_hook(files, cache=True, cache_dir=cache_dir)
+    expected = capsys.readouterr().err
+    assert return_code == 1
+    assert (cache_dir / ".gitignore").read_text() == "*\n"
+
+    processed = []
+
+    def process_file(filepath, config):
+        processed.append(filepath)
+        return []
+
+    monkeypatch.setattr(validate_docstrings, "process_file", process_file)
+    return_code = run_hook(files, cache=True, cache_dir=cache_dir)
+    assert return_code == 1
+    assert capsys.readouterr().err == expected
+    assert processed == []
+
+    # Changing the contents of a file invalidates its entry only
+    module.write_text('"""Summary with period."""\n')
+    run_hook(files, cache=True, cache_dir=cache_dir)
+    assert processed == [str(module)]
+
+    # So does changing the configuration
+    run_hook(files, cache=True, cache_dir=cache_dir, ignore=["SS03"])
+    assert processed == [str(module), example_module, str(module)]
+
+    # And the cache is not used at all when disabled
+    run_hook(files, cache=False, cache_dir=cache_dir)
+    assert processed == [str(module), example_module, str(module)] + files
+
+
+def test_source_context_get_source_segment(example_module):
+    """Test that source segments match those found by the ast module."""
+    source = validate_docstrings.SourceContext(example_module)
+    with open(example_module) as file:
+        text = file.read()
+    for node in ast.walk(source.tree):
+        assert source.get_source_segment(node) == ast.get_source_segment(text, node)
+
+    text = 'def fünc(x):  # numpydoc ignore=GL08\n    return "ü" * x\n'
+    source = validate_docstrings.SourceContext("example.py", source=text)
+    for node in ast.walk(source.tree):
+        assert source.get_source_segment(node) == ast.get_source_segment(text, node)
+    assert source.ignore_comments == {1: ["GL08"]}
+
+
+def test_docstring_visitor_shares_source(tmp_path):
+    """Test that the file is not read again once its source context exists."""
+    module = tmp_path / "module.py"
+    module.write_text(
+        inspect.cleandoc(
+            '''
+            """Module docstring."""
+
+
+            def f(x):  # numpydoc ignore=ES01,SA01,EX01
+                """
+                Do something.
+
+                Parameters
+                ----------
+                x : int
+                    Some value.
+                """
+                return x
+            '''
+        )
+    )
+    source = validate_docstrings.SourceContext(module)
+    module.unlink()
+
+    visitor = validate_docstrings.DocstringVisitor(
+        filepath=str(module),
+        config=validate_docstrings.parse_config(tmp_path),
+        source=source,
+    )
+    visitor.visit(source.tree)
+    assert [check for _, name, check, _ in visitor.findings if name == "module.f"] == [
+        "RT01"
+    ]
+
+
+def test_validate_hook_generator_in_loop(tmp_path, capsys):
+    """Test that yields nested in the body of a function are detected."""
+    module = tmp_path / "module.py"
+    module.write_text(
+        inspect.cleandoc(
+            '''
+            """Module docstring."""
+
+
+            def gen(n):  # numpydoc ignore=ES01,SA01,EX01
+                """
+                Count up.
+
+                Parameters
+                ----------
+                n : int
+                    Where to stop.
+                """
+                for i in range(n):
+                    yield i
+            '''
+        )
+    )
+    assert run_hook([str(module)], config=tmp_path) == 1
+    assert capsys.readouterr().err.strip() == (
+        f"{module!s}:4: YD01 No Yields section found"
+    )
@@ -1,4 +1,5 @@
 import re
+import sys
 import textwrap
 import warnings
 from collections import namedtuple
@@ -7,7 +8,16 @@ from copy import deepcopy
 import jinja2
 import pytest
 
-from numpydoc.docscrape import ClassDoc, FunctionDoc, NumpyDocString
+from numpydoc import docscrape
+from numpydoc.docscrape import (
+    ClassDoc,
+    FrozenDocString,
+    FunctionDoc,
+    NumpyDocString,
+    Parameter,
+    Reader,
+    extract_signature,
+)
 from numpydoc.docscrape_sphinx import (
     SphinxClassDoc,
     SphinxDocString,
@@ -901,6 +911,161 @@ def test_see_also_parse_error():
         NumpyDocString(text)
 
 
+def test_reader_spans():
+    reader = Reader(["", "", "a", "b", "", "  c", "d"])
+    reader.seek_next_non_empty_line()
+    assert reader.span_to_condition(lambda line: not line.strip()) == (2, 4)
+    assert reader.read() == ""
+    assert reader.read_to_next_unindented_line() == ["  c"]
+    assert reader.read_to_next_empty_line() == ["d"]
+    assert reader.eof()
+    assert reader.span_to_condition(str.strip) == (7, 7)
+    assert reader.read_to_next_empty_line() == []
+
+
+def test_lazy_parsing(doc):
+    lazy = NumpyDocString(doc_txt, config={"lazy": True})
+    assert lazy._unparsed
+    for key in ("Parameters", "Returns", "See Also", "index"):
+        assert lazy[key] == doc[key]
+    assert dict(lazy) == dict(doc)
+    assert not lazy._unparsed
+
+    text = """
+    z(x,theta)
+
+    See Also
+    --------
+    :func:`~foo`
+    """
+    lazy = NumpyDocString(text, config={"lazy": True})
+    assert lazy["Summary"] == ["z(x,theta)"]
+    with pytest.raises(ValueError, match="See Also entry ':func:`~foo`'"):
+        lazy["See Also"]
+
+    lazy["See Also"] = []
+    assert lazy["See Also"] == []
+
+
+def test_lazy_parsing_section_errors():
+    with pytest.raises(ValueError, match="The section Parameters appears twice"):
+        NumpyDocString(
+            """
+            Parameters
+            ----------
+            a : int
+
+            Parameters
+            ----------
+            b : int
+            """,
+            config={"lazy": True},
+        )
+    with pytest.raises(ValueError, match=r"Receives.*Yields"):
+        NumpyDocString(
+            """
+            Receives
+            --------
+            a : int
+            """,
+            config={"lazy": True},
+        )
+
+
+def test_lazy_parsing_parse_error():
+    class Doc(NumpyDocString):
+        def _parse_see_also(self, content):
+            raise docscrape.ParseError("Bad See Also")
+
+    text = "Summary.\n\nSee Also\n--------\nfoo\n"
+    lazy = Doc(text, config={"lazy": True})
+    with pytest.raises(docscrape.ParseError) as excinfo:
+        lazy["See Also"]
+    assert excinfo.value.docstring == text
+    assert str(excinfo.value) == f"Bad See Also in {text!r}"
+
+
+def test_lazy_parsing_not_forwarded_by_classdoc():
+    class Dummy:
+        """
+        Summary.
+
+        Parameters
+        ----------
+        x : int
+            The x.
+        """
+
+    # The class docstring is parsed as before, not with the config
+    doc = ClassDoc(Dummy, config={"lazy": True})
+    assert "Parameters" not in doc._unparsed
+    assert doc["Parameters"][0].name == "x"
+
+
+def test_section_defaults():
+    doc = NumpyDocString("Summary.")
+    assert list(doc) == list(NumpyDocString.sections)
+    assert len(doc) == len(NumpyDocString.sections)
+    assert "Notes" in doc
+    assert "Spam" not in doc
+    assert doc.get("Spam") is None
+    assert dict(doc) == {**NumpyDocString.sections, "Summary": ["Summary."]}
+
+    # Modifying a default section does not affect other docstrings
+    doc["Notes"].append("Modified.")
+    doc["index"]["default"] = "spam"
+    assert doc["Notes"] == ["Modified."]
+    other = NumpyDocString("Summary.")
+    assert other["Notes"] == []
+    assert other["index"] == {}
+    assert NumpyDocString.sections["Notes"] == []
+
+
+def test_freeze(doc):
+    frozen = doc.freeze()
+    assert isinstance(frozen, FrozenDocString)
+    assert not hasattr(frozen, "__dict__")
+    assert dict(frozen) == dict(doc)
+    assert dict(NumpyDocString(frozen)) == dict(doc)
+
+    # Only the non-default sections are stored, with descriptions as spans
+    assert "Yields" not in dict(frozen._sections)
+    params = dict(frozen._sections)["Parameters"]
+    assert not hasattr(params[0], "__dict__")
+    assert params[1].type is sys.intern("(N, N) ndarray")
+    assert isinstance(params[1].desc, docscrape._Span)
+
+    # Reading a section does not modify the frozen docstring
+    frozen["Parameters"].clear()
+    assert frozen["Parameters"] == doc["Parameters"]
+
+
+def test_freeze_subclasses():
+    class Dummy:
+        """
+        Dummy class.
+
+        Parameters
+        ----------
+        x : int
+            The x.
+        """
+
+        def spam(self):
+            """Spam."""
+
+    frozen = ClassDoc(Dummy).freeze()
+    assert frozen["Methods"] == [Parameter("spam", "", ["Spam."])]
+    assert str(SphinxClassDoc(Dummy, doc=frozen)) == str(SphinxClassDoc(Dummy))
+    # The frozen members are kept when converted to another class
+    assert "spam" in str(SphinxDocString(frozen))
+
+    frozen = SphinxFunctionDoc(None, doc=doc_txt).freeze()
+    assert str(SphinxFunctionDoc(None, doc=frozen)) == str(
+        SphinxFunctionDoc(None, doc=doc_txt)
+    )
+
+
 def test_see_also_print():
     class Dummy:
         """
@@ -1170,6 +1335,60 @@ def test_class_members():
             assert "Spammity index" in str(doc), str(doc)
 
 
+def test_class_members_lazy_docs(monkeypatch):
+    class Dummy:
+        """Dummy class."""
+
+        def spam(self):
+            """Spam spam."""
+
+        @property
+        def spammity(self):
+            """Spammity index"""
+
+    looked_up = []
+
+    def getdoc(obj):
+        looked_up.append(obj)
+        return obj.__doc__
+
+    doc = ClassDoc(Dummy)
+    monkeypatch.setattr(docscrape.pydoc, "getdoc", getdoc)
+    assert looked_up == []
+    assert doc["Methods"] == [Parameter("spam", "", ["Spam spam."])]
+    assert doc["Attributes"] == [Parameter("spammity", "", ["Spammity index"])]
+    assert len(looked_up) == 2
+
+
+def test_class_members_index_reuses_bases(monkeypatch):
+    class Base:
+        x = None
+
+        def spam(self):
+            pass
+
+    class Sub(Base):
+        @property
+        def ham(self):
+            pass
+
+    assert ClassDoc(Base).methods == ["spam"]
+
+    classified = []
+    own_member_kinds = docscrape._own_member_kinds
+
+    def record(klass):
+        classified.append(klass)
+        return own_member_kinds(klass)
+
+    monkeypatch.setattr(docscrape, "_own_member_kinds", record)
+    doc = ClassDoc(Sub)
+    assert doc.methods == ["spam"]
+    assert doc.properties == ["ham", "x"]
+    # The members of Base and object were already classified
+    assert classified == [Sub]
+
+
 def test_duplicate_signature():
     # Duplicate function signatures occur e.g. in ufuncs, when the
     # automatic mechanism adds one, and a more detailed comes from the
@@ -1186,6 +1405,20 @@ def test_duplicate_signature():
     assert doc["Signature"].strip() == "z(a, theta)"
 
 
+@pytest.mark.parametrize(
+    "docstring",
+    [
+        doc_txt,
+        "\n    z(x1, x2)\n\n    z(a, theta)\n    ",
+        "Summary without signature.",
+        "Parameters\n----------\nx : int\n",
+        "",
+    ],
+)
+def test_extract_signature(docstring):
+    assert extract_signature(docstring) == NumpyDocString(docstring)["Signature"]
+
+
 class_doc_txt = """
     Foo
 
@@ -1458,6 +1691,76 @@ def test_templated_sections():
     )
 
 
+def test_source_map(doc):
+    source = doc._docstring.split("\n")
+    sphinx_doc = SphinxDocString(doc._docstring, config={"xref_param_type": True})
+    lines, origins = sphinx_doc.source_map(indent=4)
+    assert lines == sphinx_doc.__str__(indent=4).split("\n")
+    assert len(origins) == len(lines)
+
+    def origin(text):
+        (i,) = [i for i, line in enumerate(lines) if line == text]
+        return source[origins[i]].strip()
+
+    assert origin("    :Parameters:") == "Parameters"
+    assert origin("        **mean** : (N,) :obj:`ndarray`") == "mean : (N,) ndarray"
+    assert origin("               (1+2+3)/3") == "(1+2+3)/3"
+    assert origin("        :obj:`no_description`") == "no_description"
+    assert origin("    .. rubric:: Notes") == "Notes"
+    assert origin("    .. index:: random") == ".. index:: random"
+    assert origin("    .. seealso::") == "See Also"
+    # Lines added by the renderer come from the line before them
+    empty_desc = lines.index("        :obj:`no_description`") + 1
+    assert lines[empty_desc] == "            .."
+    assert origins[empty_desc] == origins[empty_desc - 1]
+    assert origin("    >>> mean = (1,2)") == ">>> mean = (1,2)"
+
+
+def test_source_map_custom_template():
+    doc = SphinxClassDoc(
+        None,
+        class_doc_txt,
+        config={"template": jinja2.Template("{{examples}}\n{{parameters}}")},
+    )
+    lines, origins = doc.source_map()
+    source = class_doc_txt.split("\n")
+    assert lines == str(doc).split("\n")
+    assert [source[origin].strip() for origin in origins[:3]] == [
+        "Examples",
+        "Examples",
+        "For usage examples, see `ode`.",
+    ]
+
+    # Templates changing the sections are matched line by line
+    doc.template = jinja2.Template("{{parameters|upper}}\n{{examples}}")
+    lines, origins = doc.source_map()
+    assert lines == str(doc).split("\n")
+    assert source[origins[lines.index("For usage examples, see `ode`.")]].strip() == (
+        "For usage examples, see `ode`."
+    )
+
+
+def test_template_cached_per_builder():
+    class Builder:
+        class config:
+            templates_path = []
+
+        _translator = None
+
+    def f():
+        """Summary."""
+
+    default_template = get_doc_object(f).template
+    assert get_doc_object(f).template is default_template
+    assert SphinxDocString("Summary.").template is default_template
+
+    builder, other_builder = Builder(), Builder()
+    builder_template = get_doc_object(f, builder=builder).template
+    assert builder_template is not default_template
+    assert get_doc_object(f, builder=builder).template is builder_template
+    assert get_doc_object(f, builder=other_builder).template is not builder_template
+
+
 def test_nonstandard_property():
     # test discovery of a property that does not satisfy isinstance(.., property)
 
@@ -1608,6 +1911,8 @@ def test_xref():
         def __init__(self, a, b):
             self.numpydoc_xref_aliases = a
             self.numpydoc_xref_aliases_complete = b
+            self.numpydoc_xref_ignore = set()
+            self.numpydoc_cache_dir = None
             # numpydoc.update_config fails if this config option not present
             self.numpydoc_validation_checks = set()
             self.numpydoc_validation_exclude = set()
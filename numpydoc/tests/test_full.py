@@ -1,3 +1,4 @@
+import io
 import os.path as op
 import re
 import shutil
@@ -102,3 +103,56 @@ def test_reference(sphinx_app, html_file, expected_length):
     assert len(reference_list) == expected_length
     for ref in reference_list:
         assert "-" not in ref  # Bad reference if it contains "-" e.g. R1896e33633d5-1
+
+
+def test_mangled_directive_warning_lines(tmp_path):
+    """Test that warnings in mangled directives point to their source lines."""
+    (tmp_path / "conf.py").write_text('extensions = ["numpydoc"]\n')
+    (tmp_path / "index.rst").write_text(
+        """\
+Test
+====
+
+.. np:function:: f(x)
+
+   Summarize f.
+
+   Parameters
+   ----------
+   x : int
+       The `x.
+
+   Notes
+   -----
+   .. nonexistent-directive:: oops
+
+.. np-c:function:: int g(int y)
+
+   Summarize g.
+
+   Parameters
+   ----------
+   y : int
+       The *y.
+"""
+    )
+    warnings = io.StringIO()
+    with docutils_namespace():
+        app = Sphinx(
+            tmp_path,
+            tmp_path,
+            tmp_path / "_build",
+            tmp_path / "_build" / "doctrees",
+            buildername="html",
+            status=None,
+            warning=warnings,
+        )
+        app.build(False, [])
+    lines = re.findall(
+        r"index\.rst:(\d+): (?:WARNING|ERROR): (\w+ \w+)", warnings.getvalue()
+    )
+    assert lines == [
+        ("11", "Inline interpreted"),
+        ("15", "Unknown directive"),
+        ("24", "Inline emphasis"),
+    ]
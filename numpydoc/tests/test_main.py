@@ -1,10 +1,12 @@
 import io
+import subprocess
 import sys
 
 import pytest
 
 import numpydoc
 import numpydoc.cli
+import numpydoc.hooks.utils
 
 
 def _capture_stdout(func_name, *args, **kwargs):
@@ -116,6 +118,120 @@ def test_validate_perfect_docstring():
     assert exit_status == 0
 
 
+@pytest.fixture
+def package_to_validate(tmp_path, monkeypatch):
+    package = tmp_path / "pkg_to_validate"
+    package.mkdir()
+    (package / "__init__.py").write_text(
+        '''"""A package."""
+
+__all__ = ["C", "f"]
+
+
+def f():
+    """Do nothing."""
+
+
+def g():
+    pass
+
+
+class C:
+    """A class."""
+
+    def method(self):
+        pass
+
+    def _private(self):
+        pass
+'''
+    )
+    (package / "sub.py").write_text('def h():\n    """do nothing."""\n')
+    (package / "_private.py").write_text("def i():\n    pass\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    # Import the package from this test's directory, not a previous one
+    for name in list(sys.modules):
+        if name.partition(".")[0] == package.name:
+            monkeypatch.delitem(sys.modules, name)
+    return package.name
+
+
+def test_iter_public_names(package_to_validate):
+    assert list(numpydoc.cli._iter_public_names(package_to_validate)) == [
+        f"{package_to_validate}{name}"
+        for name in ["", ".C", ".C.method", ".f", ".sub", ".sub.h"]
+    ]
+
+
+def test_validate_recursive_skips_tests_and_broken(
+    capsys, package_to_validate, tmp_path
+):
+    package = tmp_path / package_to_validate
+    (package / "broken.py").write_text("def j(:\n")
+    (package / "tests").mkdir()
+    (package / "tests" / "__init__.py").write_text("def k():\n    pass\n")
+    assert list(numpydoc.cli._iter_public_names(package_to_validate)) == [
+        f"{package_to_validate}{name}"
+        for name in ["", ".C", ".C.method", ".f", ".broken", ".sub", ".sub.h"]
+    ]
+
+    status = numpydoc.cli.main(["validate", "--recursive", package_to_validate])
+    out = capsys.readouterr().out.splitlines()
+    assert any(
+        line.startswith(f"{package_to_validate}.broken:SyntaxError:") for line in out
+    )
+    assert (
+        f"{package_to_validate}.sub.h:SS02:Summary does not start with a capital letter"
+        in out
+    )
+    assert not any(".tests" in line for line in out)
+    assert status == len(out)
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_validate_recursive(capsys, package_to_validate, jobs):
+    status = numpydoc.cli.main(
+        ["validate", "--recursive", package_to_validate, "--jobs", jobs]
+    )
+    out = capsys.readouterr().out.splitlines()
+    assert (
+        f"{package_to_validate}.C.method:GL08:The object does not have a docstring"
+        in out
+    )
+    assert (
+        f"{package_to_validate}.sub.h:SS02:Summary does not start with a capital letter"
+        in out
+    )
+    assert not any(line.startswith(f"{package_to_validate}.g:") for line in out)
+    assert status == len(out)
+
+
+def test_validate_from_file(capsys, monkeypatch, tmp_path):
+    names = [
+        "numpydoc.tests.test_main._capture_stdout",
+        "numpydoc.tests.test_main._docstring_with_errors",
+    ]
+    expected_status = numpydoc.cli.validate_object(names[1])
+    expected = capsys.readouterr().out
+
+    names_file = tmp_path / "names.txt"
+    names_file.write_text("\n".join(["# objects to validate", *names, ""]))
+    assert numpydoc.cli.main(["validate", "--from-file", str(names_file)]) == (
+        expected_status
+    )
+    assert capsys.readouterr().out == expected
+
+    monkeypatch.setattr("sys.stdin", io.StringIO("\n".join(names)))
+    assert numpydoc.cli.main(["validate", "--from-file", "-"]) == expected_status
+    assert capsys.readouterr().out == expected
+
+
+def test_validate_requires_import_path(capsys):
+    with pytest.raises(SystemExit):
+        numpydoc.cli.main(["validate"])
+    assert "an import path or --from-file is required" in capsys.readouterr().err
+
+
 @pytest.mark.parametrize(
     "args",
     [[], ["--ignore", "SS03,ES01"], ["--ignore", "ES01", "--ignore", "SA01 SS03"]],
@@ -137,6 +253,57 @@ def test_lint(capsys, tmp_path, args):
     assert return_status == expected_status
 
 
+def test_lint_jobs(capsys, tmp_path):
+    files = []
+    for i in range(3):
+        f = tmp_path / f"example{i}.py"
+        f.write_text('"""Summary without period"""\n')
+        files.append(str(f))
+
+    return_status = numpydoc.cli.main(["lint", *files, "--jobs", "2"])
+    err = capsys.readouterr().err.strip("\n\r")
+    assert err.split("\n\n") == [
+        f"{f}:1: SS03 Summary does not end with a period" for f in files
+    ]
+    assert return_status == 1
+
+
+@pytest.mark.parametrize("jobs", ["-1", "0", "many"])
+def test_invalid_jobs(capsys, jobs):
+    for command in (["lint", "example.py"], ["validate", "numpydoc"]):
+        with pytest.raises(SystemExit) as exc_info:
+            numpydoc.cli.main([*command, "--jobs", jobs])
+        assert exc_info.value.code == 2
+        assert (
+            f"expected a positive number of jobs or 'auto', got {jobs!r}"
+            in capsys.readouterr().err
+        )
+
+
+def test_lint_cache(capsys, tmp_path):
+    f = tmp_path / "example.py"
+    f.write_text('"""Summary without period"""\n')
+    cache_dir = tmp_path / "cache"
+    expected = f"{f}:1: SS03 Summary does not end with a period"
+
+    for _ in range(2):
+        return_status = numpydoc.cli.main(
+            ["lint", str(f), "--cache", "--cache-dir", str(cache_dir)]
+        )
+        assert capsys.readouterr().err.strip("\n\r") == expected
+        assert return_status == 1
+    assert any(cache_dir.glob("*/*.json"))
+
+    # Caching is opt-in
+    other_cache_dir = tmp_path / "other_cache"
+    return_status = numpydoc.cli.main(
+        ["lint", str(f), "--cache-dir", str(other_cache_dir)]
+    )
+    assert capsys.readouterr().err.strip("\n\r") == expected
+    assert return_status == 1
+    assert not other_cache_dir.exists()
+
+
 def test_lint_help(capsys):
     """Test that lint help section is displaying."""
 
@@ -147,3 +314,49 @@ def test_lint_help(capsys):
     out = capsys.readouterr().out
     assert "--ignore" in out
     assert "--config" in out
+    assert "--jobs" in out
+    assert "--cache" in out
+
+
+def test_lint_help_ignored_checks(capsys, monkeypatch, tmp_path):
+    (tmp_path / "pyproject.toml").write_text(
+        '[tool.numpydoc_validation]\nchecks = ["all", "EX01"]\n'
+    )
+    monkeypatch.chdir(tmp_path)
+
+    with pytest.raises(SystemExit):
+        numpydoc.cli.main(["lint", "--help"])
+
+    out = capsys.readouterr().out
+    assert "Currently ignoring the following from" in out
+    assert "- EX01: No examples section found" in out
+
+
+def test_parser_does_not_read_config(monkeypatch):
+    """The config is only read to display the lint help."""
+
+    def find_project_root(*args):
+        raise AssertionError("the config should not be read")
+
+    monkeypatch.setattr(numpydoc.hooks.utils, "find_project_root", find_project_root)
+    args = numpydoc.cli.get_parser().parse_args(["lint", "example.py"])
+    assert args.func is numpydoc.cli.lint_files
+
+
+def test_import_time():
+    """Importing the CLI is fast, and does not import Sphinx."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import numpydoc.cli"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Lines are "import time: self [us] | cumulative | imported package"
+    cumulative = {}
+    for line in result.stderr.splitlines()[1:]:
+        _, cumulative_time, module = line.partition(":")[2].split("|")
+        cumulative[module.strip()] = int(cumulative_time)
+
+    assert not {"sphinx", "docutils", "jinja2"} & set(cumulative)
+    # Generous, so that slow CI machines do not fail
+    assert cumulative["numpydoc.cli"] < 500_000
@@ -1,3 +1,5 @@
+import hashlib
+import importlib
 import warnings
 from collections import defaultdict
 from collections.abc import Mapping
@@ -8,9 +10,13 @@ from pathlib import PosixPath
 import pytest
 import sphinx
 from docutils import nodes
+from docutils.utils import new_document
+from sphinx.addnodes import desc_content, pending_xref
 from sphinx.ext.autodoc import ALL
 from sphinx.util import logging
 
+import numpydoc.numpydoc
+
 try:
     from sphinx.ext.autodoc._directive_options import _AutoDocumenterOptions
     from sphinx.ext.autodoc._sentinels import EMPTY
@@ -19,9 +25,15 @@ except ImportError:
     EMPTY = None
 
 from numpydoc.numpydoc import (
+    DEDUPLICATION_TAG,
+    HASH_LEN,
     _clean_text_signature,
+    _module_package_path,
     clean_backrefs,
     mangle_docstrings,
+    mangle_signature,
+    relabel_references,
+    rename_references,
     update_config,
 )
 from numpydoc.xref import DEFAULT_LINKS
@@ -43,6 +55,7 @@ class MockConfig:
     numpydoc_validation_exclude = set()
     numpydoc_validation_exclude_files = set()
     numpydoc_validation_overrides = dict()
+    numpydoc_cache_dir = None
 
 
 class MockBuilder:
@@ -54,6 +67,7 @@ class MockApp:
     config = MockConfig()
     builder = MockBuilder()
     translator = None
+    confdir = None
 
     def __init__(self):
         self.builder.app = self
@@ -176,6 +190,45 @@ A top section before
     assert "samefile" not in lines
 
 
+def test_mangle_signature(monkeypatch):
+    class Klass:
+        """
+        Klass(a, b=1)
+
+        A class with a signature in its docstring.
+
+        Parameters
+        ----------
+        a : int
+            Something.
+        """
+
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def method(self):
+            """Do something."""
+
+    def func(*args):
+        """
+        func(x, y)
+
+        A function with a signature in its docstring.
+        """
+
+    # The signature is found without building a (Sphinx)ClassDoc
+    monkeypatch.setattr("numpydoc.numpydoc.get_doc_object", None)
+    assert mangle_signature(MockApp(), "class", "Klass", Klass, {}, "", "") == (
+        "(a, b=1)",
+        "",
+    )
+    assert mangle_signature(MockApp(), "function", "func", func, {}, "", "") == (
+        "(x, y)",
+        "",
+    )
+    assert mangle_signature(MockApp(), "method", "m", Klass.method, {}, "", "") is None
+
+
 def test_clean_text_signature():
     assert _clean_text_signature(None) is None
     assert _clean_text_signature("func($self)") == "func()"
@@ -337,6 +390,213 @@ def test_update_config_exclude_str():
         update_config(app)
 
 
+def test_update_config_xref_resolver(monkeypatch):
+    app = MockApp()
+    monkeypatch.setattr(app.config, "numpydoc_validation_exclude", set())
+    monkeypatch.setattr(app.config, "numpydoc_validation_overrides", {})
+    update_config(app)
+    resolver = app.config.numpydoc_xref_resolver
+    assert resolver.xref_aliases == app.config.numpydoc_xref_aliases_complete
+    assert resolver("array_like") == ":term:`numpy:array_like`"
+
+
+def test_mangle_docstrings_cache(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+
+    def f(x):
+        """Summarize f.
+
+        Parameters
+        ----------
+        y : int
+            Not the parameter of f.
+        """
+
+    app = MockApp()
+    monkeypatch.setattr(app.config, "numpydoc_cache_dir", str(cache_dir))
+    monkeypatch.setattr(app.config, "numpydoc_validation_checks", {"PR01"})
+    monkeypatch.setattr(app.config, "numpydoc_docstring_cache", None, raising=False)
+    monkeypatch.setattr(app.config, "numpydoc_validation_exclude", set())
+    monkeypatch.setattr(app.config, "numpydoc_validation_overrides", {})
+    update_config(app)
+    status, warning = StringIO(), StringIO()
+    logging.setup(app, status, warning)
+
+    lines = f.__doc__.split("\n")
+    mangle_docstrings(app, "function", "f", f, None, lines)
+    assert len(list(cache_dir.glob("*/*.json"))) == 1
+    assert (cache_dir / ".gitignore").is_file()
+
+    # A cache hit neither renders nor validates the docstring again, but
+    # still reports the validation warnings.
+    def fail(*args, **kwargs):
+        raise AssertionError("docstring processed again")
+
+    monkeypatch.setattr("numpydoc.numpydoc.get_doc_object", fail)
+    monkeypatch.setattr("numpydoc.numpydoc.validate", fail)
+    warning.truncate(0)
+    cached_lines = f.__doc__.split("\n")
+    mangle_docstrings(app, "function", "f", f, None, cached_lines)
+    assert cached_lines == lines
+    assert "PR01" in warning.getvalue()
+
+    # Any change to the docstring or the configuration is a cache miss
+    with pytest.raises(AssertionError, match="processed again"):
+        mangle_docstrings(app, "method", "f", f, None, f.__doc__.split("\n"))
+    with pytest.raises(AssertionError, match="processed again"):
+        mangle_docstrings(app, "function", "f", f, None, ["Summarize f."])
+    monkeypatch.setattr(app.config, "numpydoc_use_plots", True)
+    with pytest.raises(AssertionError, match="processed again"):
+        mangle_docstrings(app, "function", "f", f, None, f.__doc__.split("\n"))
+
+
+def test_mangle_docstrings_cache_skips_member_dependent(tmp_path, monkeypatch):
+    app = MockApp()
+    monkeypatch.setattr(app.config, "numpydoc_cache_dir", str(tmp_path))
+    monkeypatch.setattr(app.config, "numpydoc_docstring_cache", None, raising=False)
+    monkeypatch.setattr(app.config, "numpydoc_validation_exclude", set())
+    monkeypatch.setattr(app.config, "numpydoc_validation_overrides", {})
+    update_config(app)
+    mangle_docstrings(app, "class", "str", str, {}, ["A class."])
+    mangle_docstrings(app, "module", "numpydoc", numpydoc, None, ["A module."])
+
+    class Foo:
+        def __init__(self, x):
+            pass
+
+    # GL08 on __init__ depends on the docstring of the class
+    init_lines = ["Initialize."]
+    mangle_docstrings(app, "method", "Foo.__init__", Foo.__init__, None, init_lines)
+    assert not list(tmp_path.glob("*/*.json"))
+
+    mangle_docstrings(app, "method", "Foo.f", Foo.__init__, None, ["Summarize f."])
+    assert len(list(tmp_path.glob("*/*.json"))) == 1
+
+
+def test_mangle_docstrings_origins(tmp_path, monkeypatch):
+    source = [
+        "Summarize f.",
+        "",
+        "Parameters",
+        "----------",
+        "x : int",
+        "    The x, see [1]_.",
+        "",
+        "References",
+        "----------",
+        ".. [1] A reference.",
+    ]
+    app = MockApp()
+    monkeypatch.setattr(app.config, "numpydoc_cache_dir", str(tmp_path))
+    monkeypatch.setattr(app.config, "numpydoc_docstring_cache", None, raising=False)
+    monkeypatch.setattr(app.config, "numpydoc_validation_exclude", set())
+    monkeypatch.setattr(app.config, "numpydoc_validation_overrides", {})
+    update_config(app)
+    prefix = "R" + hashlib.sha256(b"f").hexdigest()[:HASH_LEN]
+
+    for _ in range(2):  # rendered, then read from the cache
+        lines, origins = list(source), []
+        mangle_docstrings(app, "function", "f", None, None, lines, origins)
+        assert len(origins) == len(lines)
+        origin = {
+            line.strip(): source[i] for line, i in zip(lines, origins, strict=True)
+        }
+        assert origin[":Parameters:"] == "Parameters"
+        assert origin["**x** : int"] == "x : int"
+        assert origin[f"The x, see [{prefix}-1]_."] == "    The x, see [1]_."
+        assert origin[f".. [{prefix}-1] A reference."] == ".. [1] A reference."
+        assert origin[DEDUPLICATION_TAG.strip()] == ".. [1] A reference."
+    assert len(list(tmp_path.glob("*/*.json"))) == 1
+
+    # Title of modules
+    lines, origins = ["=====", "Title", "=====", "", "Summary."], []
+    mangle_docstrings(app, "module", "m", None, None, lines, origins)
+    assert lines[origins.index(4)] == "Summary."
+
+
+def _cited_docstring(doc, label, tagged=True, container=desc_content):
+    """Build the doctree Sphinx reads from a docstring citing `label`."""
+    content = container()
+    par = nodes.paragraph()
+    cite_ref = nodes.citation_reference(label, label, refname=label)
+    doc.set_id(cite_ref, par)
+    par += cite_ref
+    # Sphinx replaces citation references with pending_xref nodes
+    xref = pending_xref(refdomain="citation", ids=cite_ref["ids"])
+    xref += nodes.inline("", f"[{label}]")
+    cite_ref.replace_self(xref)
+    content += par
+    cit = nodes.citation(backrefs=cite_ref["ids"])
+    cit += nodes.label("", label)
+    content += cit
+    if tagged:
+        content += nodes.comment(DEDUPLICATION_TAG, DEDUPLICATION_TAG)
+    doc += content
+    return xref, cit
+
+
+def test_rename_references():
+    lines = [
+        "Cite [1]_ and [a.b]_, but not [2]_ nor [1].",
+        "",
+        ".. [1] First.",
+        "..  [a.b] Second.",
+        "",
+        ".. [1]_",
+    ]
+    rename_references(MockApp(), "function", "f", None, None, lines)
+    prefix = "R" + hashlib.sha256(b"f").hexdigest()[:HASH_LEN]
+    assert lines == [
+        f"Cite [{prefix}-1]_ and [{prefix}-a.b]_, but not [2]_ nor [1].",
+        "",
+        f".. [{prefix}-1] First.",
+        "..  [a.b] Second.",
+        "",
+        f".. [{prefix}-1]_",
+    ]
+
+
+def test_relabel_references():
+    doc = new_document("test")
+    label = "R" + "0" * HASH_LEN + "-1"
+    xref, cit = _cited_docstring(doc, label)
+    # Citations from other sources are left untouched
+    other_xref, other_cit = _cited_docstring(doc, "other", tagged=False)
+    relabel_references(MockApp(), doc)
+    assert xref.astext() == "[1]"
+    assert cit[0].astext() == "1"
+    assert other_xref.astext() == "[other]"
+    assert other_cit[0].astext() == "other"
+
+
+def test_relabel_references_nested_xref():
+    # The pending_xref of a citation may be nested below the parent of the
+    # reference, e.g. in emphasis, and other docstrings may cite the same label.
+    doc = new_document("test")
+    label = "R" + "0" * HASH_LEN + "-1"
+    xref, _ = _cited_docstring(doc, label)
+    other_xref, _ = _cited_docstring(doc, label, tagged=False)
+    emphasis = nodes.emphasis()
+    xref.replace_self(emphasis)
+    emphasis += xref
+    relabel_references(MockApp(), doc)
+    assert xref.astext() == "[1]"
+    assert other_xref.astext() == f"[{label}]"
+
+
+def test_relabel_references_sibling_sections():
+    # A docstring with headings spans sibling sections, only the last of which
+    # ends with the deduplication tag.
+    doc = new_document("test")
+    labels = ["R" + "0" * HASH_LEN + f"-{i}" for i in range(3)]
+    cited = [
+        _cited_docstring(doc, label, tagged=i == 1, container=nodes.section)
+        for i, label in enumerate(labels)
+    ]
+    relabel_references(MockApp(), doc)
+    assert [xref.astext() for xref, _ in cited] == ["[0]", "[1]", f"[{labels[2]}]"]
+
+
 def test_clean_backrefs():
     """Check ids are not cleaned from inline backrefs."""
     par = nodes.paragraph(rawsource="", text="")
@@ -353,6 +613,60 @@ def test_clean_backrefs():
     assert "id1" in citation["backrefs"]
 
 
+def test_clean_backrefs_document():
+    doc = new_document("test")
+    par = nodes.paragraph()
+    ref = nodes.reference("", "[1]", refid="r123-1")
+    doc.set_id(ref, par)
+    par += ref
+    cit = nodes.citation(backrefs=[ref["ids"][0], "dangling"])
+    cit += nodes.label("", "1")
+    doc.set_id(cit, par)
+    doc += [par, cit]
+    clean_backrefs(app=MockApp(), doc=doc, docname="index")
+    assert cit["backrefs"] == ref["ids"]
+
+    # The latex, singlehtml and texinfo builders clean copies of the documents,
+    # whose ids are not filled in.
+    cit["backrefs"].append("dangling")
+    copy = doc.deepcopy()
+    clean_backrefs(app=MockApp(), doc=copy, docname="index")
+    (copied_cit,) = copy.findall(nodes.citation)
+    assert copied_cit["backrefs"] == ref["ids"]
+
+
+@pytest.mark.parametrize("with_citation", [False, True])
+def test_clean_backrefs_single_traversal(monkeypatch, with_citation):
+    doc = new_document("test")
+    doc += nodes.paragraph("", "No citations here.")
+    if with_citation:
+        doc += nodes.citation(backrefs=["dangling"])
+
+    conditions = []
+    findall = numpydoc.numpydoc._traverse_or_findall
+
+    def record(node, condition, **kwargs):
+        conditions.append(condition)
+        return findall(node, condition, **kwargs)
+
+    monkeypatch.setattr("numpydoc.numpydoc._traverse_or_findall", record)
+    clean_backrefs(app=MockApp(), doc=doc, docname="index")
+    assert conditions == [nodes.Element]
+    if with_citation:
+        assert doc[-1]["backrefs"] == []
+
+
+def test_module_package_path(monkeypatch):
+    module = importlib.import_module("numpydoc.hooks.utils")
+    _module_package_path.cache_clear()
+    assert _module_package_path(module) == "hooks/utils.py"
+
+    # The path is computed once per module, not for each of its members
+    monkeypatch.setattr("numpydoc.numpydoc.importlib", None)
+    assert _module_package_path(module) == "hooks/utils.py"
+    assert _module_package_path.cache_info().hits == 1
+
+
 @pytest.mark.parametrize(
     "exclude_files, has_warnings",
     [
@@ -0,0 +1,216 @@
+import textwrap
+
+import pytest
+
+from numpydoc.docscrape import NumpyDocString
+from numpydoc.spans import Span, parse_spans
+from numpydoc.tests import test_docscrape
+
+doc_txt = """\
+  numpy.multivariate_normal(mean, cov, shape=None, spam=None)
+
+  Draw values from a multivariate normal distribution with specified
+  mean and covariance.
+
+  The multivariate normal or Gaussian distribution is a generalisation
+  of the one-dimensional normal distribution to higher dimensions.
+
+  Parameters
+  ----------
+  mean : (N,) ndarray
+      Mean of the N-dimensional distribution.
+
+      .. math::
+
+         (1+2+3)/3
+
+  cov : (N, N) ndarray
+      Covariance matrix of the distribution.
+  shape : tuple of ints
+  dtype :
+      Type of the output.
+
+  Returns
+  -------
+  ndarray
+      The drawn samples.
+
+  Raises
+  ------
+  RuntimeError
+      Some error
+
+  Unknown Section
+  ---------------
+  Skipped, with a warning by NumpyDocString.
+
+  Notes
+  -----
+  Instead of specifying the full covariance matrix, popular
+  approximations include:
+
+    - Spherical covariance (`cov` is a multiple of the identity matrix)
+    - Diagonal covariance (`cov` has non-negative elements only on the diagonal)
+
+  .. index:: random
+     :refguide: random;distributions, random;gauss
+
+  """
+
+
+@pytest.fixture(params=["", "\n    "], ids=["flush", "newline_indented"])
+def source(request):
+    return request.param + doc_txt
+
+
+def test_sections(source):
+    spans = parse_spans(source)
+    assert list(spans) == [
+        "Signature",
+        "Summary",
+        "Extended Summary",
+        "Parameters",
+        "Returns",
+        "Raises",
+        "Notes",
+        "index",
+    ]
+    assert spans["Summary"].title is None
+    assert spans["Parameters"].title.text == "Parameters"
+    assert spans["index"].title.text == ".. index:: random"
+    assert spans["Summary"].body.lines() == [
+        "Draw values from a multivariate normal distribution with specified",
+        "mean and covariance.",
+    ]
+
+
+def test_signature(source):
+    signature = parse_spans(source)["Signature"].body
+    assert (
+        signature.text == "numpy.multivariate_normal(mean, cov, shape=None, spam=None)"
+    )
+    assert signature.col == (6 if source.startswith("\n") else 2)
+
+
+def test_items(source):
+    spans = parse_spans(source)
+    items = spans["Parameters"].items
+    assert [item.name.text for item in items] == ["mean", "cov", "shape", "dtype"]
+    assert [item.type and item.type.text for item in items] == [
+        "(N,) ndarray",
+        "(N, N) ndarray",
+        "tuple of ints",
+        None,
+    ]
+    assert items[0].desc.lines() == [
+        "Mean of the N-dimensional distribution.",
+        "",
+        ".. math::",
+        "",
+        "   (1+2+3)/3",
+    ]
+    assert items[2].desc is None
+
+    (returns,) = spans["Returns"].items
+    assert returns.name is None
+    assert returns.type.text == "ndarray"
+    (raises,) = spans["Raises"].items
+    assert raises.type.text == "RuntimeError"
+
+
+def test_positions(source):
+    spans = parse_spans(source)
+    offset = 1 if source.startswith("\n") else 0
+    cov = spans["Parameters"].items[1]
+    assert cov.name.lineno == 17 + offset
+    assert (cov.type.lineno, cov.type.col) == (17 + offset, cov.name.col + 6)
+    assert source.split("\n")[cov.type.lineno][cov.type.col :] == cov.type.text
+    notes = spans["Notes"].body
+    assert (notes.lineno, notes.end_lineno) == (39 + offset, 43 + offset)
+    assert repr(cov.type).startswith("<Span '(N, N) ndarray' at ")
+
+
+def _squeeze_blank_lines(lines):
+    # NumpyDocString collapses consecutive blank lines, spans keep them
+    return [line for i, line in enumerate(lines) if line or i == 0 or lines[i - 1]]
+
+
+def _assert_agrees_with_numpydocstring(docstring):
+    doc = NumpyDocString(docstring)
+    spans = parse_spans(docstring)
+    present = [
+        key
+        for key, value in doc.items()
+        if value and value != NumpyDocString.sections[key]
+    ]
+    # Spans are in the order of the docstring, not of NumpyDocString.sections
+    assert sorted(key for key in spans if spans[key].body is not None) == sorted(
+        present
+    )
+    for key in present:
+        section = spans[key]
+        if section.items is not None:
+            parsed = [
+                (
+                    item.name.text if item.name else "",
+                    item.type.text if item.type else "",
+                    item.desc.lines() if item.desc else [],
+                )
+                for item in section.items
+            ]
+            assert parsed == [tuple(param) for param in doc[key]]
+        elif key == "Signature":
+            assert section.body.text == doc[key]
+        elif key not in ("See Also", "index"):
+            # NumpyDocString parses the others further, not into lines
+            assert _squeeze_blank_lines(section.body.lines()) == doc[key]
+
+
+@pytest.mark.parametrize(
+    "docstring",
+    [
+        "",
+        "Summary only.",
+        "f(x)",
+        "f(x)\n\nSummary.",
+        "Summary.\n\nParameters\n----------\nx : int\n\n\ny : int\n    Y.",
+        "Summary.\n\nReturns\n-------\nint\n    An int.\nb : bool",
+        "Summary.\n\nSee Also\n--------\nfunc_a, func_b\nfunc_c : Description.",
+        "Parameters\n----------\nx\n    No summary.",
+        "\n       Indented summary.\n\n    Returns\n    -------\n    int",
+        "Summary.\n\nNotes\n-----\n    Indented more than the title.",
+    ],
+)
+def test_agrees_with_numpydocstring(docstring):
+    _assert_agrees_with_numpydocstring(docstring)
+
+
+@pytest.mark.parametrize(
+    "name",
+    ["doc_txt", "doc_yields_txt", "doc_sent_txt", "class_doc_txt", "xref_doc_txt"],
+)
+def test_agrees_with_numpydocstring_on_docscrape_tests(name):
+    # Keeps the two parsers in sync on the docstrings NumpyDocString is tested on
+    _assert_agrees_with_numpydocstring(getattr(test_docscrape, name))
+
+
+def test_span_positions_without_line_starts():
+    span = Span("ab\ncd\n\nef", 4, 4)
+    assert span.text == "d\n\ne"
+    assert (span.lineno, span.col, span.end_lineno) == (1, 1, 3)
+
+
+def test_source_is_not_copied():
+    source = textwrap.dedent(
+        """
+        Summary.
+
+        Parameters
+        ----------
+        x : int
+            The x.
+        """
+    )
+    item = parse_spans(source)["Parameters"].items[0]
+    assert item.desc.source is source
+    assert source[item.desc.offset : item.desc.stop] == "    The x."
@@ -1,4 +1,6 @@
+import ast
 import sys
+import textwrap
 import warnings
 from contextlib import nullcontext
 from dataclasses import dataclass
@@ -99,6 +101,10 @@ def test_extract_ignore_validation_comments(tmp_path, file_contents, expected):
     with open(filepath, "w") as file:
         file.write(file_contents)
     assert validate.extract_ignore_validation_comments(filepath) == expected
+    assert (
+        validate.extract_ignore_validation_comments_from_source(file_contents)
+        == expected
+    )
 
 
 @pytest.mark.parametrize(
@@ -1920,6 +1926,8 @@ class TestValidatorClass:
                 "numpydoc.tests.test_validate.DecoratorClass.test_async",
                 getsourcelines(DecoratorClass.test_async)[-1],
             ],
+            # A package without any def or class
+            ["numpydoc.hooks", None],
         ],
     )
     def test_source_file_def_line_with_decorators(self, decorated_obj, def_line):
@@ -1990,3 +1998,279 @@ def test_is_generator_validation_with_decorator():
     # Wrapped multiple times
     v = Validator(get_doc_object(baz))
     assert v.is_generator_function
+
+
+def test_analyze_functions():
+    """Ensure function facts are collected for every def in a single pass."""
+    tree = ast.parse(
+        textwrap.dedent(
+            """
+            def returns(a, /, b, *args, c, **kwargs):
+                def nested():
+                    return 1
+                return a
+
+            def bare_return():
+                if True:
+                    return
+                return None
+
+            async def generator(x=(lambda: (yield))):
+                yield x
+
+            class Klass:
+                def method(self, a):
+                    return lambda: a
+
+                @classmethod
+                def from_none(cls):
+                    yield from []
+            """
+        )
+    )
+    facts = {node.name: fact for node, fact in validate.analyze_functions(tree).items()}
+    assert facts == {
+        "returns": validate.FunctionFacts(
+            True, False, False, ("a", "b", "*args", "c", "**kwargs")
+        ),
+        "nested": validate.FunctionFacts(True, False, False, ()),
+        "bare_return": validate.FunctionFacts(False, False, False, ()),
+        "generator": validate.FunctionFacts(False, True, True, ("x",)),
+        "method": validate.FunctionFacts(True, False, False, ("a",)),
+        "from_none": validate.FunctionFacts(False, True, False, ()),
+    }
+
+
+def test_analyze_functions_yields_anywhere_in_body():
+    """Yields nested in statements or expressions make a generator."""
+    tree = ast.parse(
+        textwrap.dedent(
+            """
+            def loop_generator(n):
+                for i in range(n):
+                    yield i
+
+            def coroutine():
+                value = yield
+                print((yield value))
+
+            def not_a_generator():
+                def nested():
+                    yield 1
+                return [lambda: (yield)]
+            """
+        )
+    )
+    facts = {
+        node.name: fact.yields
+        for node, fact in validate.analyze_functions(tree).items()
+    }
+    assert facts == {
+        "loop_generator": True,
+        "coroutine": True,
+        "nested": True,
+        "not_a_generator": False,
+    }
+
+
+def test_analyze_functions_ignores_nested_async_returns():
+    """Returns of nested async functions do not count for the enclosing one."""
+    tree = ast.parse(
+        textwrap.dedent(
+            """
+            def outer():
+                async def inner():
+                    return 1
+            """
+        )
+    )
+    facts = {
+        node.name: fact.returns_value
+        for node, fact in validate.analyze_functions(tree).items()
+    }
+    assert facts == {"outer": False, "inner": True}
+
+
+def _returns_in_nested_async():
+    """Return nothing, only the nested coroutine does."""
+
+    async def inner():
+        return 1
+
+    inner().close()
+
+
+def test_method_returns_something_ignores_nested_async_returns():
+    doc = Validator(get_doc_object(_returns_in_nested_async))
+    assert not doc.method_returns_something
+    assert "RT01" not in {
+        code
+        for code, _ in validate.validate(get_doc_object(_returns_in_nested_async))[
+            "errors"
+        ]
+    }
+
+
+def test_all_checks_registered():
+    """Ensure every error code, except GL08, is reported by a registered check."""
+    registered = set().union(*(codes for codes, _ in validate._CHECKS))
+    assert registered == ALL_CHECKS - {"GL08"}
+
+
+@pytest.mark.parametrize(
+    "checks",
+    [{"PR01"}, {"PR01", "PR02", "GL08"}, {"SS02", "SS06", "RT01"}, ALL_CHECKS, set()],
+)
+@pytest.mark.parametrize(
+    "obj_name",
+    [
+        "numpydoc.tests.test_validate.BadParameters.missing_params",
+        "numpydoc.tests.test_validate.BadParameters.no_type",
+        "numpydoc.tests.test_validate.BadSummaries",
+        "numpydoc.tests.test_validate.BadReturns.no_type",
+        "numpydoc.tests.test_validate._DummyList.clear",
+    ],
+)
+def test_validate_selected_checks(obj_name, checks):
+    """Ensure that running selected checks matches filtering all of them."""
+    errors = validate_one(obj_name)["errors"]
+    assert validate_one(obj_name, checks=checks)["errors"] == [
+        err for err in errors if err[0] in checks
+    ]
+
+
+def test_validate_selected_checks_skip_unneeded_inputs(monkeypatch):
+    """Ensure that the inputs of unselected checks are not computed."""
+
+    def fail(self):
+        raise AssertionError("method_returns_something should not be computed")
+
+    monkeypatch.setattr(Validator, "method_returns_something", property(fail))
+    obj_name = "numpydoc.tests.test_validate.BadParameters.missing_params"
+    result = validate_one(obj_name, checks={"PR01", "PR02", "GL08"})
+    assert [err[0] for err in result["errors"]] == ["PR01"]
+    with pytest.raises(AssertionError, match="should not be computed"):
+        validate_one(obj_name, checks={"RT01"})
+
+
+def test_validator_caches_derived_properties(monkeypatch):
+    """Ensure that derived properties are computed once per Validator."""
+    calls = []
+    _doc_parameters = Validator._doc_parameters
+
+    def counting_doc_parameters(self, sections):
+        calls.append(sections)
+        return _doc_parameters(self, sections)
+
+    monkeypatch.setattr(Validator, "_doc_parameters", counting_doc_parameters)
+    doc = Validator(get_doc_object(BadParameters.missing_params))
+    for _ in range(3):
+        assert doc.parameter_type("kind") == "str"
+    assert doc.section_titles is doc.section_titles
+    assert calls == [["Parameters", "Other Parameters"]]
+
+    validate_one(doc.doc)
+    assert len(calls) == 2
+
+
+VALIDATE_MANY_NAMES = [
+    "numpydoc.tests.test_validate.GoodDocStrings.plot",
+    "numpydoc.validate.error",
+    "numpydoc.tests.test_validate.BadSummaries.multi_line",
+    "numpydoc.tests.test_validate.GoodDocStrings",
+    "numpydoc.validate.Validator._load_obj",
+]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_validate_many(jobs):
+    results = list(validate.validate_many(VALIDATE_MANY_NAMES, jobs=jobs))
+    assert [name for name, _ in results] == VALIDATE_MANY_NAMES
+    for name, report in results:
+        assert report == validate_one(name)
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_validate_many_failures(jobs, tmp_path, monkeypatch):
+    (tmp_path / "broken_module.py").write_text("raise ValueError('broken')\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    names = [
+        "numpydoc.validate.missing",
+        "broken_module.f",
+        "unknown_module",
+        "numpydoc.validate.error",
+    ]
+    results = list(validate.validate_many(names, jobs=jobs))
+    assert [name for name, _ in results] == names
+    errors = [report["errors"] for _, report in results]
+    assert errors[0] == [
+        (
+            "AttributeError",
+            "module 'numpydoc.validate' has no attribute 'missing'",
+        )
+    ]
+    assert errors[1] == [("ValueError", "broken")]
+    assert errors[2] == [
+        ("ImportError", 'No module can be imported from "unknown_module"')
+    ]
+    assert results[3][1] == validate_one(names[3])
+
+
+def test_validate_many_jobs_import_in_workers(tmp_path, monkeypatch):
+    imports = tmp_path / "imports.txt"
+    (tmp_path / "imported_in_worker.py").write_text(
+        f"with open({str(imports)!r}, 'a') as f:\n    f.write('imported\\n')\n\n\n"
+        "def f():\n    pass\n\n\ndef g():\n    pass\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    names = [
+        "imported_in_worker.f",
+        "numpydoc.validate.error",
+        "imported_in_worker.g",
+    ]
+    results = list(validate.validate_many(names, jobs=2))
+    assert [name for name, _ in results] == names
+    assert results[0][1]["errors"][0][0] == "GL08"
+    # Not imported by the calling process, and once for both functions
+    assert "imported_in_worker" not in sys.modules
+    assert imports.read_text() == "imported\n"
+
+
+def test_validate_many_is_lazy():
+    consumed = []
+
+    def names():
+        for name in VALIDATE_MANY_NAMES:
+            consumed.append(name)
+            yield name
+
+    results = validate.validate_many(names())
+    for name, _ in results:
+        assert consumed[-1] == name
+
+
+def test_validate_many_checks():
+    results = dict(validate.validate_many(VALIDATE_MANY_NAMES, checks={"SS06"}))
+    assert results[VALIDATE_MANY_NAMES[2]]["errors"] == [
+        ("SS06", validate.ERROR_MSGS["SS06"])
+    ]
+    assert all(
+        err[0] == "SS06" for report in results.values() for err in report["errors"]
+    )
+
+
+def test_object_index(monkeypatch):
+    index = validate._ObjectIndex()
+    assert index.split("numpydoc.validate.Validator.type") == (
+        "numpydoc.validate",
+        ("Validator", "type"),
+    )
+    assert index.load("numpydoc.validate.Validator.type") is Validator.type
+
+    with pytest.raises(ImportError, match='No module can be imported from "unknown"'):
+        validate._ObjectIndex().split("unknown")
+
+    # Modules and attributes are only looked up once
+    monkeypatch.setattr(validate.importlib, "import_module", None)
+    monkeypatch.setattr(Validator, "type", None)
+    assert index.load("numpydoc.validate.Validator.type") is not None
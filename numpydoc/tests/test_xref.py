@@ -1,6 +1,8 @@
+import pickle
+
 import pytest
 
-from numpydoc.xref import DEFAULT_LINKS, make_xref
+from numpydoc.xref import DEFAULT_LINKS, XrefResolver, make_xref
 
 # Use the default numpydoc link mapping
 xref_aliases = DEFAULT_LINKS
@@ -219,3 +221,30 @@ def test_make_xref_ignore_unknown(param_type, expected_result):
 def test_xref_ignore_is_all():
     with pytest.raises(TypeError, match="must be a set or 'all'"):
         make_xref("array_like", xref_aliases, xref_ignore="foo")
+
+
+@pytest.mark.parametrize("ignore", [xref_ignore, "all"])
+def test_xref_resolver(ignore):
+    resolve = XrefResolver(xref_aliases, ignore)
+    param_types = [s.split("\n")[0] for s in data.strip().split("\n\n")]
+    for param_type in param_types * 2:
+        assert resolve(param_type) == make_xref(param_type, xref_aliases, ignore)
+    info = resolve.cache_info()
+    assert info.misses == len(set(param_types))
+    assert info.hits == 2 * len(param_types) - info.misses
+
+    # The cache is not pickled, only the configuration
+    restored = pickle.loads(pickle.dumps(resolve))
+    assert restored.cache_info().currsize == 0
+    assert restored(param_types[0]) == resolve(param_types[0])
+
+    resolve.cache_clear()
+    assert resolve.cache_info().currsize == 0
+
+
+def test_xref_resolver_bounded():
+    resolve = XrefResolver(xref_aliases, xref_ignore, maxsize=2)
+    for param_type in ["int", "float", "str", "int"]:
+        resolve(param_type)
+    assert resolve.cache_info().currsize == 2
+    assert resolve.cache_info().hits == 0
@@ -11,6 +11,8 @@ import collections
 import functools
 import importlib
 import inspect
+import io
+import itertools
 import os
 import pydoc
 import re
@@ -140,22 +142,43 @@ def extract_ignore_validation_comments(
     dict[int, list[str]]
         Mapping of line number to a list of checks to ignore.
     """
-    numpydoc_ignore_comments = {}
     try:
         file = open(filepath, encoding=encoding)
     except (OSError, TypeError):  # can be None, nonexistent, or unreadable
-        return numpydoc_ignore_comments
+        return {}
     with file:
-        last_declaration = 1
-        declarations = ["def", "class"]
-        for token in tokenize.generate_tokens(file.readline):
-            if token.type == tokenize.NAME and token.string in declarations:
-                last_declaration = token.start[0]
-            if token.type == tokenize.COMMENT:
-                match = re.match(IGNORE_COMMENT_PATTERN, token.string)
-                if match:
-                    rules = match.group(1).split(",")
-                    numpydoc_ignore_comments[last_declaration] = rules
+        return _extract_ignore_validation_comments(file.readline)
+
+
+def extract_ignore_validation_comments_from_source(source: str) -> Dict[int, List[str]]:
+    """
+    Extract inline comments indicating certain validation checks should be ignored.
+
+    Parameters
+    ----------
+    source : str
+        The source code of the file being inspected.
+
+    Returns
+    -------
+    dict[int, list[str]]
+        Mapping of line number to a list of checks to ignore.
+    """
+    return _extract_ignore_validation_comments(io.StringIO(source).readline)
+
+
+def _extract_ignore_validation_comments(readline) -> Dict[int, List[str]]:
+    numpydoc_ignore_comments = {}
+    last_declaration = 1
+    declarations = ["def", "class"]
+    for token in tokenize.generate_tokens(readline):
+        if token.type == tokenize.NAME and token.string in declarations:
+            last_declaration = token.start[0]
+        if token.type == tokenize.COMMENT:
+            match = re.match(IGNORE_COMMENT_PATTERN, token.string)
+            if match:
+                rules = match.group(1).split(",")
+                numpydoc_ignore_comments[last_declaration] = rules
     return numpydoc_ignore_comments
 
 
@@ -220,8 +243,133 @@ def error(code, **kwargs):
     return code, ERROR_MSGS[code].format(**kwargs)
 
 
+FunctionFacts = collections.namedtuple(
+    "FunctionFacts", ["returns_value", "yields", "is_async", "parameters"]
+)
+
+
+class _FunctionFactsVisitor(ast.NodeVisitor):
+    """Collect the :class:`FunctionFacts` of every function in a single walk."""
+
+    def __init__(self):
+        self.facts = {}
+        # Enclosing scopes (function, lambda or class nodes) of the visited node
+        self._scopes = []
+        # Returns and yields found so far, for each enclosing function or lambda
+        self._frames = []
+
+    def _signature_parameters(self, node):
+        args_node = node.args
+        params = []
+        for arg_type in ["posonlyargs", "args", "vararg", "kwonlyargs", "kwarg"]:
+            entries = getattr(args_node, arg_type)
+            if arg_type == "vararg":
+                if entries:
+                    params.append(f"*{entries.arg}")
+            elif arg_type == "kwarg":
+                if entries:
+                    params.append(f"**{entries.arg}")
+            else:
+                params.extend([arg.arg for arg in entries])
+        params = tuple(params)
+        if (
+            params
+            and params[0] in {"self", "cls"}
+            and self._scopes
+            and isinstance(self._scopes[-1], ast.ClassDef)
+        ):
+            return params[1:]
+        return params
+
+    def _visit_function(self, node):
+        # Decorators, defaults and annotations belong to the enclosing scope
+        for child in [*node.decorator_list, node.args, node.returns]:
+            if child is not None:
+                self.visit(child)
+
+        parameters = self._signature_parameters(node)
+        frame = {"returns_value": False, "yields": False}
+        self._scopes.append(node)
+        self._frames.append(frame)
+        for child in node.body:
+            self.visit(child)
+        self._frames.pop()
+        self._scopes.pop()
+
+        self.facts[node] = FunctionFacts(
+            returns_value=frame["returns_value"],
+            yields=frame["yields"],
+            is_async=isinstance(node, ast.AsyncFunctionDef),
+            parameters=parameters,
+        )
+
+    visit_FunctionDef = _visit_function
+    visit_AsyncFunctionDef = _visit_function
+
+    def visit_Lambda(self, node):
+        self.visit(node.args)
+        self._scopes.append(node)
+        self._frames.append({"returns_value": False, "yields": False})
+        self.visit(node.body)
+        self._frames.pop()
+        self._scopes.pop()
+
+    def visit_ClassDef(self, node):
+        for child in [*node.decorator_list, *node.bases, *node.keywords]:
+            self.visit(child)
+        self._scopes.append(node)
+        for child in node.body:
+            self.visit(child)
+        self._scopes.pop()
+
+    def visit_Return(self, node):
+        # Bare returns and returns valued None are disconsidered
+        value = node.value
+        if (
+            self._frames
+            and value is not None
+            and not (isinstance(value, ast.Constant) and value.value is None)
+        ):
+            self._frames[-1]["returns_value"] = True
+        self.generic_visit(node)
+
+    def _visit_yield(self, node):
+        if self._frames:
+            self._frames[-1]["yields"] = True
+        self.generic_visit(node)
+
+    visit_Yield = _visit_yield
+    visit_YieldFrom = _visit_yield
+
+
+def analyze_functions(tree: ast.AST) -> Dict[ast.AST, FunctionFacts]:
+    """
+    Collect facts about every function definition in an AST in a single pass.
+
+    Parameters
+    ----------
+    tree : ast.AST
+        The node to analyze, usually a whole module.
+
+    Returns
+    -------
+    dict[ast.AST, FunctionFacts]
+        Mapping of each ``FunctionDef`` and ``AsyncFunctionDef`` node found in
+        ``tree`` to whether it returns a value (bare returns, returns valued
+        None and returns from nested functions are disconsidered), whether it
+        yields (anywhere in its body, except in nested functions), whether it
+        is async, and its signature parameters (without ``self`` or ``cls``
+        for methods).
+    """
+    visitor = _FunctionFactsVisitor()
+    visitor.visit(tree)
+    return visitor.facts
+
+
 class Validator:
     # TODO Can all this class be merged into NumpyDocString?
+    # Properties derived from the docstring are cached, since the checks access
+    # them repeatedly (e.g. ``parameter_type`` once per parameter and check).
     def __init__(self, doc_object):
         self.doc = doc_object
         self.obj = self.doc._obj
@@ -326,13 +474,19 @@ class Validator:
             # getsourcelines will return the line of the first decorator found for the
             # current function. We have to find the def declaration after that.
             def_line = next(
-                i
-                for i, x in enumerate(
-                    re.match(r"^\s*(async\s+)?(?:def|class)\s+", s)
-                    for s in sourcelines[0]
-                )
-                if x is not None
+                (
+                    i
+                    for i, x in enumerate(
+                        re.match(r"^\s*(async\s+)?(?:def|class)\s+", s)
+                        for s in sourcelines[0]
+                    )
+                    if x is not None
+                ),
+                None,
             )
+            if def_line is None:
+                # e.g. a module or package without any function or class
+                return None
             return sourcelines[-1] + def_line
         except (OSError, TypeError):
             # In some cases the object is something complex like a cython
@@ -340,6 +494,13 @@ class Validator:
             # return the line number as None, than crash
             pass
 
+    @property
+    def ignore_validation_comments(self):
+        """
+        Checks to ignore, by line number, from inline comments in the source file.
+        """
+        return extract_ignore_validation_comments(self.source_file_name)
+
     @property
     def start_blank_lines(self):
         i = None
@@ -368,7 +529,7 @@ class Validator:
             prev = row.strip()
         return False
 
-    @property
+    @functools.cached_property
     def section_titles(self):
         sections = []
         self.doc._doc.reset()
@@ -382,7 +543,7 @@ class Validator:
                 sections.append(content[0])
         return sections
 
-    @property
+    @functools.cached_property
     def summary(self):
         return " ".join(self.doc["Summary"])
 
@@ -390,7 +551,7 @@ class Validator:
     def num_summary_lines(self):
         return len(self.doc["Summary"])
 
-    @property
+    @functools.cached_property
     def extended_summary(self):
         if not self.doc["Extended Summary"] and len(self.doc["Summary"]) > 1:
             return " ".join(self.doc["Summary"])
@@ -404,19 +565,19 @@ class Validator:
                     parameters[name] = (type_, desc)
         return parameters
 
-    @property
+    @functools.cached_property
     def doc_parameters(self):
         return self._doc_parameters(["Parameters"])
 
-    @property
+    @functools.cached_property
     def doc_other_parameters(self):
         return self._doc_parameters(["Other Parameters"])
 
-    @property
+    @functools.cached_property
     def doc_all_parameters(self):
         return self._doc_parameters(["Parameters", "Other Parameters"])
 
-    @property
+    @functools.cached_property
     def signature_parameters(self):
         def add_stars(param_name, info):
             """
@@ -462,7 +623,7 @@ class Validator:
             return params[1:]
         return params
 
-    @property
+    @functools.cached_property
     def parameter_mismatches(self):
         errs = []
         signature_params = self.signature_parameters
@@ -494,7 +655,7 @@ class Validator:
     def parameter_type(self, param):
         return self.doc_all_parameters[param][0]
 
-    @property
+    @functools.cached_property
     def see_also(self):
         result = collections.OrderedDict()
         for funcs, desc in self.doc["See Also"]:
@@ -515,7 +676,7 @@ class Validator:
     def yields(self):
         return self.doc["Yields"]
 
-    @property
+    @functools.cached_property
     def method_source(self):
         try:
             source = inspect.getsource(self.obj)
@@ -523,7 +684,7 @@ class Validator:
             return ""
         return textwrap.dedent(source)
 
-    @property
+    @functools.cached_property
     def method_returns_something(self):
         """
         Check if the docstrings method can return something.
@@ -536,29 +697,12 @@ class Validator:
         bool
             Whether the docstrings method can return something.
         """
-
-        def get_returns_not_on_nested_functions(node):
-            returns = [node] if isinstance(node, ast.Return) else []
-            for child in ast.iter_child_nodes(node):
-                # Ignore nested functions and its subtrees.
-                if not isinstance(child, ast.FunctionDef):
-                    child_returns = get_returns_not_on_nested_functions(child)
-                    returns.extend(child_returns)
-            return returns
-
         tree = ast.parse(self.method_source).body
-        if tree:
-            returns = get_returns_not_on_nested_functions(tree[0])
-            return_values = [r.value for r in returns]
-            # Replace Constant nodes valued None for None.
-            for i, v in enumerate(return_values):
-                if isinstance(v, ast.Constant) and v.value is None:
-                    return_values[i] = None
-            return any(return_values)
-        else:
-            return False
+        if tree and isinstance(tree[0], ast.FunctionDef | ast.AsyncFunctionDef):
+            return analyze_functions(tree[0])[tree[0]].returns_value
+        return False
 
-    @property
+    @functools.cached_property
     def deprecated(self):
         return ".. deprecated:: " in (self.summary + self.extended_summary)
 
@@ -594,7 +738,204 @@ def _find_class_node(module_node: ast.AST, cls_name) -> ast.ClassDef:
     raise ValueError(f"Could not find class node {cls_name}")
 
 
-def validate(obj_name, validator_cls=None, **validator_kwargs):
+# Registry of the checks run by ``validate``, in the order their errors are
+# reported. Each entry holds the error codes a check can report and the
+# function running it. The Validator properties a check needs are computed
+# lazily on first access, so only the inputs of the selected checks are
+# ever computed.
+_CHECKS = []
+
+
+def _register_check(*codes):
+    def decorator(func):
+        _CHECKS.append((frozenset(codes), func))
+        return func
+
+    return decorator
+
+
+@_register_check("GL01")
+def _check_start_blank_lines(doc):
+    if doc.start_blank_lines not in (0, 1) and "\n" in doc.raw_doc:
+        yield error("GL01")
+
+
+@_register_check("GL02")
+def _check_end_blank_lines(doc):
+    if doc.end_blank_lines != 1 and "\n" in doc.raw_doc:
+        yield error("GL02")
+
+
+@_register_check("GL03")
+def _check_double_blank_lines(doc):
+    if doc.double_blank_lines:
+        yield error("GL03")
+
+
+@_register_check("GL05")
+def _check_tabs(doc):
+    for line in doc.raw_doc.splitlines():
+        if re.match("^ *\t", line):
+            yield error("GL05", line_with_tabs=line.lstrip())
+
+
+@_register_check("GL06")
+def _check_unknown_sections(doc):
+    unexpected_sections = [
+        section for section in doc.section_titles if section not in ALLOWED_SECTIONS
+    ]
+    for section in unexpected_sections:
+        yield error(
+            "GL06", section=section, allowed_sections=", ".join(ALLOWED_SECTIONS)
+        )
+
+
+@_register_check("GL07")
+def _check_section_order(doc):
+    correct_order = [
+        section for section in ALLOWED_SECTIONS if section in doc.section_titles
+    ]
+    if correct_order != doc.section_titles:
+        yield error("GL07", correct_sections=", ".join(correct_order))
+
+
+@_register_check("GL09")
+def _check_deprecation_position(doc):
+    if doc.deprecated and not doc.extended_summary.startswith(".. deprecated:: "):
+        yield error("GL09")
+
+
+@_register_check("GL10")
+def _check_directives(doc):
+    directives_without_two_colons = doc.directives_without_two_colons
+    if directives_without_two_colons:
+        yield error("GL10", directives=directives_without_two_colons)
+
+
+@_register_check("SS01")
+def _check_summary_exists(doc):
+    if not doc.summary:
+        yield error("SS01")
+
+
+@_register_check("SS02", "SS03", "SS04", "SS05", "SS06")
+def _check_summary(doc):
+    if not doc.summary:
+        return
+    if doc.summary[0].isalpha() and not doc.summary[0].isupper():
+        yield error("SS02")
+    if doc.summary[-1] != ".":
+        yield error("SS03")
+    if doc.summary != doc.summary.lstrip():
+        yield error("SS04")
+    # Heuristic to check for infinitive verbs - shouldn't end in "s"
+    elif (
+        doc.is_function_or_method
+        and len(doc.summary.split(" ")[0]) > 1
+        and doc.summary.split(" ")[0][-1] == "s"
+        and doc.summary.split(" ")[0][-2] != "s"
+    ):
+        yield error("SS05")
+    if doc.num_summary_lines > 1:
+        yield error("SS06")
+
+
+@_register_check("ES01")
+def _check_extended_summary(doc):
+    if not doc.is_mod and not doc.extended_summary:
+        yield ("ES01", "No extended summary found")
+
+
+@_register_check("PR01", "PR02", "PR03")
+def _check_parameter_mismatches(doc):
+    # PR01: Parameters not documented
+    # PR02: Unknown parameters
+    # PR03: Wrong parameters order
+    yield from doc.parameter_mismatches
+
+
+@_register_check("PR04", "PR05", "PR06", "PR07", "PR08", "PR09", "PR10")
+def _check_parameters(doc):
+    for param, kind_desc in doc.doc_all_parameters.items():
+        if not param.startswith("*"):  # Check can ignore var / kwargs
+            if not doc.parameter_type(param):
+                if ":" in param:
+                    yield error("PR10", param_name=param.split(":")[0])
+                else:
+                    yield error("PR04", param_name=param)
+            else:
+                if doc.parameter_type(param)[-1] == ".":
+                    yield error("PR05", param_name=param)
+                # skip common_type_error checks when the param type is a set of
+                # options
+                if "{" in doc.parameter_type(param):
+                    continue
+                common_type_errors = [
+                    ("integer", "int"),
+                    ("boolean", "bool"),
+                    ("string", "str"),
+                ]
+                for wrong_type, right_type in common_type_errors:
+                    if wrong_type in set(re.split(r"\W", doc.parameter_type(param))):
+                        yield error(
+                            "PR06",
+                            param_name=param,
+                            right_type=right_type,
+                            wrong_type=wrong_type,
+                        )
+        yield from _check_desc(kind_desc[1], "PR07", "PR08", "PR09", param_name=param)
+
+
+@_register_check("RT01")
+def _check_returns_exists(doc):
+    if doc.is_function_or_method and not doc.returns:
+        if doc.method_returns_something:
+            yield error("RT01")
+
+
+@_register_check("RT02", "RT03", "RT04", "RT05")
+def _check_returns(doc):
+    if doc.is_function_or_method and doc.returns:
+        if len(doc.returns) == 1 and doc.returns[0].name:
+            yield error("RT02")
+        for name_or_type, type_, desc in doc.returns:
+            yield from _check_desc(desc, "RT03", "RT04", "RT05")
+
+
+@_register_check("YD01")
+def _check_yields(doc):
+    if doc.is_function_or_method:
+        if not doc.yields and doc.is_generator_function:
+            yield error("YD01")
+
+
+@_register_check("SA01")
+def _check_see_also_exists(doc):
+    if not doc.is_mod and not doc.see_also:
+        yield error("SA01")
+
+
+@_register_check("SA02", "SA03", "SA04")
+def _check_see_also(doc):
+    if doc.is_mod:
+        return
+    for rel_name, rel_desc in doc.see_also.items():
+        if rel_desc:
+            if not rel_desc.endswith("."):
+                yield error("SA02", reference_name=rel_name)
+            if rel_desc[0].isalpha() and not rel_desc[0].isupper():
+                yield error("SA03", reference_name=rel_name)
+        else:
+            yield error("SA04", reference_name=rel_name)
+
+
+@_register_check("EX01")
+def _check_examples(doc):
+    if not doc.is_mod and not doc.examples:
+        yield error("EX01")
+
+
+def validate(obj_name, validator_cls=None, checks=None, **validator_kwargs):
     """
     Validate the docstring.
 
@@ -607,6 +948,11 @@ def validate(obj_name, validator_cls=None, **validator_kwargs):
         'read_csv'.
     validator_cls : Validator, optional
         The Validator class to use. By default, :class:`Validator` will be used.
+    checks : set of str, optional
+        The error codes to check for, as returned by
+        :func:`get_validation_checks`. Only these checks are run, and only
+        the information they need is extracted from the docstring. By default,
+        all checks are run.
     **validator_kwargs
         Keyword arguments to pass to ``validator_cls`` upon initialization.
         Note that ``obj_name`` will be passed as a named argument as well.
@@ -652,16 +998,19 @@ def validate(obj_name, validator_cls=None, **validator_kwargs):
 
     # lineno is only 0 if we have a module docstring in the file, and we are
     # validating that, so we change to 1 for readability of the output
-    ignore_validation_comments = extract_ignore_validation_comments(
-        doc.source_file_name
-    ).get(doc.source_file_def_line or 1, [])
+    ignore_validation_comments = doc.ignore_validation_comments.get(
+        doc.source_file_def_line or 1, []
+    )
 
     errs = []
     if not doc.raw_doc:
-        report_GL08: bool = True
+        # Check if GL08 is to be checked at all, or ignored
+        report_GL08: bool = (
+            checks is None or "GL08" in checks
+        ) and "GL08" not in ignore_validation_comments
         # Check if the object is a class and has a docstring in the constructor
         # Also check if code_obj is defined, as undefined for the AstValidator in validate_docstrings.py.
-        if doc.is_function_or_method and doc.name.endswith(".__init__"):
+        if report_GL08 and doc.is_function_or_method and doc.name.endswith(".__init__"):
             # Import here at runtime to avoid circular import as
             # AstValidator is a subclass of Validator class without `doc_obj` attribute.
             from numpydoc.hooks.validate_docstrings import (
@@ -690,6 +1039,7 @@ def validate(obj_name, validator_cls=None, **validator_kwargs):
                         filename=doc.source_file_name,
                         obj_name=cls_name,
                         ancestry=doc.ancestry[:-1],
+                        source=doc.source,
                     )
                 else:
                     # Ignore edge case: __init__ functions that don't belong to a class.
@@ -705,9 +1055,6 @@ def validate(obj_name, validator_cls=None, **validator_kwargs):
             if cls_doc:
                 report_GL08 = len(cls_doc.parameter_mismatches) > 0
 
-        # Check if GL08 is to be ignored:
-        if "GL08" in ignore_validation_comments:
-            report_GL08 = False
         # Add GL08 error?
         if report_GL08:
             errs.append(error("GL08"))
@@ -721,132 +1068,210 @@ def validate(obj_name, validator_cls=None, **validator_kwargs):
             "examples_errors": "",
         }
 
-    if doc.start_blank_lines not in (0, 1) and "\n" in doc.raw_doc:
-        errs.append(error("GL01"))
-    if doc.end_blank_lines != 1 and "\n" in doc.raw_doc:
-        errs.append(error("GL02"))
-    if doc.double_blank_lines:
-        errs.append(error("GL03"))
-    for line in doc.raw_doc.splitlines():
-        if re.match("^ *\t", line):
-            errs.append(error("GL05", line_with_tabs=line.lstrip()))
+    for codes, check in _CHECKS:
+        if checks is None or not codes.isdisjoint(checks):
+            errs.extend(check(doc))
 
-    unexpected_sections = [
-        section for section in doc.section_titles if section not in ALLOWED_SECTIONS
-    ]
-    for section in unexpected_sections:
-        errs.append(
-            error("GL06", section=section, allowed_sections=", ".join(ALLOWED_SECTIONS))
-        )
-
-    correct_order = [
-        section for section in ALLOWED_SECTIONS if section in doc.section_titles
+    errs = [
+        err
+        for err in errs
+        if err[0] not in ignore_validation_comments
+        and (checks is None or err[0] in checks)
     ]
-    if correct_order != doc.section_titles:
-        errs.append(error("GL07", correct_sections=", ".join(correct_order)))
 
-    if doc.deprecated and not doc.extended_summary.startswith(".. deprecated:: "):
-        errs.append(error("GL09"))
+    return {
+        "type": doc.type,
+        "docstring": doc.clean_doc,
+        "deprecated": doc.deprecated,
+        "file": doc.source_file_name,
+        "file_line": doc.source_file_def_line,
+        "errors": errs,
+    }
 
-    directives_without_two_colons = doc.directives_without_two_colons
-    if directives_without_two_colons:
-        errs.append(error("GL10", directives=directives_without_two_colons))
 
-    if not doc.summary:
-        errs.append(error("SS01"))
-    else:
-        if doc.summary[0].isalpha() and not doc.summary[0].isupper():
-            errs.append(error("SS02"))
-        if doc.summary[-1] != ".":
-            errs.append(error("SS03"))
-        if doc.summary != doc.summary.lstrip():
-            errs.append(error("SS04"))
-        # Heuristic to check for infinitive verbs - shouldn't end in "s"
-        elif (
-            doc.is_function_or_method
-            and len(doc.summary.split(" ")[0]) > 1
-            and doc.summary.split(" ")[0][-1] == "s"
-            and doc.summary.split(" ")[0][-2] != "s"
-        ):
-            errs.append(error("SS05"))
-        if doc.num_summary_lines > 1:
-            errs.append(error("SS06"))
+class _ObjectIndex:
+    """
+    Resolve import paths, importing each module and attribute only once.
 
-    if not doc.is_mod and not doc.extended_summary:
-        errs.append(("ES01", "No extended summary found"))
+    Like :meth:`Validator._load_obj`, the longest importable prefix of a name
+    is taken as its module, and the rest is looked up as attributes.
+    """
 
-    # PR01: Parameters not documented
-    # PR02: Unknown parameters
-    # PR03: Wrong parameters order
-    errs += doc.parameter_mismatches
+    def __init__(self):
+        self._modules = {}  # module name -> module, or None if not importable
+        self._import_errors = {}  # module name -> error raised while importing it
+        self._objects = {}  # (module name, *attribute names) -> object
 
-    for param, kind_desc in doc.doc_all_parameters.items():
-        if not param.startswith("*"):  # Check can ignore var / kwargs
-            if not doc.parameter_type(param):
-                if ":" in param:
-                    errs.append(error("PR10", param_name=param.split(":")[0]))
-                else:
-                    errs.append(error("PR04", param_name=param))
-            else:
-                if doc.parameter_type(param)[-1] == ".":
-                    errs.append(error("PR05", param_name=param))
-                # skip common_type_error checks when the param type is a set of
-                # options
-                if "{" in doc.parameter_type(param):
-                    continue
-                common_type_errors = [
-                    ("integer", "int"),
-                    ("boolean", "bool"),
-                    ("string", "str"),
-                ]
-                for wrong_type, right_type in common_type_errors:
-                    if wrong_type in set(re.split(r"\W", doc.parameter_type(param))):
-                        errs.append(
-                            error(
-                                "PR06",
-                                param_name=param,
-                                right_type=right_type,
-                                wrong_type=wrong_type,
-                            )
-                        )
-        errs.extend(_check_desc(kind_desc[1], "PR07", "PR08", "PR09", param_name=param))
+    def _import(self, module_name):
+        if module_name not in self._modules:
+            try:
+                self._modules[module_name] = importlib.import_module(module_name)
+            except ImportError as e:
+                self._modules[module_name] = None
+                if not (isinstance(e, ModuleNotFoundError) and e.name == module_name):
+                    self._import_errors[module_name] = e
+        return self._modules[module_name]
+
+    def split(self, name):
+        """
+        Split a name into its module name and attribute names.
 
-    if doc.is_function_or_method:
-        if not doc.returns:
-            if doc.method_returns_something:
-                errs.append(error("RT01"))
-        else:
-            if len(doc.returns) == 1 and doc.returns[0].name:
-                errs.append(error("RT02"))
-            for name_or_type, type_, desc in doc.returns:
-                errs.extend(_check_desc(desc, "RT03", "RT04", "RT05"))
+        Parameters
+        ----------
+        name : str
+            Object name to import (e.g. pandas.Series.str.upper).
 
-        if not doc.yields and doc.is_generator_function:
-            errs.append(error("YD01"))
+        Returns
+        -------
+        module_name : str
+            The name of the module defining the object.
+        attributes : tuple of str
+            The attributes to get from the module to reach the object.
+        """
+        parts = name.split(".")
+        for i in range(len(parts), 0, -1):
+            module_name = ".".join(parts[:i])
+            if self._import(module_name) is not None:
+                return module_name, tuple(parts[i:])
+        if parts[0] in self._import_errors:
+            raise self._import_errors[parts[0]]
+        raise ImportError(f'No module can be imported from "{name}"')
+
+    def load(self, name):
+        """
+        Import Python object from its name as string.
 
-    if not doc.is_mod:
-        if not doc.see_also:
-            errs.append(error("SA01"))
-        else:
-            for rel_name, rel_desc in doc.see_also.items():
-                if rel_desc:
-                    if not rel_desc.endswith("."):
-                        errs.append(error("SA02", reference_name=rel_name))
-                    if rel_desc[0].isalpha() and not rel_desc[0].isupper():
-                        errs.append(error("SA03", reference_name=rel_name))
-                else:
-                    errs.append(error("SA04", reference_name=rel_name))
+        Parameters
+        ----------
+        name : str
+            Object name to import (e.g. pandas.Series.str.upper).
 
-        if not doc.examples:
-            errs.append(error("EX01"))
+        Returns
+        -------
+        object
+            Python object that can be a class, method, function...
+        """
+        module_name, attributes = self.split(name)
+        key = (module_name,)
+        obj = self._modules[module_name]
+        for part in attributes:
+            key += (part,)
+            if key not in self._objects:
+                try:
+                    self._objects[key] = getattr(obj, part)
+                except AttributeError:
+                    # A submodule that failed to import is not an attribute of
+                    # its package, report why instead
+                    import_error = self._import_errors.get(".".join(key))
+                    if import_error is None:
+                        raise
+                    raise import_error from None
+            obj = self._objects[key]
+        return obj
 
-    errs = [err for err in errs if err[0] not in ignore_validation_comments]
 
+def _failed_report(exc):
+    """Return the report of an object that could not be loaded or validated."""
     return {
-        "type": doc.type,
-        "docstring": doc.clean_doc,
-        "deprecated": doc.deprecated,
-        "file": doc.source_file_name,
-        "file_line": doc.source_file_def_line,
-        "errors": errs,
+        "type": None,
+        "docstring": None,
+        "deprecated": False,
+        "file": None,
+        "file_line": None,
+        "errors": [(type(exc).__name__, str(exc))],
     }
+
+
+def _validate_module_names(names, checks=None, index=None):
+    """Validate the objects of `names`, yielding ``(name, report)``."""
+    index = index or _ObjectIndex()
+    for name in names:
+        # Loading and validating an object runs arbitrary code, whatever it
+        # raises is reported as a failed validation of that object only
+        try:
+            report = validate(get_doc_object(index.load(name)), checks=checks)
+        except Exception as e:  # noqa: BLE001
+            report = _failed_report(e)
+        yield name, report
+
+
+def _validate_module_names_list(names, checks=None):
+    return list(_validate_module_names(names, checks=checks))
+
+
+def validate_many(names, checks=None, jobs=1):
+    """
+    Validate the docstrings of many objects.
+
+    Each module is imported once per process and the attributes shared by
+    several names (e.g. a class with many methods) are only looked up once.
+
+    Parameters
+    ----------
+    names : iterable of str
+        The names of the objects whose docstrings will be evaluated, as
+        accepted by :func:`validate`.
+    checks : set of str, optional
+        The error codes to check for, as returned by
+        :func:`get_validation_checks`. By default, all checks are run.
+    jobs : int, optional
+        The number of worker processes to validate modules in parallel. By
+        default, the objects are validated in the current process.
+
+    Yields
+    ------
+    name : str
+        The name of the object.
+    report : dict
+        The validation report, as returned by :func:`validate`.
+
+    Notes
+    -----
+    Results are yielded in the order of `names`. With a single job, `names` is
+    consumed lazily and each result is yielded as soon as it is available.
+    Otherwise, all the names are read first and grouped by their parent (the
+    dotted prefix before their last part, e.g. a module or a class), and each
+    group is imported and validated in a worker process. A result is then
+    yielded once its group has been validated.
+
+    An object that cannot be imported or validated does not stop the others
+    from being validated. Its report has no type or docstring, and a single
+    error whose code is the name of the exception raised, e.g.
+    ``("ImportError", "No module named 'foo'")``.
+
+    Examples
+    --------
+    >>> for name, report in validate_many(
+    ...     ["numpydoc.validate.validate", "numpydoc.validate.error"],
+    ...     checks={"GL08"},
+    ... ):
+    ...     print(name, report["errors"])
+    numpydoc.validate.validate []
+    numpydoc.validate.error []
+    """
+    if jobs is None or jobs <= 1:
+        yield from _validate_module_names(names, checks, _ObjectIndex())
+        return
+
+    # Names are grouped by their parent, without importing anything here, and
+    # each group is imported and validated in a worker
+    groups = {}
+    positions = []
+    for name in names:
+        parent = name.rpartition(".")[0]
+        group = groups.setdefault(parent, [])
+        positions.append((parent, len(group)))
+        group.append(name)
+    if not groups:
+        return
+
+    # Only imported when needed, to keep the start up of the CLI fast
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(groups))) as executor:
+        futures = {
+            parent: executor.submit(_validate_module_names_list, group, checks)
+            for parent, group in groups.items()
+        }
+        for parent, position in positions:
+            yield futures[parent].result()[position]
@@ -1,3 +1,4 @@
+import functools
 import re
 
 # When sphinx (including the napoleon extension) parses the parameters
@@ -191,3 +192,67 @@ def make_xref(param_type, xref_aliases, xref_ignore):
 
     # Common splitter tokens
     return _split_and_apply_re(param_type, TEXT_SPLIT_RE)
+
+
+class XrefResolver:
+    """Memoized :func:`make_xref` bound to one cross-referencing configuration.
+
+    API docs repeat a few hundred distinct type strings across all of their
+    parameters, so the resolved markup is cached by type string.
+
+    Parameters
+    ----------
+    xref_aliases : dict
+        Mapping used to resolve common abbreviations and aliases
+        to fully qualified names that can be cross-referenced.
+    xref_ignore : set or "all"
+        Words not to cross-reference, or 'all' to ignore all unrecognized
+        terms. See :func:`make_xref`.
+    maxsize : int, optional
+        The maximum number of type strings to keep in the cache.
+
+    Examples
+    --------
+    >>> resolve = XrefResolver({"ndarray": "numpy.ndarray"}, set())
+    >>> resolve("ndarray")
+    ':obj:`ndarray <numpy.ndarray>`'
+    >>> resolve("ndarray")
+    ':obj:`ndarray <numpy.ndarray>`'
+    >>> resolve.cache_info()
+    CacheInfo(hits=1, misses=1, maxsize=4096, currsize=1)
+    """
+
+    def __init__(self, xref_aliases, xref_ignore, maxsize=4096):
+        # Take a snapshot, so that the cached results stay valid
+        self.xref_aliases = dict(xref_aliases)
+        if isinstance(xref_ignore, str):
+            self.xref_ignore = xref_ignore
+        else:
+            self.xref_ignore = frozenset(xref_ignore)
+        self.maxsize = maxsize
+        self._resolve = functools.lru_cache(maxsize=maxsize)(self._make_xref)
+
+    def _make_xref(self, param_type):
+        return make_xref(param_type, self.xref_aliases, self.xref_ignore)
+
+    def __call__(self, param_type):
+        """Apply the appropriate sphinx role(s) to `param_type`."""
+        return self._resolve(param_type)
+
+    def __reduce__(self):
+        # Sphinx pickles the config into the environment; drop the cache.
+        return type(self), (self.xref_aliases, self.xref_ignore, self.maxsize)
+
+    def cache_info(self):
+        """Return the hits, misses and size of the cache.
+
+        Returns
+        -------
+        functools._CacheInfo
+            The statistics, as returned by ``functools.lru_cache``.
+        """
+        return self._resolve.cache_info()
+
+    def cache_clear(self):
+        """Clear the cache and its statistics."""
+        self._resolve.cache_clear()